@@ -2,20 +2,36 @@
 """
 astraea_coc — CoC PDF → structured text/CSV parsers
 """
-from .io_extract import extract_pdf_text, split_pages_by_markers
-from .meta import parse_1a_metadata, find_first
-from .slicer import slice_section_lines
-from .parsers import parse_triple_table, parse_numbered_yesno, parse_numbered_dual_tokens
-from .narratives import extract_narrative_after_limit
-from .build_wide import build_wide, col_order_extended
-from .utils import ts, unique_path, save_text_unique, save_csv_unique, norm_token, scrub_boilerplate
+from __future__ import annotations
 
-__all__ = [
-    "extract_pdf_text", "split_pages_by_markers",
-    "parse_1a_metadata", "find_first",
-    "slice_section_lines",
-    "parse_triple_table", "parse_numbered_yesno", "parse_numbered_dual_tokens",
-    "extract_narrative_after_limit",
-    "build_wide", "col_order_extended",
-    "ts", "unique_path", "save_text_unique", "save_csv_unique", "norm_token", "scrub_boilerplate",
-]
+# Names resolve on first access (PEP 562), so importing the package does not
+# import pandas or the PDF backends.
+_EXPORTS = {
+    "io_extract": ("extract_pdf_text", "extract_pages", "split_pages_by_markers"),
+    "pages": ("Pages",),
+    "meta": ("parse_1a_metadata", "find_first"),
+    "slicer": ("slice_section_lines",),
+    "parsers": ("parse_triple_table", "parse_numbered_yesno", "parse_numbered_dual_tokens"),
+    "narratives": ("extract_narrative_after_limit",),
+    "build_wide": ("build_wide", "build_wide_row", "wide_schema", "col_order_extended"),
+    "schema": ("WideSchema", "WideRow", "RowAccumulator"),
+    "records": ("YesNoRow", "TripleRow", "DualRow", "PhaRow", "BedRow", "as_records"),
+    "utils": ("ts", "unique_path", "save_text_unique", "save_csv_unique", "norm_token", "scrub_boilerplate"),
+}
+_LAZY = {name: mod for mod, names in _EXPORTS.items() for name in names}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+
+def __getattr__(name: str):
+    mod = _LAZY.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
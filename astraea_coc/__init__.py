@@ -1 +1,71 @@
-from .pipeline import run_all
+from __future__ import annotations
+
+# Importing the package is cheap: submodules load on first attribute access
+# (PEP 562), and pandas / the PDF backends are only imported by the code
+# paths that use them. Worker processes and one-off runs pay for what they
+# touch, not for the whole package.
+
+# Upper bound, in seconds, for ``import astraea_coc.pipeline`` in a fresh
+# interpreter; see ``import_cost``.
+IMPORT_BUDGET_S = 0.5
+
+# Modules that must not be imported just by importing the package.
+HEAVY_MODULES = ("pandas", "numpy", "pdfplumber", "PyPDF2", "pypdf", "fitz", "pypdfium2",
+                 "pyarrow", "xlsxwriter", "openpyxl")
+
+_LAZY = {
+    "run_all": "pipeline",
+}
+
+
+def _profile_regexes() -> None:
+    # before any submodule compiles its patterns; see regex_profile.py
+    import os
+    if os.environ.get("ASTRAEA_REGEX_PROFILE"):
+        from .regex_profile import install
+        install()
+
+
+_profile_regexes()
+
+
+def __getattr__(name: str):
+    mod = _LAZY.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+def import_cost(module: str = f"{__name__}.pipeline") -> tuple[float, list[str]]:
+    """
+    Import ``module`` in a fresh interpreter; return the wall time it took,
+    in seconds, and which ``HEAVY_MODULES`` it pulled in.
+    ``tests/test_import_budget.py`` holds the first to ``IMPORT_BUDGET_S``
+    and expects the second to be empty.
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "dt = time.perf_counter() - t\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps([dt, heavy]))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    out = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    dt, heavy = json.loads(out.strip().splitlines()[-1])
+    return dt, heavy
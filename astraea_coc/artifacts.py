@@ -0,0 +1,148 @@
+# artifacts.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+_SUFFIX = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+MANIFEST_NAME = "artifacts.jsonl"
+
+
+def _compressor(compression: str):
+    if compression == "none":
+        return lambda data: data
+    if compression == "gzip":
+        import gzip
+        return lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=10).compress
+    raise ValueError(f"Unknown artifact compression {compression!r}. Known: {list(COMPRESSIONS)}")
+
+
+# one store per (root, compression) and process, so pool tasks share a writer thread
+_SHARED: dict[tuple[str, str, bool], "ArtifactStore"] = {}
+
+
+def _shared_store(root: str, compression: str, background: bool) -> "ArtifactStore":
+    key = (root, compression, background)
+    store = _SHARED.get(key)
+    if store is None or store._pid != os.getpid():
+        store = _SHARED[key] = ArtifactStore(root, compression, background)
+    return store
+
+
+class ArtifactStore:
+    """
+    Debug artifacts (page text dumps, per-PDF wide CSVs) under one ``root``.
+
+    Names are content addressed, ``<stem>__<kind>.<sha12>.<ext>[.gz|.zst]``,
+    so rewriting the same content is a no-op and concurrent writers cannot
+    collide. Each write is appended to ``artifacts.jsonl`` in ``root``.
+
+    With ``background`` the hashing happens in ``put`` and the compression
+    and file I/O on a writer thread; ``flush``/``close`` wait for it, and it
+    is drained when the process exits (pool workers included).
+    """
+
+    def __init__(self, root: Path, compression: str = "none", background: bool = True):
+        self.root = Path(root)
+        self.compression = compression
+        self.background = background
+        self._compress = _compressor(compression)
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def __reduce__(self):
+        return _shared_store, (str(self.root), self.compression, self.background)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def path_for(self, stem: str, kind: str, ext: str, digest: str) -> Path:
+        return self.root / f"{stem}__{kind}.{digest[:12]}.{ext}{_SUFFIX[self.compression]}"
+
+    def put(self, source: Path, kind: str, ext: str, data: str | bytes) -> Path:
+        """Store ``data`` for ``source`` (the PDF) and return its final path."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(Path(source).stem, kind, ext, digest)
+        job = (Path(source).name, kind, path, digest, data)
+        if not self.background:
+            self._write(*job)
+            return path
+        if self._thread is None or self._pid != os.getpid():
+            self._start()
+        self._queue.put(job)
+        return path
+
+    def _start(self) -> None:
+        from multiprocessing import util
+        self._pid = os.getpid()
+        self._queue = queue.Queue(maxsize=64)
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+        # runs before interpreter exit in the parent and in pool workers alike
+        util.Finalize(self, self.close, exitpriority=10)
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception as e:
+                print(f"[info] artifact write failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, source: str, kind: str, path: Path, digest: str, data: bytes) -> None:
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(self._compress(data))
+            os.replace(tmp, path)
+        entry = {
+            "source": source, "kind": kind, "file": path.name, "sha256": digest,
+            "bytes": len(data), "compression": self.compression, "time": time.time(),
+        }
+        # one short O_APPEND write per line, so workers can share the manifest
+        with open(self.root / MANIFEST_NAME, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def flush(self) -> None:
+        """Wait until every queued artifact is on disk."""
+        if self._queue is not None and self._pid == os.getpid():
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = self._queue = None
+
+    def index(self) -> dict[tuple[str, str], dict]:
+        """Latest manifest entry per ``(source pdf name, kind)``."""
+        out: dict[tuple[str, str], dict] = {}
+        try:
+            with open(self.root / MANIFEST_NAME, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        e = json.loads(line)
+                    except ValueError:
+                        continue
+                    out[(e["source"], e["kind"])] = e
+        except FileNotFoundError:
+            pass
+        return out
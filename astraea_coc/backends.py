@@ -0,0 +1,150 @@
+# backends.py
+from __future__ import annotations
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Union
+
+# What a backend opens: a file, or a PDF's bytes already read into memory
+PdfSource = Union[Path, bytes]
+
+
+class OpenDoc:
+    """An opened PDF: page count plus 0-based per-page text access."""
+
+    def __init__(self, n_pages: int, page_text: Callable[[int], str], close: Callable[[], None]):
+        self.n_pages = n_pages
+        self.page_text = page_text
+        self.close = close
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass(frozen=True)
+class Backend:
+    name: str                          # recorded as `engine`
+    module: str                        # import name, used for availability + version
+    cost: int                          # relative cost; auto-selection tries cheap first
+    open: Callable[[PdfSource], OpenDoc]
+    fallback: str | None = None        # backend to try if this one raises
+
+    def available(self) -> bool:
+        from importlib.util import find_spec
+        return find_spec(self.module) is not None
+
+    def version(self) -> str:
+        return _dist_version({"fitz": "pymupdf"}.get(self.module, self.module))
+
+
+@lru_cache(maxsize=None)
+def _dist_version(dist: str) -> str:
+    # metadata lookups scan sys.path; document_key asks once per PDF
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version(dist)
+    except PackageNotFoundError:
+        return "?"
+
+
+def _binary(pdf: PdfSource):
+    """A readable binary file over ``pdf``, on disk or in memory."""
+    return io.BytesIO(pdf) if isinstance(pdf, bytes) else open(pdf, "rb")
+
+
+def _open_pdfplumber(pdf_path: PdfSource, simple: bool = False) -> OpenDoc:
+    import pdfplumber
+    pdf = pdfplumber.open(io.BytesIO(pdf_path) if isinstance(pdf_path, bytes) else pdf_path)
+
+    def text(i: int) -> str:
+        pg = pdf.pages[i]
+        if simple and hasattr(pg, "extract_text_simple"):
+            # no word clustering / layout pass, just char runs in reading order
+            return pg.extract_text_simple() or ""
+        return pg.extract_text() or ""
+
+    return OpenDoc(len(pdf.pages), text, pdf.close)
+
+
+def _open_pdfplumber_simple(pdf_path: PdfSource) -> OpenDoc:
+    return _open_pdfplumber(pdf_path, simple=True)
+
+
+def _open_pypdf2(pdf_path: PdfSource) -> OpenDoc:
+    import PyPDF2
+    f = _binary(pdf_path)
+    r = PyPDF2.PdfReader(f)
+    return OpenDoc(len(r.pages), lambda i: r.pages[i].extract_text() or "", f.close)
+
+
+def _open_pypdf(pdf_path: PdfSource) -> OpenDoc:
+    import pypdf
+    f = _binary(pdf_path)
+    r = pypdf.PdfReader(f)
+    return OpenDoc(len(r.pages), lambda i: r.pages[i].extract_text() or "", f.close)
+
+
+def _open_pymupdf(pdf_path: PdfSource) -> OpenDoc:
+    import fitz
+    doc = fitz.open(stream=pdf_path, filetype="pdf") if isinstance(pdf_path, bytes) else fitz.open(pdf_path)
+    return OpenDoc(doc.page_count, lambda i: doc[i].get_text() or "", doc.close)
+
+
+def _open_pypdfium2(pdf_path: PdfSource) -> OpenDoc:
+    import pypdfium2 as pdfium
+    doc = pdfium.PdfDocument(pdf_path)  # takes bytes as well as a path
+
+    def text(i: int) -> str:
+        page = doc[i]
+        tp = page.get_textpage()
+        try:
+            return tp.get_text_range() or ""
+        finally:
+            tp.close()
+            page.close()
+
+    return OpenDoc(len(doc), text, doc.close)
+
+
+BACKENDS: dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend) -> Backend:
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+register_backend(Backend("pdfplumber", "pdfplumber", cost=10, open=_open_pdfplumber, fallback="PyPDF2"))
+register_backend(Backend("pdfplumber_simple", "pdfplumber", cost=5, open=_open_pdfplumber_simple, fallback="PyPDF2"))
+register_backend(Backend("PyPDF2", "PyPDF2", cost=3, open=_open_pypdf2))
+register_backend(Backend("pypdf", "pypdf", cost=3, open=_open_pypdf, fallback="PyPDF2"))
+register_backend(Backend("pypdfium2", "pypdfium2", cost=1, open=_open_pypdfium2, fallback="PyPDF2"))
+register_backend(Backend("pymupdf", "fitz", cost=1, open=_open_pymupdf, fallback="PyPDF2"))
+
+DEFAULT_BACKEND = "pdfplumber"
+
+
+def get_backend(name: str) -> Backend:
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown extraction backend {name!r}. Known: {sorted(BACKENDS)}") from None
+
+
+def available_backends() -> list[Backend]:
+    """Installed backends, cheapest first."""
+    return sorted((b for b in BACKENDS.values() if b.available()), key=lambda b: b.cost)
+
+
+def auto_ladder(target: str = DEFAULT_BACKEND) -> list[Backend]:
+    """
+    Backends auto-selection tries, cheapest first, ending with ``target``.
+    Only backends cheaper than the target are tried before it.
+    """
+    top = get_backend(target)
+    cheap = [b for b in available_backends() if b.cost < top.cost]
+    return cheap + [top]
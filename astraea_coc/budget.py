@@ -0,0 +1,92 @@
+# budget.py
+"""
+Wall-clock budget per parsed section.
+
+A garbled document can make a stitched-block regex backtrack for minutes.
+``SectionBudget.call`` arms a one-shot ``ITIMER_REAL`` timer around one
+section; SIGALRM raises ``SectionTimeout`` in the middle of the work (the
+regex engine checks for signals while it matches), and the caller falls
+back to the section's empty result.
+
+Signals only reach the main thread, so the budget is enforced there (pool
+workers run their tasks on it) and on platforms with ``setitimer``;
+elsewhere sections run unbounded. Page extraction a section triggers is
+not charged to it: ``paused()`` stops the clock around it.
+"""
+from __future__ import annotations
+import signal
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_active: "SectionBudget | None" = None   # budget whose timer is armed right now
+
+
+class SectionTimeout(BaseException):
+    # BaseException, like KeyboardInterrupt: a parser's ``except Exception``
+    # must not swallow it and carry on past the budget
+    pass
+
+
+def _alarm(signum, frame):
+    raise SectionTimeout()
+
+
+def enforceable() -> bool:
+    """Whether a budget can interrupt work on this thread."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+class SectionBudget:
+    """
+    ``seconds`` per section for one document; remembers the sections that
+    ran out, in order.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = float(seconds)
+        self.timed_out: list[str] = []
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """``fn()``, raising ``SectionTimeout`` once it has run ``seconds``."""
+        global _active
+        if _active is not None or not enforceable():
+            return fn()  # nested section, or no timer here: the outer budget (if any) applies
+        previous = signal.signal(signal.SIGALRM, _alarm)
+        _active = self
+        try:
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+            return fn()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            _active = None
+            signal.signal(signal.SIGALRM, previous)
+
+    def expired(self, key: str, default: T) -> T:
+        """Note ``key`` as timed out and return its ``default``."""
+        self.timed_out.append(key)
+        print(f"[info] {key}: over the {self.seconds:g}s section budget; left empty")
+        return default
+
+
+def limited(budget: SectionBudget | None, fn: Callable[[], T]) -> Callable[[], T]:
+    """``fn`` run under ``budget``; ``fn`` itself without one."""
+    if budget is None:
+        return fn
+    return lambda: budget.call(fn)
+
+
+@contextmanager
+def paused() -> Iterator[None]:
+    """Stop the running section's clock for the duration of the block."""
+    if _active is None:
+        yield
+        return
+    remaining, _ = signal.setitimer(signal.ITIMER_REAL, 0)
+    try:
+        yield
+    finally:
+        if _active is not None and remaining > 0:
+            signal.setitimer(signal.ITIMER_REAL, remaining)
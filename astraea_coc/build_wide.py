@@ -1,29 +1,87 @@
 from __future__ import annotations
 
-import pandas as pd
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from .utils import norm_token
+from .patterns import compile_re
+from .schema import WideRow, WideSchema
+from .records import DualRow, PhaRow, TripleRow, YesNoRow, as_records, first_by_index
 
 import re
 
-BOOL_LIKE = re.compile(r"^(Yes|No|Nonexistent)$", re.IGNORECASE)
-
-
-def _wide_map(df, section_prefix: str, max_index: int):
-    if df is None or df.empty:
-        return {f"{section_prefix}_{i}": "" for i in range(1, max_index + 1)}
-    tmp = df[["index", "value"]].copy() if "value" in df.columns else df[["index"]].copy()
-    if "value" in tmp.columns:
-        tmp["value"] = tmp["value"].apply(norm_token)
-        d = {int(k): v for k, v in zip(tmp["index"], tmp["value"])}
-    else:
-        d = {}
+if TYPE_CHECKING:
+    import pandas as pd
+
+BOOL_LIKE = compile_re(r"^(Yes|No|Nonexistent)$", re.IGNORECASE)
+
+# Wide columns filled from narr_* free text (multi-KB cells), in column order.
+NARRATIVE_COLS = (
+    "1b_1a", "1b_2", "1b_3", "1b_4",
+    "1c_4a", "1c_4b", "1c_5a", "1c_5b", "1c_5d", "1c_5e", "1c_5f", "1c_6a",
+    "1c_7a", "1c_7d_2",
+    "1d_2a", "1d_3", "1d_6a", "1d_7", "1d_7a", "1d_8", "1d_8a", "1d_8b",
+    "1d_9a", "1d_9c", "1d_9d", "1d_10", "1d_10b", "1d_10c",
+    "1e_2b", "1e_3", "1e_4", "1e_5a", "1e_5b", "1e_5c", "1e_5d",
+    "2a_4", "2a_5a", "2b_3",
+)
+
+# Wide columns that hold a Yes/No/Nonexistent answer: the triple, numbered
+# yes/no and dual-token tables, plus the single yes/no questions.
+ANSWER_COLS = (
+    *(f"1b_1_{i}_{k}" for i in range(1, 34) for k in ("meetings", "voted", "ces")),
+    *(f"1c_1_{i}" for i in range(1, 18)),
+    *(f"1c_2_{i}" for i in range(1, 5)),
+    *(f"1c_3_{i}" for i in range(1, 6)),
+    *(f"1c_4_{i}" for i in range(1, 5)),
+    *(f"1c_4c_{i}_{k}" for i in range(1, 10) for k in ("mou", "oth")),
+    *(f"1c_5_{i}" for i in range(1, 4)),
+    *(f"1c_5c_{i}_{k}" for i in range(1, 7) for k in ("proj", "ces")),
+    *(f"1c_6_{i}" for i in range(1, 4)),
+    *(f"1c_7b_{i}" for i in range(1, 5)),
+    *(f"1c_7c_{i}" for i in range(1, 8)),
+    "1c_7d_1", "1c_7e",
+    *(f"1d_1_{i}" for i in range(1, 5)),
+    *(f"1d_4_{i}_{k}" for i in range(1, 4) for k in ("policymakers", "prevent_crim")),
+    *(f"1d_6_{i}" for i in range(1, 7)),
+    "1d_9_1",
+    *(f"1d_9b_{i}" for i in range(1, 12)),
+    *(f"1e_2_{i}" for i in range(1, 7)),
+    *(f"1e_5_{i}" for i in range(1, 4)),
+)
+
+
+def _wide_map(rows, section_prefix: str, max_index: int):
+    d = {r.index: norm_token(r.value) for r in rows or ()}
     out = {}
     for i in range(1, max_index + 1):
         out[f"{section_prefix}_{i}"] = d.get(i, "")
     return out
 
 
-def build_wide(
+def build_wide(**kwargs) -> pd.DataFrame:
+    """One-row DataFrame of ``wide_dict(**kwargs)`` (columns in build order)."""
+    import pandas as pd
+    return pd.DataFrame([wide_dict(**kwargs)])
+
+
+def build_wide_row(**kwargs) -> WideRow:
+    """``wide_dict(**kwargs)`` packed into ``wide_schema()`` slot order."""
+    return wide_schema().pack(wide_dict(**kwargs))
+
+
+@lru_cache(maxsize=None)
+def wide_schema() -> WideSchema:
+    """
+    col_order_extended(), then the columns build_wide always emits beyond it
+    (e.g. 1c_6_*), in the order it emits them.
+    """
+    base = col_order_extended()
+    known = set(base)
+    return WideSchema(base + [c for c in wide_dict(meta_vals={}) if c not in known])
+
+
+def wide_dict(
     *,
     meta_vals: dict[str, str],
 
@@ -49,7 +107,7 @@ def build_wide(
 
     # Everything else (val_*/narr_*) comes in here automatically
     **scalars,
-) -> pd.DataFrame:
+) -> dict[str, object]:
     """
     Build the wide 1A/1B/1C/1D/1E row.
 
@@ -59,7 +117,22 @@ def build_wide(
 
     Only add new explicit parameters here when introducing a NEW DataFrame
     that needs special shaping.
+
+    The df_* tables may be DataFrames or the lean record lists the parsers
+    return with ``lean=True``; either way they are read as records.
     """
+    df_1b1 = as_records(df_1b1, TripleRow)
+    df_1c1, df_1c2, df_1c3, df_1c4_basic, df_1c5_basic, df_1c6 = (
+        as_records(df, YesNoRow)
+        for df in (df_1c1, df_1c2, df_1c3, df_1c4_basic, df_1c5_basic, df_1c6)
+    )
+    df_1c7b, df_1c7c, df_1d1, df_1d6, df_1d9b = (
+        as_records(df, YesNoRow) for df in (df_1c7b, df_1c7c, df_1d1, df_1d6, df_1d9b)
+    )
+    df_1c4c = as_records(df_1c4c, DualRow, ("index", "label", "mou", "oth"))
+    df_1c5c = as_records(df_1c5c, DualRow, ("index", "label", "proj", "ces"))
+    df_1d4 = as_records(df_1d4, DualRow, ("index", "label", "engaged", "implemented"))
+    df_1c7 = as_records(df_1c7, PhaRow)
 
     def S(key: str, default: str = "") -> str:
         v = scalars.get(key, default)
@@ -75,24 +148,21 @@ def build_wide(
 
     # 1B-1 triplets (1..33)
     MAX_ORG_INDEX = 33
-    if df_1b1 is not None and not df_1b1.empty:
-        df_1b1 = df_1b1.copy()
-        for c in ("meetings", "voted", "ces"):
-            if c in df_1b1.columns:
-                df_1b1[c] = df_1b1[c].apply(norm_token)
-        lookup_1b1 = (
-            df_1b1
-            .set_index("org_type_index")[["meetings", "voted", "ces"]]
-            .to_dict(orient="index")
-        )
-    else:
-        lookup_1b1 = {}
+    lookup_1b1 = {}
+    for r in df_1b1 or ():
+        if r.org_type_index in lookup_1b1:
+            # one row per organization type; a repeat means 1B-1 was mis-sliced
+            raise ValueError(
+                f"df_1b1: duplicate org_type_index {r.org_type_index} "
+                f"({lookup_1b1[r.org_type_index].org_type!r} and {r.org_type!r})"
+            )
+        lookup_1b1[r.org_type_index] = r
 
     for i in range(1, MAX_ORG_INDEX + 1):
-        rec = lookup_1b1.get(i, {})
-        wide[f"1b_1_{i}_meetings"] = rec.get("meetings", "")
-        wide[f"1b_1_{i}_voted"]    = rec.get("voted", "")
-        wide[f"1b_1_{i}_ces"]      = rec.get("ces", "")
+        rec = lookup_1b1.get(i)
+        wide[f"1b_1_{i}_meetings"] = norm_token(rec.meetings) if rec else ""
+        wide[f"1b_1_{i}_voted"]    = norm_token(rec.voted) if rec else ""
+        wide[f"1b_1_{i}_ces"]      = norm_token(rec.ces) if rec else ""
 
     # 1B text extras
     wide["1b_1a"] = S("narr_1b1a")
@@ -109,59 +179,39 @@ def build_wide(
         wide.update(_wide_map(df_1c3, "1c_3", 5))
 
     # 1C-4 basic yes/no
-    if df_1c4_basic is not None and not df_1c4_basic.empty:
-        df_1c4_basic = df_1c4_basic[df_1c4_basic["index"].between(1, 4)]
-        df_1c4_basic = df_1c4_basic.drop_duplicates(subset="index", keep="first")
-        d4 = {int(i): v for i, v in zip(df_1c4_basic["index"], df_1c4_basic["value"])}
-    else:
-        d4 = {}
+    d4 = first_by_index(df_1c4_basic, 1, 4)
     for i in range(1, 5):
-        wide[f"1c_4_{i}"] = d4.get(i, "")
+        wide[f"1c_4_{i}"] = d4[i].value if i in d4 else ""
     wide["1c_4a"] = S("narr_1c4a")
     wide["1c_4b"] = S("narr_1c4b")
 
     # 1C-4c dual tokens
-    if df_1c4c is not None and not df_1c4c.empty:
-        for i in range(1, 10):
-            row = df_1c4c[df_1c4c["index"] == i]
-            wide[f"1c_4c_{i}_mou"] = row["mou"].iloc[0] if not row.empty else ""
-            wide[f"1c_4c_{i}_oth"] = row["oth"].iloc[0] if not row.empty else ""
-    else:
-        for i in range(1, 10):
-            wide[f"1c_4c_{i}_mou"] = ""
-            wide[f"1c_4c_{i}_oth"] = ""
+    d4c = first_by_index(df_1c4c)
+    for i in range(1, 10):
+        row = d4c.get(i)
+        wide[f"1c_4c_{i}_mou"] = row.first if row else ""
+        wide[f"1c_4c_{i}_oth"] = row.second if row else ""
 
     # 1C-5 basic yes/no
-    if df_1c5_basic is not None and not df_1c5_basic.empty:
-        d5 = {int(i): v for i, v in zip(df_1c5_basic["index"], df_1c5_basic["value"])}
-    else:
-        d5 = {}
+    d5 = {r.index: r.value for r in df_1c5_basic or ()}
     for i in range(1, 4):
         wide[f"1c_5_{i}"] = d5.get(i, "")
     wide["1c_5a"] = S("narr_1c5a")
     wide["1c_5b"] = S("narr_1c5b")
 
     # 1C-5c dual tokens
-    if df_1c5c is not None and not df_1c5c.empty:
-        for i in range(1, 7):
-            row = df_1c5c[df_1c5c["index"] == i]
-            wide[f"1c_5c_{i}_proj"] = row["proj"].iloc[0] if not row.empty else ""
-            wide[f"1c_5c_{i}_ces"]  = row["ces"].iloc[0]  if not row.empty else ""
-    else:
-        for i in range(1, 7):
-            wide[f"1c_5c_{i}_proj"] = ""
-            wide[f"1c_5c_{i}_ces"]  = ""
+    d5c = first_by_index(df_1c5c)
+    for i in range(1, 7):
+        row = d5c.get(i)
+        wide[f"1c_5c_{i}_proj"] = row.first if row else ""
+        wide[f"1c_5c_{i}_ces"]  = row.second if row else ""
 
     wide["1c_5d"] = S("narr_1c5d")
     wide["1c_5e"] = S("narr_5e")
     wide["1c_5f"] = S("narr_5f")
 
     # 1C-6 yes/no
-    if df_1c6 is not None and not df_1c6.empty:
-        wide.update(_wide_map(df_1c6, "1c_6", 3))
-    else:
-        for i in range(1, 4):
-            wide[f"1c_6_{i}"] = ""
+    wide.update(_wide_map(df_1c6, "1c_6", 3))
 
     # 1C-6a + 1C-7a narratives
     wide["1c_6a"] = S("narr_1c6a")
@@ -196,15 +246,11 @@ def build_wide(
         wide[f"1c_7_ph_limit_hhm_{i}"]  = ""
         wide[f"1c_7_psh_{i}"]           = ""
 
-    if df_1c7 is not None and not df_1c7.empty:
-        df_1c7 = df_1c7.reset_index(drop=True)
-        for i in range(min(max_pha, len(df_1c7))):
-            row = df_1c7.iloc[i]
-            j = i + 1
-            wide[f"1c_7_pha_name_{j}"]     = row.get("pha_name", "")
-            wide[f"1c_7_ph_hhm_{j}"]       = row.get("ph_hhm", "")
-            wide[f"1c_7_ph_limit_hhm_{j}"] = row.get("ph_limit_hhm", "")
-            wide[f"1c_7_psh_{j}"]          = row.get("psh", "")
+    for j, row in enumerate((df_1c7 or [])[:max_pha], start=1):
+        wide[f"1c_7_pha_name_{j}"]     = row.pha_name
+        wide[f"1c_7_ph_hhm_{j}"]       = row.ph_hhm
+        wide[f"1c_7_ph_limit_hhm_{j}"] = row.ph_limit_hhm
+        wide[f"1c_7_psh_{j}"]          = row.psh
 
     # 1D-1 – public systems (1..4)
     wide.update(_wide_map(df_1d1, "1d_1", 4))
@@ -219,17 +265,11 @@ def build_wide(
     wide["1d_3"]  = S("narr_1d3")
 
     # 1D-4 – Strategies to Prevent Criminalization of Homelessness
-    if df_1d4 is not None and not df_1d4.empty:
-        df_1d4 = df_1d4.copy()
-        df_1d4 = df_1d4[df_1d4["index"].between(1, 3)]
-        for i in range(1, 4):
-            row = df_1d4[df_1d4["index"] == i]
-            wide[f"1d_4_{i}_policymakers"] = row["engaged"].iloc[0] if not row.empty else ""
-            wide[f"1d_4_{i}_prevent_crim"] = row["implemented"].iloc[0] if not row.empty else ""
-    else:
-        for i in range(1, 4):
-            wide[f"1d_4_{i}_policymakers"] = ""
-            wide[f"1d_4_{i}_prevent_crim"] = ""
+    d1d4 = first_by_index(df_1d4, 1, 3)
+    for i in range(1, 4):
+        row = d1d4.get(i)
+        wide[f"1d_4_{i}_policymakers"] = row.first if row else ""
+        wide[f"1d_4_{i}_prevent_crim"] = row.second if row else ""
 
     # 1D-5 – Rapid Rehousing beds (HIC or HMIS)
     wide["1d_5_hmis"] = S("val_1d5_source")
@@ -237,11 +277,7 @@ def build_wide(
     wide["1d_5_2024"] = S("val_1d5_2024")
 
     # 1D-6 – Mainstream benefits yes/no (1..6)
-    if df_1d6 is not None and not df_1d6.empty:
-        wide.update(_wide_map(df_1d6, "1d_6", 6))
-    else:
-        for i in range(1, 7):
-            wide[f"1d_6_{i}"] = ""
+    wide.update(_wide_map(df_1d6, "1d_6", 6))
 
     # 1D narratives
     wide["1d_6a"] = S("narr_1d6a")
@@ -363,7 +399,7 @@ def build_wide(
     ]:
         wide.setdefault(key, "")
 
-    return pd.DataFrame([wide])
+    return wide
 
 
 def col_order_extended() -> list[str]:
@@ -0,0 +1,297 @@
+# corpus.py
+"""
+Pack the extracted page text of many PDFs into one file and grep it.
+
+    python -m astraea_coc.corpus pack APPS_DIR -o corpus.pack
+    python -m astraea_coc.corpus search corpus.pack -e '^\\s*1D[-–]9b\\.' --first --missing
+    python -m astraea_coc.corpus search corpus.pack --spec df_1d9b
+
+The pack is the UTF-8 page texts back to back; ``corpus.pack.json`` holds
+the (doc, page) -> (offset, length) index. Searches memory-map the pack and
+split the documents over worker processes, so trying an anchor change
+against every application takes well under a second.
+"""
+from __future__ import annotations
+import argparse
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Sequence
+
+from .backends import BACKENDS, DEFAULT_BACKEND
+from .patterns import rx
+
+PACK_VERSION = 1
+
+
+class Hit(NamedTuple):
+    doc: str       # PDF file name
+    page: int      # 1-based
+    line: int      # 1-based, within the page
+    alt: int       # which of the searched patterns matched
+    text: str      # the matched line, stripped
+
+
+def index_path(pack: Path) -> Path:
+    return pack.with_name(pack.name + ".json")
+
+
+# ---- packing ----
+
+def _extract_doc(pdf: Path, cache, engine: str) -> tuple[list[str], str]:
+    from .io_extract import extract_pages
+    with extract_pages(pdf, cache=cache, page_jobs=1, engine=engine) as pages:
+        return pages.texts(), pages.engine
+
+
+def _extracted(pdfs: Sequence[Path], cache, engine: str, jobs: int):
+    """``(pdf, texts, engine)`` per PDF in input order; failures are reported and skipped."""
+    def report(pdf, e):
+        print(f"[ERROR] {pdf.name}: {e}", file=sys.stderr)
+
+    if jobs <= 1:
+        for pdf in pdfs:
+            try:
+                yield (pdf, *_extract_doc(pdf, cache, engine))
+            except Exception as e:
+                report(pdf, e)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futs = [ex.submit(_extract_doc, pdf, cache, engine) for pdf in pdfs]
+        for pdf, fut in zip(pdfs, futs):
+            try:
+                yield (pdf, *fut.result())
+            except Exception as e:
+                report(pdf, e)
+
+
+def pack_corpus(
+    pdfs: Iterable[Path],
+    out: Path,
+    cache=None,
+    engine: str = DEFAULT_BACKEND,
+    jobs: int = 1,
+) -> int:
+    """Extract (or read from ``cache``) every PDF and write the pack; return the doc count."""
+    from .page_cache import file_digest
+
+    pdfs, out = [Path(p) for p in pdfs], Path(out)
+    docs, offset = [], 0
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "wb") as f:
+        for pdf, texts, used in _extracted(pdfs, cache, engine, jobs):
+            spans = []
+            for text in texts:
+                data = text.encode("utf-8")
+                f.write(data)
+                spans.append((offset, len(data)))
+                offset += len(data)
+            docs.append({"name": pdf.name, "digest": file_digest(pdf), "engine": used, "pages": spans})
+    index = {"version": PACK_VERSION, "bytes": offset, "docs": docs}
+    idx_tmp = index_path(tmp)
+    idx_tmp.write_text(json.dumps(index), encoding="utf-8")
+    os.replace(tmp, out)
+    os.replace(idx_tmp, index_path(out))
+    return len(docs)
+
+
+# ---- searching ----
+
+class Corpus:
+    """A packed corpus, memory-mapped on first access."""
+
+    def __init__(self, pack: Path):
+        self.path = Path(pack)
+        index = json.loads(index_path(self.path).read_text(encoding="utf-8"))
+        if index.get("version") != PACK_VERSION:
+            raise ValueError(f"{self.path}: pack version {index.get('version')}, expected {PACK_VERSION}")
+        self.docs: list[dict] = index["docs"]
+        self.n_pages = sum(len(d["pages"]) for d in self.docs)
+        self._file = None
+        self._map: mmap.mmap | bytes | None = None
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def _data(self):
+        if self._map is None:
+            self._file = open(self.path, "rb")
+            size = os.fstat(self._file.fileno()).st_size
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        return self._map
+
+    def page_text(self, doc: int, page_no: int) -> str:
+        off, n = self.docs[doc]["pages"][page_no - 1]
+        return self._data()[off:off + n].decode("utf-8")
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._file = self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def search_docs(self, patterns: Sequence[re.Pattern], docs: Iterable[int], first: bool = False) -> list[Hit]:
+        """
+        Every match of every pattern, in document/page order. With ``first``
+        only what the slicer would anchor on: per document, the earliest
+        match of the first pattern that matches at all.
+        """
+        out: list[Hit] = []
+        for d in docs:
+            name = self.docs[d]["name"]
+            texts = [self.page_text(d, p) for p in range(1, len(self.docs[d]["pages"]) + 1)]
+            if first:
+                for alt, pat in enumerate(patterns):
+                    hit = next(
+                        (_hit(name, pno, alt, text, m)
+                         for pno, text in enumerate(texts, start=1) for m in [pat.search(text)] if m),
+                        None,
+                    )
+                    if hit:
+                        out.append(hit)
+                        break
+                continue
+            hits = [
+                _hit(name, pno, alt, text, m)
+                for alt, pat in enumerate(patterns)
+                for pno, text in enumerate(texts, start=1)
+                for m in pat.finditer(text)
+            ]
+            out.extend(sorted(hits, key=lambda h: (h.page, h.line, h.alt)))
+        return out
+
+    def search(self, patterns: Sequence[re.Pattern], jobs: int | None = None, first: bool = False) -> list[Hit]:
+        """``search_docs`` over the whole corpus, split across ``jobs`` processes."""
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(self.docs)))
+        if jobs == 1:
+            return self.search_docs(patterns, range(len(self.docs)), first)
+        from concurrent.futures import ProcessPoolExecutor
+        chunks = [range(i, len(self.docs), jobs) for i in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            parts = list(ex.map(_search_chunk, [str(self.path)] * jobs, [patterns] * jobs,
+                                chunks, [first] * jobs))
+        hits = [h for part in parts for h in part]
+        order = {d["name"]: i for i, d in enumerate(self.docs)}
+        hits.sort(key=lambda h: order[h.doc])  # stable: per-document order is kept
+        return hits
+
+
+def _hit(doc: str, page: int, alt: int, text: str, m: re.Match) -> Hit:
+    # a leading ^\s* may swallow blank lines; report the line the match text is on
+    g = m.group(0)
+    pos = m.start() + len(g) - len(g.lstrip()) if g.strip() else m.start()
+    start = text.rfind("\n", 0, pos) + 1
+    end = text.find("\n", pos)
+    line = text[start:end if end >= 0 else len(text)]
+    return Hit(doc, page, text.count("\n", 0, pos) + 1, alt, line.strip())
+
+
+_OPEN: dict[str, Corpus] = {}
+
+
+def _search_chunk(pack: str, patterns, docs, first: bool) -> list[Hit]:
+    # runs in a worker; the mapping is shared through the OS page cache
+    if pack not in _OPEN:
+        _OPEN[pack] = Corpus(Path(pack))
+    return _OPEN[pack].search_docs(patterns, docs, first)
+
+
+def spec_patterns(key: str) -> tuple[re.Pattern, ...]:
+    """Start anchors of the 2024 table/narrative spec ``key`` (e.g. ``df_1d9b``)."""
+    from .specs_2024 import NARR_SPECS_2024, TABLE_SPECS_2024
+    for s in TABLE_SPECS_2024:
+        if s.key == key:
+            return s.start_rx
+    for s in NARR_SPECS_2024:
+        if s.key == key:
+            return s.anchor_start_rx
+    known = [s.key for s in (*TABLE_SPECS_2024, *NARR_SPECS_2024)]
+    raise ValueError(f"Unknown spec {key!r}. Known: {known}")
+
+
+# ---- command line ----
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m astraea_coc.corpus", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("pack", help="Extract every PDF in a directory into one pack file.")
+    p.add_argument("apps_dir")
+    p.add_argument("-o", "--output", default="corpus.pack")
+    p.add_argument("--glob", default="*.pdf", help="Which files to pack (default: *.pdf).")
+    p.add_argument("--engine", default=DEFAULT_BACKEND, choices=["auto", *BACKENDS])
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--cache-dir", default=None, help="Page-text cache directory (default: the shared cache).")
+    p.add_argument("--no-cache", action="store_true", help="Extract without the page-text cache.")
+
+    s = sub.add_parser("search", help="Run patterns over a pack; report hits per document and page.")
+    s.add_argument("pack")
+    s.add_argument("-e", "--pattern", action="append", default=[],
+                   help="Regex, compiled like the spec anchors (IGNORECASE | MULTILINE). Repeatable.")
+    s.add_argument("--spec", action="append", default=[], help="Use a 2024 spec's start anchors, e.g. df_1d9b.")
+    s.add_argument("--first", action="store_true",
+                   help="Only the hit the slicer would anchor on (first pattern that matches, earliest page).")
+    s.add_argument("--missing", action="store_true", help="List documents without any hit.")
+    s.add_argument("--json", action="store_true", help="Print hits as JSON lines.")
+    s.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count).")
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "pack":
+        from .page_cache import PageCache
+        apps_dir = Path(args.apps_dir).expanduser().resolve()
+        pdfs = sorted(apps_dir.glob(args.glob), key=lambda p: p.name.lower())
+        if not pdfs:
+            print(f"ERROR: no {args.glob} files in {apps_dir}", file=sys.stderr)
+            return 1
+        cache = None
+        if not args.no_cache:
+            cache = PageCache(Path(args.cache_dir).expanduser() / "pages.sqlite" if args.cache_dir else None)
+        t = time.perf_counter()
+        n = pack_corpus(pdfs, Path(args.output), cache=cache, engine=args.engine, jobs=args.jobs)
+        print(f"Packed {n}/{len(pdfs)} documents into {args.output} in {time.perf_counter() - t:.1f}s")
+        return 0 if n else 1
+
+    patterns = [rx(p, owner="--pattern") for p in args.pattern]
+    for key in args.spec:
+        patterns.extend(spec_patterns(key))
+    if not patterns:
+        parser.error("search needs at least one --pattern or --spec")
+
+    t = time.perf_counter()
+    with Corpus(Path(args.pack)) as corpus:
+        hits = corpus.search(patterns, jobs=args.jobs, first=args.first)
+        elapsed = time.perf_counter() - t
+        matched = {h.doc for h in hits}
+        for h in hits:
+            if args.json:
+                print(json.dumps(h._asdict()))
+            else:
+                alt = f" [{h.alt}]" if len(patterns) > 1 else ""
+                print(f"{h.doc}  p{h.page}:{h.line}{alt}  {h.text}")
+        if args.missing:
+            for d in corpus.docs:
+                if d["name"] not in matched:
+                    print(f"[missing] {d['name']}")
+        print(
+            f"{len(matched)}/{len(corpus)} documents matched, {len(hits)} hit(s), "
+            f"{corpus.n_pages} pages searched in {elapsed:.2f}s",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,40 +5,58 @@ import re as _re
 from .slicer import slice_section_lines
 from .parsers import parse_numbered_yesno
 from .parsers import parse_2a5_bed_coverage
+from .records import first_by_index
+from .patterns import compile_all, compile_re
 
 
 Pages = list[tuple[int, str]]
 
+# Section anchors and in-block patterns are compiled once at import; an invalid
+# pattern fails loudly here instead of on the first PDF.
+
+YESNO_RX = compile_re(r"\b(Yes|No)\b", _re.IGNORECASE)
+YESNO_NONEXISTENT_RX = compile_re(r"\b(Yes|No|Nonexistent)\b", _re.IGNORECASE)
+DATE_RX = compile_re(r"\b\d{2}/\d{2}/\d{4}\b")
+DATE_ONLY_RX = compile_re(r"\d{2}/\d{2}/\d{4}")
+
+# shared by the "Describe in the field below ... (limit 2,500 characters)" narratives
+NARR_HEADER_SKIP_RX = compile_re(
+    r"^\s*(NOFO Section|Applicant:|Project:|FY20\d{2}\s+CoC Application Page|Page\s+\d+)",
+    _re.IGNORECASE,
+)
+NARR_LIMIT_LINE_RX = compile_re(r"limit\s*2,?500\s*characters", _re.IGNORECASE)
+NARR_DESCRIBE_LINE_RX = compile_re(r"Describe\s+in\s+the\s+field\s+below", _re.IGNORECASE)
+
+
+_START_1C7D = compile_all([
+    r"^\s*1C[-–]7d\.\s*Submitting\s+CoC\s+and\s+PHA\s+Joint\s+Applications.*$",
+    r"^\s*1C[-–]7d\.\s*",
+], owner="custom_1c7d")
+_STOP_1C7D = compile_all([
+    r"^\s*1C[-–]7e\.",
+    r"^\s*1D[-–]1\.",
+    r"^\s*2A[-–]1\.",
+], owner="custom_1c7d")
+_Q2_1C7D_RX = compile_re(
+    r"^2\.\s*Enter\s+the\s+type\s+of\s+competitive\s+project\s+your\s+CoC\s+coordinated.*$",
+    _re.IGNORECASE,
+)
+_NEXT_SECTION_1C7D_RX = compile_re(
+    r"^\s*1C[-–]7e\.|^\s*1D[-–]1\.|^\s*2A[-–]1\.|^\s*NOFO\s+Section",
+    _re.IGNORECASE,
+)
+
 
 def custom_1c7d(pages: Pages) -> dict[str, str]:
     # --- 1C-7d. Joint CoC–PHA applications ---
-    start_1c7d = [
-        r"^\s*1C[-–]7d\.\s*Submitting\s+CoC\s+and\s+PHA\s+Joint\s+Applications.*$",
-        r"^\s*1C[-–]7d\.\s*",
-    ]
-    stop_1c7d = [
-        r"^\s*1C[-–]7e\.",
-        r"^\s*1D[-–]1\.",
-        r"^\s*2A[-–]1\.",
-    ]
-    lines_1c7d = slice_section_lines(pages, start_1c7d, stop_1c7d, safety_pages_ahead=2)
-
-    df_yn = parse_numbered_yesno(lines_1c7d)
-    val_1c7d_1 = ""
-    if not df_yn.empty:
-        row = df_yn[df_yn["index"] == 1]
-        if not row.empty:
-            val_1c7d_1 = row["value"].iloc[0]
+    lines_1c7d = slice_section_lines(pages, _START_1C7D, _STOP_1C7D, safety_pages_ahead=2)
+
+    yn = first_by_index(parse_numbered_yesno(lines_1c7d, lean=True))
+    val_1c7d_1 = yn[1].value if 1 in yn else ""
 
     narr_1c7d_2 = ""
-    start_rx = _re.compile(
-        r"^2\.\s*Enter\s+the\s+type\s+of\s+competitive\s+project\s+your\s+CoC\s+coordinated.*$",
-        _re.IGNORECASE,
-    )
-    next_section_rx = _re.compile(
-        r"^\s*1C[-–]7e\.|^\s*1D[-–]1\.|^\s*2A[-–]1\.|^\s*NOFO\s+Section",
-        _re.IGNORECASE,
-    )
+    start_rx = _Q2_1C7D_RX
+    next_section_rx = _NEXT_SECTION_1C7D_RX
 
     start_idx = None
     for i, ln in enumerate(lines_1c7d):
@@ -51,7 +69,8 @@ def custom_1c7d(pages: Pages) -> dict[str, str]:
         for ln in lines_1c7d[start_idx + 1 :]:
             if next_section_rx.search(ln):
                 break
-            if not ln.strip():
+            # the answer can run over a page break: drop the footer/header lines
+            if not ln.strip() or NARR_HEADER_SKIP_RX.search(ln):
                 continue
             content_lines.append(ln)
         narr_1c7d_2 = "\n".join(content_lines).strip()
@@ -65,18 +84,20 @@ def custom_1c7d(pages: Pages) -> dict[str, str]:
     }
 
 
+_START_1C7E = compile_all([
+    r"^\s*1C[-–]7e\.\s*Coordinating\s+with\s+PHA\(s\)\s+to\s+Apply\s+for\s+or\s+Implement\s+HCV.*$",
+    r"^\s*1C[-–]7e\.\s*",
+], owner="custom_1c7e")
+_STOP_1C7E = compile_all([
+    r"^\s*1D[-–]1\.",
+    r"^\s*2A[-–]1\.",
+], owner="custom_1c7e")
+
+
 def custom_1c7e(pages: Pages) -> dict[str, str]:
-    start_1c7e = [
-        r"^\s*1C[-–]7e\.\s*Coordinating\s+with\s+PHA\(s\)\s+to\s+Apply\s+for\s+or\s+Implement\s+HCV.*$",
-        r"^\s*1C[-–]7e\.\s*",
-    ]
-    stop_1c7e = [
-        r"^\s*1D[-–]1\.",
-        r"^\s*2A[-–]1\.",
-    ]
-    lines_1c7e = slice_section_lines(pages, start_1c7e, stop_1c7e, safety_pages_ahead=2)
-
-    yesno_rx = _re.compile(r"\b(Yes|No|Nonexistent)\b", _re.IGNORECASE)
+    lines_1c7e = slice_section_lines(pages, _START_1C7E, _STOP_1C7E, safety_pages_ahead=2)
+
+    yesno_rx = YESNO_NONEXISTENT_RX
     val_1c7e = ""
     for ln in reversed(lines_1c7e):
         m = yesno_rx.search(ln)
@@ -87,27 +108,36 @@ def custom_1c7e(pages: Pages) -> dict[str, str]:
     return {"val_1c7e": val_1c7e}
 
 
+_START_1D2 = compile_all([
+    r"^\s*1D[-–]2\.\s*Housing\s+First[-–]\s*Lowering\s+Barriers\s+to\s+Entry.*$",
+    r"^\s*1D[-–]2\.\s*",
+], owner="custom_1d2")
+_STOP_1D2 = compile_all([
+    r"^\s*1D[-–]2a\.",
+    r"^\s*1D[-–]3\.",
+    r"^\s*2A[-–]1\.",
+], owner="custom_1d2")
+_ENUM_123_RX = compile_re(r"^\s*[123]\.\s")
+_NEXT_1D2_RX = compile_re(r"^\s*[1I]D[-–]2a\.|^\s*[1I]D[-–]3\.")
+_NUM_PCT_RX = compile_re(r"\b(\d+%?)\b")
+_NUM_PCT_ALL_RX = compile_re(r"\b\d+%?\b")
+_Q1_1D2_RX = compile_re(r"^\s*1\.\s*Enter\s+the\s+total\s+number", _re.IGNORECASE)
+_Q2_1D2_RX = compile_re(r"^\s*2\.\s*Enter\s+the\s+total\s+number", _re.IGNORECASE)
+_Q3_1D2_RX = compile_re(r"^\s*3\.\s*This\s+number\s+is\s+a\s+calculation", _re.IGNORECASE)
+
+
 def custom_1d2(pages: Pages) -> dict[str, str]:
-    start_1d2 = [
-        r"^\s*1D[-–]2\.\s*Housing\s+First[-–]\s*Lowering\s+Barriers\s+to\s+Entry.*$",
-        r"^\s*1D[-–]2\.\s*",
-    ]
-    stop_1d2 = [
-        r"^\s*1D[-–]2a\.",
-        r"^\s*1D[-–]3\.",
-        r"^\s*2A[-–]1\.",
-    ]
-    lines_1d2 = slice_section_lines(pages, start_1d2, stop_1d2, safety_pages_ahead=2)
+    lines_1d2 = slice_section_lines(pages, _START_1D2, _STOP_1D2, safety_pages_ahead=2)
 
     def _grab_answer_after_question(lines, question_rx, max_lookahead=10):
         for idx, ln in enumerate(lines):
             if question_rx.search(ln):
                 for ln2 in lines[idx + 1 : idx + 1 + max_lookahead]:
-                    if _re.match(r"^\s*[123]\.\s", ln2):
+                    if _ENUM_123_RX.match(ln2):
                         break
-                    if _re.match(r"^\s*[1I]D[-–]2a\.", ln2) or _re.match(r"^\s*[1I]D[-–]3\.", ln2):
+                    if _NEXT_1D2_RX.match(ln2):
                         break
-                    m = _re.search(r"\b(\d+%?)\b", ln2)
+                    m = _NUM_PCT_RX.search(ln2)
                     if not m:
                         continue
                     tok = m.group(1)
@@ -122,19 +152,15 @@ def custom_1d2(pages: Pages) -> dict[str, str]:
                 break
         return ""
 
-    q1_rx = _re.compile(r"^\s*1\.\s*Enter\s+the\s+total\s+number", _re.IGNORECASE)
-    q2_rx = _re.compile(r"^\s*2\.\s*Enter\s+the\s+total\s+number", _re.IGNORECASE)
-    q3_rx = _re.compile(r"^\s*3\.\s*This\s+number\s+is\s+a\s+calculation", _re.IGNORECASE)
-
-    val_1d2_1 = _grab_answer_after_question(lines_1d2, q1_rx)
-    val_1d2_2 = _grab_answer_after_question(lines_1d2, q2_rx)
-    val_1d2_3 = _grab_answer_after_question(lines_1d2, q3_rx)
+    val_1d2_1 = _grab_answer_after_question(lines_1d2, _Q1_1D2_RX)
+    val_1d2_2 = _grab_answer_after_question(lines_1d2, _Q2_1D2_RX)
+    val_1d2_3 = _grab_answer_after_question(lines_1d2, _Q3_1D2_RX)
 
     if not (val_1d2_1 and val_1d2_2 and val_1d2_3):
         nums = []
         skip_enums = {"1","2","3"}
         for ln in lines_1d2:
-            for tok in _re.findall(r"\b\d+%?\b", ln):
+            for tok in _NUM_PCT_ALL_RX.findall(ln):
                 if tok in skip_enums:
                     continue
                 try:
@@ -162,21 +188,24 @@ def custom_1d2(pages: Pages) -> dict[str, str]:
     }
 
 
+_START_1D5 = compile_all([
+    r"^\s*[1I]D[-–]5\.\s*Rapid\s+Rehousing[-–]\s*RRH\s+Beds\s+as\s+Reported\s+in\s+the\s+Housing\s+Inventory\s+Count.*$",
+    r"^\s*[1I]D[-–]5\.\s*",
+], owner="custom_1d5")
+_STOP_1D5 = compile_all([
+    r"^\s*[1I]D[-–]6\.",
+    r"^\s*2A[-–]1\.",
+], owner="custom_1d5")
+_RRH_ROW_1D5_RX = compile_re(
+    r"\b(HIC|Longitudinal\s+HMIS\s+Data)\b\s+(\d+)\s+(\d+)",
+    _re.IGNORECASE,
+)
+
+
 def custom_1d5(pages: Pages) -> dict[str, str]:
-    start_1d5 = [
-        r"^\s*[1I]D[-–]5\.\s*Rapid\s+Rehousing[-–]\s*RRH\s+Beds\s+as\s+Reported\s+in\s+the\s+Housing\s+Inventory\s+Count.*$",
-        r"^\s*[1I]D[-–]5\.\s*",
-    ]
-    stop_1d5 = [
-        r"^\s*[1I]D[-–]6\.",
-        r"^\s*2A[-–]1\.",
-    ]
-    lines_1d5 = slice_section_lines(pages, start_1d5, stop_1d5, safety_pages_ahead=2)
-
-    rx_1d5 = _re.compile(
-        r"\b(HIC|Longitudinal\s+HMIS\s+Data)\b\s+(\d+)\s+(\d+)",
-        _re.IGNORECASE,
-    )
+    lines_1d5 = slice_section_lines(pages, _START_1D5, _STOP_1D5, safety_pages_ahead=2)
+
+    rx_1d5 = _RRH_ROW_1D5_RX
     val_1d5_source = val_1d5_2023 = val_1d5_2024 = ""
 
     for ln in lines_1d5:
@@ -199,21 +228,23 @@ def custom_1d5(pages: Pages) -> dict[str, str]:
     }
 
 
+_START_1D9 = compile_all([
+    r"^\s*[1I]D[-–]9\.\s*Advancing\s+Racial\s+Equity\s+in\s+Homelessness.*$",
+    r"^\s*[1I]D[-–]9\.\s*",
+], owner="custom_1d9")
+_STOP_1D9 = compile_all([
+    r"^\s*[1I]D[-–]9a\.",
+    r"^\s*[1I]D[-–]10\.",
+    r"^\s*2A[-–]1\.",
+], owner="custom_1d9")
+
+
 def custom_1d9(pages: Pages) -> dict[str, str]:
-    start_1d9 = [
-        r"^\s*[1I]D[-–]9\.\s*Advancing\s+Racial\s+Equity\s+in\s+Homelessness.*$",
-        r"^\s*[1I]D[-–]9\.\s*",
-    ]
-    stop_1d9 = [
-        r"^\s*[1I]D[-–]9a\.",
-        r"^\s*[1I]D[-–]10\.",
-        r"^\s*2A[-–]1\.",
-    ]
-    lines_1d9 = slice_section_lines(pages, start_1d9, stop_1d9, safety_pages_ahead=2)
+    lines_1d9 = slice_section_lines(pages, _START_1D9, _STOP_1D9, safety_pages_ahead=2)
 
     val_1d9_1 = val_1d9_2 = ""
-    yesno_rx = _re.compile(r"\b(Yes|No)\b", _re.IGNORECASE)
-    date_rx = _re.compile(r"\b\d{2}/\d{2}/\d{4}\b")
+    yesno_rx = YESNO_RX
+    date_rx = DATE_RX
 
     for ln in lines_1d9:
         if "Has your CoC conducted a racial disparities assessment" not in ln:
@@ -232,17 +263,20 @@ def custom_1d9(pages: Pages) -> dict[str, str]:
     return {"val_1d9_1": val_1d9_1, "val_1d9_2": val_1d9_2}
 
 
+_START_1D10A = compile_all([r"^\s*[1I]D[-–]10a\.\s*"], owner="custom_1d10a")
+_STOP_1D10A = compile_all([
+    r"^\s*[1I]D[-–]10b\.",
+    r"^\s*2A[-–]1\.",
+], owner="custom_1d10a")
+_ROW_1D10A_RX = compile_re(r"^\s*(\d+)\.\s.*?(\d+)\s+(\d+)\s*$")
+
+
 def custom_1d10a(pages: Pages) -> dict[str, str]:
-    start_1d10a = [r"^\s*[1I]D[-–]10a\.\s*"]
-    stop_1d10a = [
-        r"^\s*[1I]D[-–]10b\.",
-        r"^\s*2A[-–]1\.",
-    ]
-    lines_1d10a = slice_section_lines(pages, start_1d10a, stop_1d10a, safety_pages_ahead=2)
+    lines_1d10a = slice_section_lines(pages, _START_1D10A, _STOP_1D10A, safety_pages_ahead=2)
 
     vals_years = ["", "", "", ""]
     vals_unshel = ["", "", "", ""]
-    row_rx = _re.compile(r"^\s*(\d+)\.\s.*?(\d+)\s+(\d+)\s*$")
+    row_rx = _ROW_1D10A_RX
 
     for ln in lines_1d10a:
         m = row_rx.match(ln.strip())
@@ -265,36 +299,48 @@ def custom_1d10a(pages: Pages) -> dict[str, str]:
     }
 
 
+_BOILER_2A_RX = compile_re(
+    r"^\s*("
+    r"2A\b|2A[-–]\d+\.|"
+    r"Homeless Management Information System|HMIS Implementation|"
+    r"HUD publishes resources|Resources include|"
+    r"Not Scored|For Information Only|"
+    r"NOFO Section|24 CFR|Navigational Guide|"
+    r"You must enter|You must provide|"
+    r"Applicant:|Project:|FY20\d{2}\s+CoC Application Page|Page\s+\d+"
+    r")",
+    _re.IGNORECASE,
+)
+# NEW: prompt prefixes that may share a line with the answer
+_PROMPT_STRIP_2A_RXES = (
+    compile_re(r"^\s*Enter the name of the HMIS Vendor your CoC is currently using\.\s*",
+                _re.IGNORECASE),
+    compile_re(r"^\s*Select from dropdown menu your CoC’s HMIS coverage area\.\s*",
+                _re.IGNORECASE),
+    compile_re(r"^\s*Enter the date your CoC submitted its 2024 HIC data into HDX\.\s*",
+                _re.IGNORECASE),
+)
+_LIST_MARKER_RX = compile_re(r"^\s*\d+[\.\)]\s*")
+_BULLET_RX = compile_re(r"^\s*[\-\u2022•]+\s*")
+_PUNCT_ONLY_RX = compile_re(r"[.\)\-]+")
+_SPACE_COMMA_RX = compile_re(r"\s+,")
+_WS_RX = compile_re(r"\s+")
+_START_2A1 = compile_all([r"^\s*2A[-–]1\.\s*HMIS Vendor"], owner="custom_2a_basic")
+_STOP_2A1 = compile_all([r"^\s*2A[-–]2\."], owner="custom_2a_basic")
+_START_2A2 = compile_all([r"^\s*2A[-–]2\.\s*HMIS Implementation Coverage Area"], owner="custom_2a_basic")
+_STOP_2A2 = compile_all([r"^\s*2A[-–]3\."], owner="custom_2a_basic")
+_START_2A3 = compile_all([r"^\s*2A[-–]3\.\s*HIC Data Submission in HDX"], owner="custom_2a_basic")
+_STOP_2A3 = compile_all([r"^\s*2A[-–]4\."], owner="custom_2a_basic")
+
+
 def custom_2a_basic(pages) -> dict[str, str]:
     out: dict[str, str] = {}
 
-    date_rx = _re.compile(r"\b\d{2}/\d{2}/\d{4}\b")
-
-    boiler_rx = _re.compile(
-        r"^\s*("
-        r"2A\b|2A[-–]\d+\.|"
-        r"Homeless Management Information System|HMIS Implementation|"
-        r"HUD publishes resources|Resources include|"
-        r"Not Scored|For Information Only|"
-        r"NOFO Section|24 CFR|Navigational Guide|"
-        r"You must enter|You must provide|"
-        r"Applicant:|Project:|FY20\d{2}\s+CoC Application Page|Page\s+\d+"
-        r")",
-        _re.IGNORECASE,
-    )
-
-    # NEW: prompt prefixes that may share a line with the answer
-    prompt_strip_rxes = [
-        _re.compile(r"^\s*Enter the name of the HMIS Vendor your CoC is currently using\.\s*",
-                    _re.IGNORECASE),
-        _re.compile(r"^\s*Select from dropdown menu your CoC’s HMIS coverage area\.\s*",
-                    _re.IGNORECASE),
-        _re.compile(r"^\s*Enter the date your CoC submitted its 2024 HIC data into HDX\.\s*",
-                    _re.IGNORECASE),
-    ]
+    date_rx = DATE_RX
+    boiler_rx = _BOILER_2A_RX
 
     def _strip_prompt_prefix(s: str) -> str:
-        for rx in prompt_strip_rxes:
+        for rx in _PROMPT_STRIP_2A_RXES:
             s2 = rx.sub("", s).strip()
             if s2 != s:
                 s = s2
@@ -310,9 +356,9 @@ def custom_2a_basic(pages) -> dict[str, str]:
             s = _strip_prompt_prefix(raw)
 
             # NEW: strip leading list markers / bullets
-            s = _re.sub(r"^\s*\d+[\.\)]\s*", "", s)
-            s = _re.sub(r"^\s*[\-\u2022•]+\s*", "", s)
-            if _re.fullmatch(r"[.\)\-]+", s):
+            s = _LIST_MARKER_RX.sub("", s)
+            s = _BULLET_RX.sub("", s)
+            if _PUNCT_ONLY_RX.fullmatch(s):
                 continue
 
             # if line is still pure boilerplate, skip
@@ -326,8 +372,8 @@ def custom_2a_basic(pages) -> dict[str, str]:
             return "Empty"
 
         text = " ".join(keep)
-        text = _re.sub(r"\s+,", ",", text)
-        text = _re.sub(r"\s+", " ", text).strip()
+        text = _SPACE_COMMA_RX.sub(",", text)
+        text = _WS_RX.sub(" ", text).strip()
         return text
 
 
@@ -348,7 +394,7 @@ def custom_2a_basic(pages) -> dict[str, str]:
                 continue
 
             stripped = s.strip()
-            if _re.fullmatch(r"\d{2}/\d{2}/\d{4}", stripped):
+            if DATE_ONLY_RX.fullmatch(stripped):
                 candidates.extend(ds)
             elif stripped.endswith(ds[-1]):
                 candidates.extend(ds)
@@ -358,8 +404,8 @@ def custom_2a_basic(pages) -> dict[str, str]:
     # 2A-1 vendor
     lines_2a1 = slice_section_lines(
         pages,
-        start_patterns=[r"^\s*2A[-–]1\.\s*HMIS Vendor"],
-        stop_patterns=[r"^\s*2A[-–]2\."],
+        start_patterns=_START_2A1,
+        stop_patterns=_STOP_2A1,
         safety_pages_ahead=2,
     )
     out["val_2a_1"] = _extract_free_text(lines_2a1)
@@ -367,8 +413,8 @@ def custom_2a_basic(pages) -> dict[str, str]:
     # 2A-2 coverage area
     lines_2a2 = slice_section_lines(
         pages,
-        start_patterns=[r"^\s*2A[-–]2\.\s*HMIS Implementation Coverage Area"],
-        stop_patterns=[r"^\s*2A[-–]3\."],
+        start_patterns=_START_2A2,
+        stop_patterns=_STOP_2A2,
         safety_pages_ahead=2,
     )
     out["val_2a_2"] = _extract_free_text(lines_2a2)
@@ -376,8 +422,8 @@ def custom_2a_basic(pages) -> dict[str, str]:
     # 2A-3 HIC submission date
     lines_2a3 = slice_section_lines(
         pages,
-        start_patterns=[r"^\s*2A[-–]3\.\s*HIC Data Submission in HDX"],
-        stop_patterns=[r"^\s*2A[-–]4\."],
+        start_patterns=_START_2A3,
+        stop_patterns=_STOP_2A3,
         safety_pages_ahead=2,
     )
     out["val_2a_3"] = _pick_answer_date(lines_2a3)
@@ -386,6 +432,12 @@ def custom_2a_basic(pages) -> dict[str, str]:
 
 
 
+_START_2A4 = compile_all([r"^\s*2A[-–]4\.\s*Comparable Databases for DV Providers"], owner="custom_2a4")
+_STOP_2A4 = compile_all([r"^\s*2A[-–]5\."], owner="custom_2a4")
+_LEAD_QUOTE_RX = compile_re(r'^\s*"\)\s*')
+_TRAIL_QUOTE_RX = compile_re(r'\s*"\s*$')
+
+
 def custom_2a4(pages: Pages) -> dict[str, str]:
     """
     2A-4 is a narrative block.
@@ -393,17 +445,14 @@ def custom_2a4(pages: Pages) -> dict[str, str]:
     """
     lines_2a4 = slice_section_lines(
         pages,
-        start_patterns=[r"^\s*2A[-–]4\.\s*Comparable Databases for DV Providers"],
-        stop_patterns=[r"^\s*2A[-–]5\."],
+        start_patterns=_START_2A4,
+        stop_patterns=_STOP_2A4,
         safety_pages_ahead=3,
     )
 
-    header_skip = _re.compile(
-        r"^\s*(NOFO Section|Applicant:|Project:|FY20\d{2}\s+CoC Application Page|Page\s+\d+)",
-        _re.IGNORECASE,
-    )
-    limit_line = _re.compile(r"limit\s*2,?500\s*characters", _re.IGNORECASE)
-    describe_line = _re.compile(r"Describe\s+in\s+the\s+field\s+below", _re.IGNORECASE)
+    header_skip = NARR_HEADER_SKIP_RX
+    limit_line = NARR_LIMIT_LINE_RX
+    describe_line = NARR_DESCRIBE_LINE_RX
 
     state = "seek_anchor"
     prompt_seen = False
@@ -445,8 +494,8 @@ def custom_2a4(pages: Pages) -> dict[str, str]:
     text = "\n".join(buf).strip()
 
     # Clean the OCR hanging quote/parens you saw
-    text = _re.sub(r'^\s*"\)\s*', "", text)
-    text = _re.sub(r'\s*"\s*$', "", text).strip()
+    text = _LEAD_QUOTE_RX.sub("", text)
+    text = _TRAIL_QUOTE_RX.sub("", text).strip()
 
     if not text:
         text = "Empty"
@@ -454,6 +503,10 @@ def custom_2a4(pages: Pages) -> dict[str, str]:
     return {"narr_2a_4": text}
 
 
+_START_2A5 = compile_all([r"^\s*2A[-–]5\.\s*Bed Coverage Rate"], owner="custom_2a5")
+_STOP_2A5 = compile_all([r"^\s*2A[-–]5a\."], owner="custom_2a5")
+
+
 def custom_2a5(pages: Pages) -> dict[str, str]:
     """
     2A-5 is a 6-row numeric table. We parse it to a DF, then
@@ -465,12 +518,12 @@ def custom_2a5(pages: Pages) -> dict[str, str]:
     """
     lines_2a5 = slice_section_lines(
         pages,
-        start_patterns=[r"^\s*2A[-–]5\.\s*Bed Coverage Rate"],
-        stop_patterns=[r"^\s*2A[-–]5a\."],
+        start_patterns=_START_2A5,
+        stop_patterns=_STOP_2A5,
         safety_pages_ahead=2,
     )
 
-    df = parse_2a5_bed_coverage(lines_2a5)
+    rows = parse_2a5_bed_coverage(lines_2a5, lean=True)
 
     out: dict[str, str] = {}
 
@@ -481,39 +534,37 @@ def custom_2a5(pages: Pages) -> dict[str, str]:
         out[f"val_2a_5_{i}_hmis"]    = "Empty"
         out[f"val_2a_5_{i}_coverage"]= "Empty"
 
-    if df is None or df.empty:
-        return out
-
-    for _, row in df.iterrows():
-        i = int(row["index"])
+    for row in rows:
+        i = row.index
         if not (1 <= i <= 6):
             continue
-        out[f"val_2a_5_{i}_non_vsp"]  = str(row.get("adj_total_non_vsp_beds", "")).strip() or "Empty"
-        out[f"val_2a_5_{i}_vsp"]      = str(row.get("adj_total_vsp_beds", "")).strip() or "Empty"
-        out[f"val_2a_5_{i}_hmis"]     = str(row.get("total_hmis_plus_vsp_beds", "")).strip() or "Empty"
-        out[f"val_2a_5_{i}_coverage"] = str(row.get("coverage_rate", "")).strip() or "Empty"
+        out[f"val_2a_5_{i}_non_vsp"]  = str(row.adj_total_non_vsp_beds).strip() or "Empty"
+        out[f"val_2a_5_{i}_vsp"]      = str(row.adj_total_vsp_beds).strip() or "Empty"
+        out[f"val_2a_5_{i}_hmis"]     = str(row.total_hmis_plus_vsp_beds).strip() or "Empty"
+        out[f"val_2a_5_{i}_coverage"] = str(row.coverage_rate).strip() or "Empty"
 
     return out
 
 
+_START_2A5A = compile_all([r"^\s*2A[-–]5a\.\s*Partial Credit for Bed Coverage Rates"], owner="custom_2a5a")
+_STOP_2A5A = compile_all([r"^\s*2A[-–]6\."], owner="custom_2a5a")
+
+
 def custom_2a5a(pages: Pages) -> dict[str, str]:
     """
     2A-5a is a narrative block.
     """
     lines_2a5a = slice_section_lines(
         pages,
-        start_patterns=[r"^\s*2A[-–]5a\.\s*Partial Credit for Bed Coverage Rates"],
-        stop_patterns=[r"^\s*2A[-–]6\."],
+        start_patterns=_START_2A5A,
+        stop_patterns=_STOP_2A5A,
         safety_pages_ahead=3,
     )
 
     # reuse same narrative stripper as 2a4
-    header_skip = _re.compile(
-        r"^\s*(NOFO Section|Applicant:|Project:|FY20\d{2}\s+CoC Application Page|Page\s+\d+)",
-        _re.IGNORECASE,
-    )
-    limit_line = _re.compile(r"limit\s*2,?500\s*characters", _re.IGNORECASE)
-    describe_line = _re.compile(r"Describe\s+in\s+the\s+field\s+below", _re.IGNORECASE)
+    header_skip = NARR_HEADER_SKIP_RX
+    limit_line = NARR_LIMIT_LINE_RX
+    describe_line = NARR_DESCRIBE_LINE_RX
 
     state = "seek_anchor"
     prompt_seen = False
@@ -557,19 +608,21 @@ def custom_2a5a(pages: Pages) -> dict[str, str]:
     return {"narr_2a_5a": text}
 
 
+_START_2A6 = compile_all([
+    r"^\s*2A[-–]6\.\s*Longitudinal System Analysis",
+    r"^\s*2A[-–]6\.\s*",
+], owner="custom_2a6")
+_STOP_2A6 = compile_all([
+    r"^\s*2B[-–]1\.",
+    r"^\s*2B\.",
+    r"^\s*2C[-–]1\.",
+], owner="custom_2a6")
+
+
 def custom_2a6(pages: Pages) -> dict[str, str]:
-    start_2a6 = [
-        r"^\s*2A[-–]6\.\s*Longitudinal System Analysis",
-        r"^\s*2A[-–]6\.\s*",
-    ]
-    stop_2a6 = [
-        r"^\s*2B[-–]1\.",
-        r"^\s*2B\.",
-        r"^\s*2C[-–]1\.",
-    ]
-    lines_2a6 = slice_section_lines(pages, start_2a6, stop_2a6, safety_pages_ahead=2)
-
-    yesno_rx = _re.compile(r"\b(Yes|No)\b", _re.IGNORECASE)
+    lines_2a6 = slice_section_lines(pages, _START_2A6, _STOP_2A6, safety_pages_ahead=2)
+
+    yesno_rx = YESNO_RX
     val = "Empty"
     for ln in reversed(lines_2a6):
         m = yesno_rx.search(ln)
@@ -580,38 +633,40 @@ def custom_2a6(pages: Pages) -> dict[str, str]:
     return {"val_2a_6": val}
 
 
+_START_2B1 = compile_all([
+    r"^\s*2B[-–]1\.\s*PIT Count Date",
+    r"^\s*2B[-–]1\.\s*",
+], owner="custom_2b1")
+_STOP_2B1 = compile_all([
+    r"^\s*2B[-–]2\.",
+    r"^\s*2B[-–]3\.",
+    r"^\s*2C[-–]1\.",
+], owner="custom_2b1")
+
+
 def custom_2b1(pages: Pages) -> dict[str, str]:
-    start_2b1 = [
-        r"^\s*2B[-–]1\.\s*PIT Count Date",
-        r"^\s*2B[-–]1\.\s*",
-    ]
-    stop_2b1 = [
-        r"^\s*2B[-–]2\.",
-        r"^\s*2B[-–]3\.",
-        r"^\s*2C[-–]1\.",
-    ]
-    lines_2b1 = slice_section_lines(pages, start_2b1, stop_2b1, safety_pages_ahead=2)
-
-    date_rx = _re.compile(r"\b\d{2}/\d{2}/\d{4}\b")
-    dates = date_rx.findall("\n".join(lines_2b1))
+    lines_2b1 = slice_section_lines(pages, _START_2B1, _STOP_2B1, safety_pages_ahead=2)
+
+    dates = DATE_RX.findall("\n".join(lines_2b1))
     val = dates[-1] if dates else "Empty"
 
     return {"val_2b_1": val}
 
 
+_START_2B2 = compile_all([
+    r"^\s*2B[-–]2\.\s*PIT Count Data",
+    r"^\s*2B[-–]2\.\s*",
+], owner="custom_2b2")
+_STOP_2B2 = compile_all([
+    r"^\s*2B[-–]3\.",
+    r"^\s*2C[-–]1\.",
+], owner="custom_2b2")
+
+
 def custom_2b2(pages: Pages) -> dict[str, str]:
-    start_2b2 = [
-        r"^\s*2B[-–]2\.\s*PIT Count Data",
-        r"^\s*2B[-–]2\.\s*",
-    ]
-    stop_2b2 = [
-        r"^\s*2B[-–]3\.",
-        r"^\s*2C[-–]1\.",
-    ]
-    lines_2b2 = slice_section_lines(pages, start_2b2, stop_2b2, safety_pages_ahead=2)
-
-    date_rx = _re.compile(r"\b\d{2}/\d{2}/\d{4}\b")
-    dates = date_rx.findall("\n".join(lines_2b2))
+    lines_2b2 = slice_section_lines(pages, _START_2B2, _STOP_2B2, safety_pages_ahead=2)
+
+    dates = DATE_RX.findall("\n".join(lines_2b2))
     val = dates[-1] if dates else "Empty"
 
     return {"val_2b_2": val}
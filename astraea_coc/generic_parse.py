@@ -1,52 +1,141 @@
 # generic_parse.py
 from __future__ import annotations
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Sequence
 
 from .specs import TableSpec, NarrSpec
 from .slicer import slice_section_lines
 from .narratives import extract_narrative_after_limit
+from .section_cache import SectionCache, lines_digest, spec_fingerprint
+from .tracing import span
+from .budget import SectionBudget, SectionTimeout, limited
 
 
 Pages = Sequence[tuple[int, str]]
 
 
-def parse_tables(pages: Pages, table_specs: Sequence[TableSpec]) -> dict:
+def _cached(
+    cache: SectionCache | None,
+    spec,
+    input_digest: Callable[[], str],
+    compute: Callable[[], object],
+    variant: str = "",
+):
+    """
+    Result of ``compute()``, looked up by the spec's fingerprint plus its input
+    hash. ``variant`` separates result shapes of one spec (e.g. lean records).
+    """
+    if cache is None:
+        return compute()
+    key = cache.make_key(spec_fingerprint(spec) + variant, input_digest())
+    hit, value = cache.get(key)
+    if not hit:
+        value = compute()
+        cache.put(key, value)
+    return value
+
+
+def parse_tables(
+    pages: Pages,
+    table_specs: Sequence[TableSpec],
+    cache: SectionCache | None = None,
+    lean: bool = False,
+    budget: SectionBudget | None = None,
+) -> dict:
     """
     Run all TableSpecs and return dict {spec.key: df}.
-    Table parser signature: parser(lines) -> pd.DataFrame
+    Table parser signature: parser(lines, lean=False) -> pd.DataFrame
+
+    With ``lean=True`` parsers return lists of ``records`` NamedTuples instead
+    of DataFrames (a spec's ``post`` then receives that list).
+
+    With a ``cache``, a section is only parsed when its sliced lines or its
+    spec (anchors, parser, post) changed since a result was stored.
+
+    With a ``budget``, a section whose parser runs out of time gets the
+    parser's result for no lines instead (and nothing is cached for it).
     """
     out: dict[str, object] = {}
     for s in table_specs:
-        lines = slice_section_lines(
-            pages,
-            start_patterns=s.start,
-            stop_patterns=s.stop,
-            safety_pages_ahead=s.safety_pages_ahead,
-        )
-        df = s.parser(lines)
-        if s.post:
-            df = s.post(df)
-        out[s.key] = df
+        with span(s.key, "table"):
+            lines = slice_section_lines(
+                pages,
+                start_patterns=s.start_rx,
+                stop_patterns=s.stop_rx,
+                safety_pages_ahead=s.safety_pages_ahead,
+            )
+
+            def parse(lines):
+                df = s.parser(lines, lean=True) if lean else s.parser(lines)
+                if s.post:
+                    df = s.post(df)
+                return df
+
+            try:
+                out[s.key] = _cached(
+                    cache, s, lambda: lines_digest(lines), limited(budget, lambda: parse(lines)),
+                    ":lean" if lean else "",
+                )
+            except SectionTimeout:
+                out[s.key] = budget.expired(s.key, parse([]))
     return out
 
 
-def parse_narratives(pages: Pages, narr_specs: Sequence[NarrSpec]) -> dict:
+def parse_narratives(
+    pages: Pages,
+    narr_specs: Sequence[NarrSpec],
+    cache: SectionCache | None = None,
+    budget: SectionBudget | None = None,
+) -> dict:
     """
-    Run all NarrSpecs and return dict {spec.key: str}.
+    Run all NarrSpecs and return dict {spec.key: str}; a narrative over the
+    ``budget`` comes back as "".
     """
     out: dict[str, str] = {}
     for s in narr_specs:
-        lines = slice_section_lines(
-            pages,
-            start_patterns=s.anchor_start,
-            stop_patterns=s.anchor_stop,
-            safety_pages_ahead=s.safety_pages_ahead,
-        )
-        out[s.key] = extract_narrative_after_limit(
-            lines,
-            start_patterns=s.narr_start,
-            stop_patterns=s.narr_stop,
-            keep_paragraphs=True,
-        )
+        with span(s.key, "narrative"):
+            lines = slice_section_lines(
+                pages,
+                start_patterns=s.anchor_start_rx,
+                stop_patterns=s.anchor_stop_rx,
+                safety_pages_ahead=s.safety_pages_ahead,
+            )
+            try:
+                out[s.key] = _cached(
+                    cache, s, lambda: lines_digest(lines),
+                    limited(budget, lambda: extract_narrative_after_limit(
+                        lines,
+                        start_patterns=s.narr_start_rx,
+                        stop_patterns=s.narr_stop_rx,
+                        keep_paragraphs=True,
+                    )),
+                )
+            except SectionTimeout:
+                out[s.key] = budget.expired(s.key, "")
+    return out
+
+
+def run_blocks(
+    pages: Pages,
+    blocks: Sequence[Callable[[Pages], dict]],
+    cache: SectionCache | None = None,
+    doc_key: str | None = None,
+    budget: SectionBudget | None = None,
+) -> dict:
+    """
+    Run custom block functions (``block(pages) -> dict``) and merge their output.
+
+    Blocks slice the document themselves, so a cached result is keyed by the
+    block's fingerprint plus ``doc_key`` (see ``io_extract.document_key``);
+    without a ``doc_key`` nothing is cached. A block over the ``budget``
+    contributes no keys (its columns stay blank).
+    """
+    out: dict[str, object] = {}
+    for block in blocks:
+        with span(block.__name__, "block"):
+            run = limited(budget, lambda: block(pages))
+            try:
+                out.update(run() if doc_key is None else _cached(cache, block, lambda: doc_key, run))
+            except SectionTimeout:
+                budget.expired(block.__name__, None)
     return out
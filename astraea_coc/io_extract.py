@@ -1,30 +1,321 @@
-
 from __future__ import annotations
+import os
+import re
 from pathlib import Path
+from typing import Callable, Sequence
+
+from .backends import Backend, DEFAULT_BACKEND, OpenDoc, PdfSource, auto_ladder, get_backend
+from .page_cache import PageCache, content_digest
+from .pages import Pages
+from .patterns import as_patterns
+from .tracing import span
+from .budget import paused
+
+ENGINE_AUTO = "auto"
+
+# Bump when the way page text is produced changes, to invalidate cached pages.
+EXTRACT_SETTINGS_VERSION = 1
+
+# Documents with at least this many pages are sharded across processes.
+PARALLEL_PAGE_THRESHOLD = 60
+PAGES_PER_SHARD = 12
+# Most pages a lazy ``Pages`` asks for at once, however many shard processes
+# there are, so reading up to one anchor does not extract the whole document.
+LAZY_WINDOW_PAGES = 2 * PAGES_PER_SHARD
+
+
+def _engine_settings(engine: str) -> str:
+    names = [b.name for b in auto_ladder()] if engine == ENGINE_AUTO else [engine]
+    return engine_versions("+".join(names))
 
-def extract_pdf_text(pdf_path: Path) -> tuple[str, int, str]:
-    pages_text, engine = [], None
+
+def _extract_page_range(engine: str, pdf: PdfSource, start: int, stop: int) -> list[str]:
+    """Extract pages [start, stop) (0-based); runs in a worker process."""
+    with get_backend(engine).open(pdf) as doc:
+        return [doc.page_text(i) for i in range(start, stop)]
+
+
+def _resolve_page_jobs(page_jobs: int | None, n_pages: int) -> int:
+    if page_jobs is None:
+        page_jobs = (os.cpu_count() or 1) if n_pages >= PARALLEL_PAGE_THRESHOLD else 1
+    return max(1, min(page_jobs, -(-n_pages // PAGES_PER_SHARD)))
+
+
+def _open_with_fallback(backend: Backend, pdf_path: PdfSource) -> tuple[Backend, OpenDoc]:
     try:
-        import pdfplumber
-        with pdfplumber.open(pdf_path) as pdf:
-            for pg in pdf.pages:
-                pages_text.append(pg.extract_text() or "")
-        engine = "pdfplumber"
-        n_pages = len(pages_text)
+        return backend, backend.open(pdf_path)
     except Exception as e:
-        print(f"[info] pdfplumber failed: {e}\n[info] falling back to PyPDF2…")
-        import PyPDF2
-        with open(pdf_path, "rb") as f:
-            r = PyPDF2.PdfReader(f)
-            for p in r.pages:
-                pages_text.append(p.extract_text() or "")
-        engine = "PyPDF2"
-        n_pages = len(pages_text)
-
-    joined = []
-    for i, t in enumerate(pages_text, start=1):
-        joined.append(f"\n\n=== [PAGE {i}/{n_pages}] ===\n\n{t}")
-    return "".join(joined), n_pages, engine
+        if not backend.fallback:
+            raise
+        print(f"[info] {backend.name} failed: {e}\n[info] falling back to {backend.fallback}…")
+        return _open_with_fallback(get_backend(backend.fallback), pdf_path)
+
+
+class PageSource:
+    """
+    Extracts page ranges of one PDF on demand; the loader behind a lazy
+    ``Pages``. The document stays open between calls. Ranges longer than a
+    shard are spread over ``jobs`` worker processes. If the backend raises,
+    that range and every later one are extracted by its fallback instead
+    (``engine`` then reads e.g. ``"pdfplumber+PyPDF2"``). With ``data``, the
+    PDF's bytes already in memory, the file itself is never opened.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        pdf_path: Path,
+        page_jobs: int | None = None,
+        fallback: bool = True,
+        data: bytes | None = None,
+    ):
+        self.pdf_path = Path(pdf_path)
+        self.source: PdfSource = self.pdf_path if data is None else data
+        self.follow_fallback = fallback
+        self.extracted: dict[int, str] = {}    # 1-based page_no -> text, this session
+        self.on_close: Callable[["PageSource"], None] | None = None
+        self._pool = None
+        if fallback:
+            backend, doc = _open_with_fallback(backend, self.source)
+        else:
+            doc = backend.open(self.source)
+        self.backend, self._doc = backend, doc
+        self.engine = backend.name
+        self.n_pages = doc.n_pages
+        self.jobs = _resolve_page_jobs(page_jobs, self.n_pages)
+
+    @property
+    def window(self) -> int:
+        """Pages worth extracting per lazy call: a shard per worker, up to ``LAZY_WINDOW_PAGES``."""
+        return min(self.jobs * PAGES_PER_SHARD, LAZY_WINDOW_PAGES)
+
+    def _extract_sharded(self, start: int, stop: int) -> list[str]:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+        if self._pool is None:
+            # never fork: the caller may be a batch worker with threads running
+            method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(max_workers=self.jobs, mp_context=mp.get_context(method))
+        shards = [(a, min(a + PAGES_PER_SHARD, stop)) for a in range(start, stop, PAGES_PER_SHARD)]
+        futs = [
+            self._pool.submit(_extract_page_range, self.backend.name, self.source, a, b)
+            for a, b in shards
+        ]
+        # futures are kept in shard order, so page order is preserved
+        return [t for fut in futs for t in fut.result()]
+
+    def _extract(self, start: int, stop: int) -> list[str]:
+        if self._doc is None:
+            self._doc = self.backend.open(self.source)
+        if self.jobs > 1 and stop - start > PAGES_PER_SHARD:
+            try:
+                return self._extract_sharded(start, stop)
+            except Exception as e:
+                print(f"[info] parallel page extraction failed: {e}\n[info] extracting serially…")
+                self.jobs = 1
+        return [self._doc.page_text(i) for i in range(start, stop)]
+
+    def __call__(self, start: int, stop: int) -> list[str]:
+        """Texts of 0-based pages [start, stop)."""
+        try:
+            # extraction a section triggers is not charged to its time budget
+            with paused(), span("extract_pages", "extract", pages=f"{start + 1}-{stop}", engine=self.backend.name):
+                texts = self._extract(start, stop)
+        except Exception as e:
+            if not (self.follow_fallback and self.backend.fallback):
+                raise
+            print(f"[info] {self.backend.name} failed: {e}\n[info] falling back to {self.backend.fallback}…")
+            self._release()
+            backend, self._doc = _open_with_fallback(get_backend(self.backend.fallback), self.source)
+            self.engine = f"{self.engine}+{backend.name}" if self.extracted else backend.name
+            self.backend = backend
+            return self(start, stop)
+        self.extracted.update(zip(range(start + 1, stop + 1), texts))
+        return texts
+
+    def _release(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def close(self) -> None:
+        self._release()
+        if self.on_close is not None:
+            self.on_close(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _extract_with(
+    backend: Backend, pdf_path: Path, page_jobs: int | None, fallback: bool = False, data: bytes | None = None,
+) -> tuple[list[str], str]:
+    with PageSource(backend, pdf_path, page_jobs, fallback=fallback, data=data) as src:
+        return src(0, src.n_pages), src.engine
+
+
+def _extract_pages(
+    pdf_path: Path, engine: str, page_jobs: int | None = None, data: bytes | None = None,
+) -> tuple[list[str], str]:
+    return _extract_with(get_backend(engine), pdf_path, page_jobs, fallback=True, data=data)
+
+
+def default_anchors() -> list[tuple[re.Pattern, ...]]:
+    """
+    Start anchors of every TableSpec, as the specs precompiled them; each
+    inner tuple is one section's alternatives.
+    """
+    from .specs_2024 import TABLE_SPECS_2024
+    return [s.start_rx for s in TABLE_SPECS_2024]
+
+
+def anchor_score(pages_text: Sequence[str], anchors: Sequence[Sequence] | None = None) -> float:
+    """
+    Fraction of sections whose start anchor is found on some page. Anchors
+    may be precompiled or raw strings (compiled with the spec flags).
+    """
+    if anchors is None:
+        anchors = default_anchors()
+    if not anchors:
+        return 1.0
+    found = 0
+    for alternatives in anchors:
+        rxs = as_patterns(alternatives)
+        if any(rx.search(body) for rx in rxs for body in pages_text):
+            found += 1
+    return found / len(anchors)
+
+
+def _extract_auto(
+    pdf_path: Path,
+    page_jobs: int | None,
+    anchors: Sequence[Sequence] | None = None,
+    data: bytes | None = None,
+) -> tuple[list[str], str]:
+    """
+    Try cheap backends first and keep the first whose text contains every
+    section anchor; otherwise escalate to the full pdfplumber layout pass.
+    """
+    ladder = auto_ladder()
+    for backend in ladder[:-1]:
+        try:
+            pages_text, _ = _extract_with(backend, pdf_path, page_jobs, data=data)
+        except Exception as e:
+            print(f"[info] {backend.name} failed: {e}")
+            continue
+        score = anchor_score(pages_text, anchors)
+        if score >= 1.0:
+            return pages_text, backend.name
+        print(f"[info] {backend.name} found {score:.0%} of section anchors; escalating…")
+    return _extract_pages(pdf_path, ladder[-1].name, page_jobs, data=data)
+
+
+def extract_pages(
+    pdf_path: Path,
+    cache: PageCache | None = None,
+    page_jobs: int | None = None,
+    engine: str = DEFAULT_BACKEND,
+    lazy: bool = False,
+    data: bytes | None = None,
+    digest: str | None = None,
+) -> Pages:
+    """
+    Extract the pages of ``pdf_path`` into a ``Pages`` sequence of
+    ``(page_no, text)``; ``pages.engine`` is the backend that produced it.
+
+    With a ``cache``, page text is looked up by the PDF's content hash (plus
+    engine and settings) before anything is parsed, and stored after a miss.
+
+    ``page_jobs`` is the number of processes a single PDF's pages are sharded
+    across. ``None`` (auto) uses every CPU for documents of at least
+    ``PARALLEL_PAGE_THRESHOLD`` pages and stays serial below that; ``1``
+    disables sharding.
+
+    ``engine`` names a backend from ``backends.BACKENDS`` or is ``"auto"`` to
+    pick the cheapest backend whose text still contains every section anchor.
+
+    With ``lazy=True`` only the page count is read up front; page text is
+    extracted the first time a page is touched, a window of ``PageSource.window``
+    pages at a time. Close the returned ``Pages`` (or use it as a context
+    manager) to release the document and store whatever was extracted in the
+    cache. ``"auto"`` has to score every page, so it is never lazy.
+
+    ``data`` is the PDF's bytes when the caller already read them (see
+    ``prefetch.py``); the file is then not opened again. ``digest`` is the
+    PDF's ``content_digest`` when the caller already has it.
+    """
+    known: dict[int, str] = {}
+    used = None
+    if cache is not None:
+        digest = digest or content_digest(pdf_path, data)
+        settings = _engine_settings(engine)
+        hit = cache.get_pages(digest, engine, settings)
+        if hit is not None:
+            known, n_pages, used = hit
+            if len(known) == n_pages:
+                return Pages([known[p] for p in range(1, n_pages + 1)], engine=used)
+
+    if engine == ENGINE_AUTO:
+        pages_text, used = _extract_auto(pdf_path, page_jobs, data=data)
+        if cache is not None:
+            cache.put(digest, engine, settings, pages_text, used)
+        return Pages(pages_text, engine=used)
+
+    src = PageSource(get_backend(engine), pdf_path, page_jobs, data=data)
+    if used != src.engine:
+        known = {}  # partial entry from a different (fallback) backend
+    if cache is not None:
+        def _store(s: PageSource) -> None:
+            if s.extracted:
+                cache.put_pages(digest, engine, settings, s.extracted, s.n_pages, s.engine)
+        src.on_close = _store
+
+    pages = Pages.lazy(src.n_pages, src, chunk=src.window, known=known)
+    if not lazy:
+        with pages:
+            pages.texts()
+    return pages
+
+
+def extract_pdf_text(
+    pdf_path: Path,
+    cache: PageCache | None = None,
+    page_jobs: int | None = None,
+    engine: str = DEFAULT_BACKEND,
+) -> tuple[str, int, str]:
+    """
+    Marker-joined form of ``extract_pages``: ``(text, n_pages, engine)``.
+    Prefer ``extract_pages`` unless the dump itself is needed.
+    """
+    pages = extract_pages(pdf_path, cache=cache, page_jobs=page_jobs, engine=engine)
+    return pages.to_text(), len(pages), pages.engine
+
+
+def document_key(pdf_path: Path, engine: str, data: bytes | None = None, digest: str | None = None) -> str:
+    """
+    Identity of a document's page text: the PDF's content hash plus the
+    engine(s) that produced it and their versions (``engine`` as reported by
+    ``Pages.engine``, e.g. ``"pdfplumber+PyPDF2"`` after a fallback).
+    ``data`` is the PDF's bytes, if already read; ``digest`` their hash, if known.
+    """
+    return f"{digest or content_digest(pdf_path, data)}:{engine_versions(engine)}"
+
+
+def engine_versions(engine: str) -> str:
+    """
+    The extraction half of ``document_key``: ``EXTRACT_SETTINGS_VERSION`` and
+    the library version of each backend in ``engine``, e.g.
+    ``"v1;pdfplumber=0.11.4"``. Stored rows made under another one are stale.
+    """
+    versions = ",".join(f"{n}={get_backend(n).version()}" for n in engine.split("+"))
+    return f"v{EXTRACT_SETTINGS_VERSION};{versions}"
+
 
 def split_pages_by_markers(text: str):
     import re
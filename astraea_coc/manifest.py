@@ -0,0 +1,147 @@
+# manifest.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+
+# Modules whose code decides what ends up in a wide row. Editing any of them
+# changes the parser fingerprint and makes every stored row stale.
+PARSER_MODULES = (
+    "specs_2024.py",
+    "specs.py",
+    "custom_blocks.py",
+    "parsers.py",
+    "records.py",
+    "generic_parse.py",
+    "narratives.py",
+    "slicer.py",
+    "section_index.py",
+    "patterns.py",
+    "meta.py",
+    "utils.py",
+    "build_wide.py",
+    "pipeline.py",
+    # page text: a change here reaches the rows through the text it extracts
+    "pages.py",
+    "io_extract.py",
+    "backends.py",
+)
+
+
+@lru_cache(maxsize=None)
+def parser_fingerprint() -> str:
+    """Hash of the parser/spec source files listed in ``PARSER_MODULES``."""
+    here = Path(__file__).resolve().parent
+    h = hashlib.sha256()
+    for name in PARSER_MODULES:
+        h.update(name.encode() + b"\0")
+        h.update((here / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+class Manifest:
+    """
+    Per-PDF record of the last successful parse in a batch run: content hash,
+    size and mtime, page count, engine, extraction settings and backend
+    versions, parser fingerprint and the resulting wide rows.
+
+    A PDF whose hash, requested engine and parser fingerprint all match its
+    entry, and whose backends are still at the recorded versions, is "fresh"
+    and its stored rows are reused instead of re-parsing.
+
+    ``unchanged`` answers the same from the file's size and mtime, without
+    reading it, and is what a batch run uses by default. That is weaker than
+    the hash: a file rewritten in place with the same size and an mtime set
+    back to the old one (``touch -d``, ``cp -p``, some sync tools) still
+    counts as unchanged. ``fresh`` (the batch's ``--verify``) hashes instead.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: dict[str, dict] = {}
+        if self.path.is_file():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"[info] ignoring unreadable manifest {self.path}: {e}")
+                data = {}
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data.get("entries", {})
+
+    @staticmethod
+    def key(pdf: Path) -> str:
+        return str(Path(pdf).resolve())
+
+    def previous(self, pdf: Path) -> dict | None:
+        """The stored entry whatever its inputs (e.g. for its page count and timing)."""
+        return self.entries.get(self.key(pdf))
+
+    @staticmethod
+    def _same_extraction(e: dict) -> bool:
+        # the text would come out of the same backends at the same versions
+        from .io_extract import engine_versions
+        return bool(e.get("engine_used")) and e.get("extract") == engine_versions(e["engine_used"])
+
+    def fresh(self, pdf: Path, digest: str, engine: str, parser: str) -> dict | None:
+        """The stored entry if it is still valid for these inputs, else None."""
+        e = self.entries.get(self.key(pdf))
+        if e and e["digest"] == digest and e["engine"] == engine and e["parser"] == parser and self._same_extraction(e):
+            return e
+        return None
+
+    def unchanged(self, pdf: Path, stat: os.stat_result, engine: str, parser: str) -> dict | None:
+        """
+        The stored entry if the PDF's size and mtime (``stat``), engine and
+        parser are as recorded, else None. Entries written before sizes were
+        recorded fall back to hashing the file.
+        """
+        e = self.entries.get(self.key(pdf))
+        if not e or e["engine"] != engine or e["parser"] != parser or not self._same_extraction(e):
+            return None
+        if "size" not in e:
+            from .page_cache import file_digest
+            return self.fresh(pdf, file_digest(pdf), engine, parser)
+        if e["size"] == stat.st_size and e["mtime_ns"] == stat.st_mtime_ns:
+            return e
+        return None
+
+    def record(
+        self,
+        pdf: Path,
+        digest: str,
+        engine: str,
+        parser: str,
+        n_pages: int,
+        engine_used: str,
+        columns: list[str],
+        rows: list[list],
+        seconds: float | None = None,
+        stat: os.stat_result | None = None,
+    ) -> None:
+        """``stat`` is the file's, taken before it was read, for ``unchanged``."""
+        from .io_extract import engine_versions
+        self.entries[self.key(pdf)] = {
+            "digest": digest,
+            "engine": engine,            # as requested, e.g. "auto"
+            "engine_used": engine_used,  # backend that produced the text
+            "extract": engine_versions(engine_used),
+            "parser": parser,
+            "n_pages": n_pages,
+            "seconds": seconds,          # parse time, for scheduling the next run
+            "columns": columns,
+            "rows": rows,
+        }
+        if stat is not None:
+            self.entries[self.key(pdf)].update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    def save(self) -> None:
+        """Write atomically, so an interrupted run keeps the previous manifest."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        data = {"version": MANIFEST_VERSION, "entries": self.entries}
+        tmp.write_text(json.dumps(data, default=str), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -1,23 +1,69 @@
-
 from __future__ import annotations
 import re
+from itertools import islice
 from typing import Sequence
 
-def find_first(pattern: str, pages: Sequence[tuple[int, str]], flags=re.IGNORECASE|re.MULTILINE):
-    rx = re.compile(pattern, flags)
+from .patterns import as_patterns, compile_all
+
+# 1A metadata lives on the first pages; later pages only repeat the
+# "Applicant: ... NJ-509" running header, which the fallbacks would match.
+META_MAX_PAGES = 5
+
+# field -> alternatives in priority order (a fallback is only used if the
+# primary pattern is found nowhere in the scanned pages)
+META_FIELDS = {
+    "coc_number": compile_all([
+        r"CoC\s+(?:Number|ID)\s*[:\-]\s*([A-Z]{2}\-\d{3})",
+        r"Applicant:\s*(?:.+?)\s+([A-Z]{2}\-\d{3})\b",
+    ], owner="1a coc_number"),
+    "coc_name": compile_all([
+        r"CoC\s+(?:Name|Title)\s*[:\-]\s*([^\n]+?)\s*(?:\r?\n|$)",
+        r"Applicant:\s*([A-Za-z0-9 ,&'()\-/]+?)\s+[A-Z]{2}\-\d{3}\b",
+    ], owner="1a coc_name"),
+    "collab_app": compile_all([
+        r"Collaborative Applicant(?:\s*Name)?\s*[:\-]\s*([^\n]+?)\s*(?:\r?\n|$)",
+    ], owner="1a collab_app"),
+    "designation": compile_all([
+        r"CoC\s+Designation\s*[:\-]\s*([A-Z]{1,3})",
+    ], owner="1a designation"),
+    "hmis_lead": compile_all([
+        r"HMIS\s+Lead\s*[:\-]\s*([^\n]+?)\s*(?:\r?\n|$)",
+    ], owner="1a hmis_lead"),
+}
+
+
+def _hit(m: re.Match, pno: int) -> dict:
+    val = m.group(1).strip() if m.lastindex else m.group(0).strip()
+    return {"value": val, "page": pno, "match": m.group(0).strip()}
+
+
+def find_first(pattern, pages: Sequence[tuple[int, str]], flags=re.IGNORECASE|re.MULTILINE):
+    (rx,) = as_patterns([pattern], flags)
     for pno, body in pages:
         m = rx.search(body)
         if m:
-            val = m.group(1).strip() if m.lastindex else m.group(0).strip()
-            return {"value": val, "page": pno, "match": m.group(0).strip()}
+            return _hit(m, pno)
     return None
 
-def parse_1a_metadata(pages: Sequence[tuple[int, str]]):
-    meta = {}
-    meta["coc_number"] = find_first(r"CoC\s+(?:Number|ID)\s*[:\-]\s*([A-Z]{2}\-\d{3})", pages)         or find_first(r"Applicant:\s*(?:.+?)\s+([A-Z]{2}\-\d{3})\b", pages)
-    meta["coc_name"]   = find_first(r"CoC\s+(?:Name|Title)\s*[:\-]\s*([^\n]+?)\s*(?:\r?\n|$)", pages)         or find_first(r"Applicant:\s*([A-Za-z0-9 ,&'()\-/]+?)\s+[A-Z]{2}\-\d{3}\b", pages)
-    meta["collab_app"] = find_first(r"Collaborative Applicant(?:\s*Name)?\s*[:\-]\s*([^\n]+?)\s*(?:\r?\n|$)", pages)
-    meta["designation"]= find_first(r"CoC\s+Designation\s*[:\-]\s*([A-Z]{1,3})", pages)
-    meta["hmis_lead"]  = find_first(r"HMIS\s+Lead\s*[:\-]\s*([^\n]+?)\s*(?:\r?\n|$)", pages)
+def parse_1a_metadata(pages: Sequence[tuple[int, str]], max_pages: int | None = META_MAX_PAGES):
+    """
+    One pass over the first ``max_pages`` pages (all pages if None), trying
+    every still-missing field on each page.
+    """
+    found = {k: [None] * len(alts) for k, alts in META_FIELDS.items()}
+    pending = {k: list(range(len(alts))) for k, alts in META_FIELDS.items()}
+    for pno, body in islice(pages, max_pages):
+        for k, alts in META_FIELDS.items():
+            for j in list(pending[k]):
+                m = alts[j].search(body)
+                if m:
+                    found[k][j] = _hit(m, pno)
+                    pending[k].remove(j)
+            # once the primary pattern hit, fallbacks are irrelevant
+            if found[k][0] is not None:
+                pending[k] = []
+        if not any(pending.values()):
+            break
+    meta = {k: next((h for h in hits if h is not None), None) for k, hits in found.items()}
     meta_vals = {k: (v["value"] if v else "") for k, v in meta.items()}
     return meta_vals, meta
@@ -0,0 +1,195 @@
+# page_cache.py
+from __future__ import annotations
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Mapping, Sequence
+
+CACHE_DIR_ENV = "ASTRAEA_CACHE_DIR"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB of compressed page text
+
+
+def default_cache_dir() -> Path:
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "astraea_coc"
+
+
+def file_digest(pdf_path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def content_digest(pdf_path: Path, data: bytes | None = None) -> str:
+    """``file_digest(pdf_path)``, or the same hash of the PDF's bytes when already read."""
+    return file_digest(pdf_path) if data is None else hashlib.sha256(data).hexdigest()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    key       TEXT PRIMARY KEY,
+    digest    TEXT NOT NULL,
+    engine    TEXT NOT NULL,
+    settings  TEXT NOT NULL,
+    used      TEXT NOT NULL,
+    n_pages   INTEGER NOT NULL,
+    nbytes    INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    key     TEXT NOT NULL,
+    page_no INTEGER NOT NULL,
+    text    BLOB NOT NULL,
+    PRIMARY KEY (key, page_no)
+);
+"""
+
+
+class PageCache:
+    """
+    On-disk cache of extracted page text in a single SQLite file.
+
+    Entries are keyed by the PDF's content hash plus the extraction engine and
+    its settings, so renaming/moving a PDF still hits and upgrading the engine
+    misses. Page text is stored zlib-compressed, one row per page. When the
+    compressed total exceeds ``max_bytes`` the least recently used documents
+    are evicted.
+    """
+
+    def __init__(self, path: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path) if path else default_cache_dir() / "pages.sqlite"
+        self.max_bytes = int(max_bytes)
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    # connections must not cross a fork, so open one lazily per process
+    def __getstate__(self):
+        return {"path": self.path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["max_bytes"])
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(digest: str, engine: str, settings: str = "") -> str:
+        return hashlib.sha256(f"{digest}\0{engine}\0{settings}".encode()).hexdigest()
+
+    def get(self, digest: str, engine: str, settings: str = "") -> tuple[list[str], str] | None:
+        """Return ``(page_texts, engine_used)``, or None on a miss or partial entry."""
+        hit = self.get_pages(digest, engine, settings)
+        if hit is None:
+            return None
+        texts, n_pages, used = hit
+        if len(texts) != n_pages:
+            return None
+        return [texts[p] for p in range(1, n_pages + 1)], used
+
+    def get_pages(self, digest: str, engine: str, settings: str = "") -> tuple[dict[int, str], int, str] | None:
+        """
+        Return ``(texts_by_page_no, n_pages, engine_used)``; the dict may hold
+        only some pages when the document was extracted lazily.
+        """
+        key = self.make_key(digest, engine, settings)
+        db = self._db()
+        row = db.execute("SELECT used, n_pages FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        used, n_pages = row
+        blobs = db.execute(
+            "SELECT page_no, text FROM pages WHERE key = ? ORDER BY page_no", (key,)
+        ).fetchall()
+        db.execute("UPDATE docs SET last_used = ? WHERE key = ?", (time.time(), key))
+        return {p: zlib.decompress(b).decode("utf-8") for p, b in blobs}, n_pages, used
+
+    def put(self, digest: str, engine: str, settings: str, pages: Sequence[str], used: str) -> None:
+        texts = dict(enumerate(pages, start=1))
+        self.put_pages(digest, engine, settings, texts, len(texts), used, replace=True)
+
+    def put_pages(
+        self,
+        digest: str,
+        engine: str,
+        settings: str,
+        pages: Mapping[int, str],
+        n_pages: int,
+        used: str,
+        replace: bool = False,
+    ) -> None:
+        """
+        Store some pages (1-based) of a document. Pages already cached for the
+        same key are kept unless ``replace`` is set or they came from another
+        engine (a fallback), in which case the entry starts over.
+        """
+        key = self.make_key(digest, engine, settings)
+        rows = [(key, p, zlib.compress(t.encode("utf-8"), 6)) for p, t in pages.items()]
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            row = db.execute("SELECT used FROM docs WHERE key = ?", (key,)).fetchone()
+            if replace or (row is not None and row[0] != used):
+                db.execute("DELETE FROM pages WHERE key = ?", (key,))
+            db.executemany("INSERT OR REPLACE INTO pages (key, page_no, text) VALUES (?, ?, ?)", rows)
+            (nbytes,) = db.execute(
+                "SELECT COALESCE(SUM(LENGTH(text)), 0) FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+            db.execute(
+                "INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, digest, engine, settings, used, n_pages, nbytes, time.time()),
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        self.evict()
+
+    def total_bytes(self) -> int:
+        (n,) = self._db().execute("SELECT COALESCE(SUM(nbytes), 0) FROM docs").fetchone()
+        return int(n)
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """Drop least recently used documents until under budget; return count dropped."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        db = self._db()
+        total = self.total_bytes()
+        if total <= budget:
+            return 0
+        dropped = 0
+        victims = db.execute("SELECT key, nbytes FROM docs ORDER BY last_used").fetchall()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for key, nbytes in victims:
+                if total <= budget:
+                    break
+                db.execute("DELETE FROM pages WHERE key = ?", (key,))
+                db.execute("DELETE FROM docs WHERE key = ?", (key,))
+                total -= nbytes
+                dropped += 1
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return dropped
+
+    def clear(self) -> None:
+        db = self._db()
+        db.execute("DELETE FROM pages")
+        db.execute("DELETE FROM docs")
+        db.execute("VACUUM")
@@ -0,0 +1,156 @@
+# pages.py
+from __future__ import annotations
+from typing import Callable, Iterator, Mapping, Sequence
+
+# loader(start, stop) -> texts of 0-based pages [start, stop)
+PageLoader = Callable[[int, int], list]
+
+
+class Pages(Sequence):
+    """
+    Page texts of one document as a sequence of ``(page_no, text)`` tuples
+    (1-based), which is what the slicer and every parser iterate over.
+
+    Page text is held once; the ``=== [PAGE i/n] ===`` marker dump is only
+    built by ``to_text()`` when a text artifact is actually written.
+
+    A lazy ``Pages`` (see ``Pages.lazy``) knows its page count up front but
+    only pulls page text from its loader when a page is first touched, so
+    pages past the last anchor a parser looks for are never extracted.
+    """
+
+    def __init__(self, texts: Sequence[str], engine: str | None = None):
+        self._texts: list[str | None] = list(texts)
+        self._engine = engine
+        self._source = None
+        self._chunk = 1
+        self._section_index = None
+
+    @classmethod
+    def lazy(
+        cls,
+        n_pages: int,
+        loader: PageLoader,
+        engine: str | None = None,
+        chunk: int = 1,
+        known: Mapping[int, str] | None = None,
+    ) -> "Pages":
+        """
+        Pages backed by ``loader``, called for at least ``chunk`` pages at a time.
+        ``known`` maps 1-based page numbers to text that is already available.
+        If the loader has ``engine`` / ``close`` attributes they are used too.
+        """
+        pages = cls([None] * n_pages, engine=engine)
+        for pno, text in (known or {}).items():
+            pages._texts[pno - 1] = text
+        pages._source = loader
+        pages._chunk = max(1, chunk)
+        return pages
+
+    @classmethod
+    def from_text(cls, text: str, engine: str | None = None) -> "Pages":
+        """Rebuild from a marker-joined dump (e.g. a saved ``__text_*.txt``)."""
+        from .io_extract import split_pages_by_markers
+        bodies = [body for _, body in split_pages_by_markers(text)]
+        # undo the blank lines to_text() puts around each marker
+        bodies = [b[1:] if b.startswith("\n") else b for b in bodies]
+        bodies = [b[:-1] if b.endswith("\n") else b for b in bodies[:-1]] + bodies[-1:]
+        return cls(bodies, engine=engine)
+
+    @property
+    def engine(self) -> str | None:
+        # a loader may fall back to another backend part way through
+        return getattr(self._source, "engine", None) or self._engine
+
+    def _load(self, start: int, stop: int) -> None:
+        """Make 0-based pages [start, stop) available."""
+        texts = self._texts
+        i = start
+        while i < stop:
+            if texts[i] is not None:
+                i += 1
+                continue
+            j = i + 1
+            end = min(max(stop, i + self._chunk), len(texts))
+            while j < end and texts[j] is None:
+                j += 1
+            texts[i:j] = self._source(i, j)
+            i = j
+
+    def _page(self, i: int) -> str:
+        text = self._texts[i]
+        if text is None:
+            self._load(i, i + 1)
+            text = self._texts[i]
+        return text
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            idx = range(*i.indices(len(self._texts)))
+            if idx:
+                self._load(min(idx), max(idx) + 1)
+            return [(k + 1, self._texts[k]) for k in idx]
+        if i < 0:
+            i += len(self._texts)
+        if not 0 <= i < len(self._texts):
+            raise IndexError("page index out of range")
+        return (i + 1, self._page(i))
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        for i in range(len(self._texts)):
+            yield (i + 1, self._page(i))
+
+    @property
+    def section_index(self):
+        """Numbered-header index, built on first use (see ``section_index.py``)."""
+        if self._section_index is None:
+            from .section_index import SectionIndex
+            self._section_index = SectionIndex(self)
+        return self._section_index
+
+    @property
+    def n_pages(self) -> int:
+        return len(self._texts)
+
+    @property
+    def n_loaded(self) -> int:
+        """Pages whose text has been extracted (or was known) so far."""
+        return sum(t is not None for t in self._texts)
+
+    def text(self, page_no: int) -> str:
+        return self._page(page_no - 1)
+
+    def texts(self) -> list[str]:
+        self._load(0, len(self._texts))
+        return list(self._texts)
+
+    def span(self, first: int, last: int) -> list[tuple[int, str]]:
+        """Pages ``first..last`` inclusive, clipped to the document."""
+        first = max(first, 1)
+        last = min(last, len(self._texts))
+        if first > last:
+            return []
+        self._load(first - 1, last)
+        return [(p, self._texts[p - 1]) for p in range(first, last + 1)]
+
+    def to_text(self) -> str:
+        texts = self.texts()
+        n = len(texts)
+        return "".join(
+            f"\n\n=== [PAGE {i}/{n}] ===\n\n{t}" for i, t in enumerate(texts, start=1)
+        )
+
+    def close(self) -> None:
+        """Release the loader (open document, worker pool); loaded text stays usable."""
+        close = getattr(self._source, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,13 +1,49 @@
 
 from __future__ import annotations
 import re
-import pandas as pd
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from .utils import norm_token
-
-def parse_triple_table(norm_lines: list[str]) -> pd.DataFrame:
-    TOK = r"(Yes|No|Nonexistent)"
-    TRIPLE_RX = re.compile(rf"\b{TOK}\s+{TOK}\s+{TOK}\b$", flags=re.IGNORECASE)
-    LEAD_RX   = re.compile(r"^(\d+)\.\s*(.*)$")
+from .patterns import compile_re
+from .records import BedRow, DualRow, PhaRow, TripleRow, YesNoRow
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Every table parser takes ``lean``: False (default) returns the usual small
+# DataFrame, True returns a sorted list of the matching records.* NamedTuple,
+# which is what the batch pipeline uses so no per-section frames are built.
+
+_TOK = r"(Yes|No|Nonexistent)"
+TRIPLE_RX = compile_re(rf"\b{_TOK}\s+{_TOK}\s+{_TOK}\b$", flags=re.IGNORECASE)
+TRIPLE_LEAD_RX = compile_re(r"^(\d+)\.\s*(.*)$")
+YESNO_LEAD_RX = compile_re(r"^(\d+)[\.\)\-]?\s*(.*)$")
+DUAL_LEAD_RX = compile_re(r"^(\d+)[\.\)\-]?\s+(.*)$")
+DUAL_TOK_RX = compile_re(rf"{_TOK}\b", re.IGNORECASE)
+DUAL_TAIL_RX = compile_re(rf"{_TOK}\s+{_TOK}\s*$", re.IGNORECASE)
+PERCENT_RX = compile_re(r"(\d+)%")
+PERCENT_ROW_RX = compile_re(r"\d+%\s")
+ROW_ONE_RX = compile_re(r"(?:^|\s)1[\.\)]\s")
+_WS_RX = compile_re(r"\s+")
+
+# OCR tolerant "beds" (allows b e d s with spaces)
+_BEDS = r"b\s*e\s*d\s*s?"
+BED_ROW_RX = compile_re(
+    rf"(?:^|\s)([1-6])[\.\)]\s*"      # row number 1..6
+    rf"(.+?)\s+{_BEDS}\s+"             # project type up to 'beds'
+    rf"(\d+)\s+(\d+)\s+(\d+)\s+"     # three integer columns
+    rf"(\d+(?:\.\d+)?)\s*%?",        # percent, % optional
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
+def _yesno_tok_rx(allowed: tuple[str, ...]) -> re.Pattern:
+    return compile_re(rf"\b({'|'.join(allowed)})\b[.\s]*$", re.IGNORECASE)
+
+
+def parse_triple_table(norm_lines: list[str], lean: bool = False) -> pd.DataFrame | list[TripleRow]:
+    LEAD_RX = TRIPLE_LEAD_RX
 
     def has_triple(s: str) -> bool:
         return TRIPLE_RX.search(s) is not None
@@ -38,7 +74,7 @@ def parse_triple_table(norm_lines: list[str]) -> pd.DataFrame:
             continue
 
         tokens = extract_triple(full)
-        clean_label = re.sub(r"\s+", " ", strip_triple(full)).strip()
+        clean_label = _WS_RX.sub(" ", strip_triple(full)).strip()
 
         rows.append({
             "org_type_index": idx,
@@ -47,23 +83,32 @@ def parse_triple_table(norm_lines: list[str]) -> pd.DataFrame:
             "voted": norm_token(tokens[1]),
             "ces": norm_token(tokens[2]),
         })
+    allowed = {"Yes","No","Nonexistent"}
+    if lean:
+        recs = sorted((TripleRow(**r) for r in rows), key=lambda r: r.org_type_index)
+        assert all(
+            {r.meetings, r.voted, r.ces} <= allowed for r in recs
+        ), "Unexpected tokens detected in 1B-1."
+        return recs
+    import pandas as pd
     if not rows:
         return pd.DataFrame(columns=[
             "org_type_index", "org_type", "meetings", "voted", "ces"
         ])
 
-    df = pd.DataFrame(rows).sort_values("org_type_index").reset_index(drop=True)
+    df = pd.DataFrame(rows).sort_values("org_type_index", kind="stable").reset_index(drop=True)
 
-    allowed = {"Yes","No","Nonexistent"}
     for c in ["meetings","voted","ces"]:
         df[c] = df[c].apply(norm_token)
     if not df.empty:
         assert df[["meetings","voted","ces"]].isin(allowed).all(axis=1).all(), "Unexpected tokens detected in 1B-1."
     return df
 
-def parse_numbered_yesno(norm_lines: list[str], allowed=("Yes","No","Nonexistent")) -> pd.DataFrame:
-    LEAD = re.compile(r"^(\d+)[\.\)\-]?\s*(.*)$")
-    TOK = re.compile(rf"\b({'|'.join(allowed)})\b[.\s]*$", re.IGNORECASE)
+def parse_numbered_yesno(
+    norm_lines: list[str], allowed=("Yes","No","Nonexistent"), lean: bool = False
+) -> pd.DataFrame | list[YesNoRow]:
+    LEAD = YESNO_LEAD_RX
+    TOK = _yesno_tok_rx(tuple(allowed))
 
     rows, i = [], 0
     while i < len(norm_lines):
@@ -86,10 +131,14 @@ def parse_numbered_yesno(norm_lines: list[str], allowed=("Yes","No","Nonexistent
             continue
 
         value = norm_token(m2.group(1).title())
-        label_clean = re.sub(r"\s+", " ", full[:m2.start()].strip())
+        label_clean = _WS_RX.sub(" ", full[:m2.start()].strip())
 
         rows.append({"index": idx, "label": label_clean, "value": value})
 
+    if lean:
+        return sorted((YesNoRow(**r) for r in rows), key=lambda r: r.index)
+
+    import pandas as pd
     # ---- NEW robustness guard ----
     if not rows:
         # return an empty DF with the expected schema
@@ -101,13 +150,14 @@ def parse_numbered_yesno(norm_lines: list[str], allowed=("Yes","No","Nonexistent
     if "index" not in df.columns:
         return pd.DataFrame(columns=["index", "label", "value"])
 
-    df = df.sort_values("index").reset_index(drop=True)
+    df = df.sort_values("index", kind="stable").reset_index(drop=True)
     return df
 
 def parse_numbered_dual_tokens(norm_lines, suffixes=("left","right"),
-                               allowed=("Yes","No","Nonexistent")) -> pd.DataFrame:
-    LEAD = re.compile(r"^(\d+)[\.\)\-]?\s+(.*)$")
-    TOK  = re.compile(rf"(Yes|No|Nonexistent)\b", re.IGNORECASE)
+                               allowed=("Yes","No","Nonexistent"),
+                               lean: bool = False) -> pd.DataFrame | list[DualRow]:
+    LEAD = DUAL_LEAD_RX
+    TOK  = DUAL_TOK_RX
 
     rows, i = [], 0
     while i < len(norm_lines):
@@ -136,18 +186,23 @@ def parse_numbered_dual_tokens(norm_lines, suffixes=("left","right"),
         val0 = norm_token(toks[-2])
         val1 = norm_token(toks[-1])
 
-        tail = re.search(r"(Yes|No|Nonexistent)\s+(Yes|No|Nonexistent)\s*$", full, flags=re.IGNORECASE)
+        tail = DUAL_TAIL_RX.search(full)
         clean_label = full[:tail.start()].strip() if tail else full
 
         rows.append({"index": idx, "label": clean_label, suffixes[0]: val0, suffixes[1]: val1})
 
+    if lean:
+        recs = (DualRow(r["index"], r["label"], r[suffixes[0]], r[suffixes[1]]) for r in rows)
+        return sorted(recs, key=lambda r: r.index)
+
+    import pandas as pd
     if not rows:
         return pd.DataFrame(columns=["index", "label", suffixes[0], suffixes[1]])
 
-    df = pd.DataFrame(rows).sort_values("index").reset_index(drop=True)
+    df = pd.DataFrame(rows).sort_values("index", kind="stable").reset_index(drop=True)
     return df
 
-def parse_1c7_pha(norm_lines: list[str]) -> pd.DataFrame:
+def parse_1c7_pha(norm_lines: list[str], lean: bool = False) -> pd.DataFrame | list[PhaRow]:
     """
     Parse the 1C-7 PHA table into rows:
       pha_name, ph_hhm (percent), ph_limit_hhm (homeless pref text), psh (Yes/No).
@@ -180,12 +235,12 @@ def parse_1c7_pha(norm_lines: list[str]) -> pd.DataFrame:
             continue
 
         # new row line if it contains a percentage
-        if re.search(r"\d+%\s", ln):
+        if PERCENT_ROW_RX.search(ln):
             # flush previous pending row (if any)
             if pending is not None:
                 full = pending["line"]
                 cont = pending["cont"]
-                m = re.search(r"(\d+)%", full)
+                m = PERCENT_RX.search(full)
                 if m:
                     name = full[:m.start()].strip()
                     # continuation lines belong to the name (e.g., "Affairs")
@@ -215,7 +270,7 @@ def parse_1c7_pha(norm_lines: list[str]) -> pd.DataFrame:
     if pending is not None:
         full = pending["line"]
         cont = pending["cont"]
-        m = re.search(r"(\d+)%", full)
+        m = PERCENT_RX.search(full)
         if m:
             name = full[:m.start()].strip()
             if cont:
@@ -232,10 +287,13 @@ def parse_1c7_pha(norm_lines: list[str]) -> pd.DataFrame:
                     "psh": psh,
                 })
 
+    if lean:
+        return [PhaRow(**r) for r in rows]
+    import pandas as pd
     return pd.DataFrame(rows)
 
 
-def parse_2a5_bed_coverage(lines: list[str]) -> pd.DataFrame:
+def parse_2a5_bed_coverage(lines: list[str], lean: bool = False) -> pd.DataFrame | list[BedRow]:
     """
     Parse 2A-5 Bed Coverage Rate table.
 
@@ -243,26 +301,15 @@ def parse_2a5_bed_coverage(lines: list[str]) -> pd.DataFrame:
       1. Emergency Shelter (ES) beds 80 30 110 100.00%
     """
     text = " ".join(ln.strip() for ln in lines if ln.strip())
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RX.sub(" ", text)
 
     # --- NEW: drop everything before the first numbered row ---
-    m0 = re.search(r"(?:^|\s)1[\.\)]\s", text)
+    m0 = ROW_ONE_RX.search(text)
     if m0:
         text = text[m0.start():]
 
-    # OCR tolerant "beds" (allows b e d s with spaces)
-    beds_rx = r"b\s*e\s*d\s*s?"
-
-    row_rx = re.compile(
-        rf"(?:^|\s)([1-6])[\.\)]\s*"      # row number 1..6
-        rf"(.+?)\s+{beds_rx}\s+"         # project type up to 'beds'
-        rf"(\d+)\s+(\d+)\s+(\d+)\s+"     # three integer columns
-        rf"(\d+(?:\.\d+)?)\s*%?",        # percent, % optional
-        re.IGNORECASE
-    )
-
     rows = []
-    for m in row_rx.finditer(text):
+    for m in BED_ROW_RX.finditer(text):
         idx = int(m.group(1))
         proj = m.group(2).strip()
         non_vsp = m.group(3)
@@ -279,6 +326,10 @@ def parse_2a5_bed_coverage(lines: list[str]) -> pd.DataFrame:
             "coverage_rate": rate,
         })
 
+    if lean:
+        return sorted((BedRow(**r) for r in rows), key=lambda r: r.index)
+
+    import pandas as pd
     if not rows:
         return pd.DataFrame(columns=[
             "index","project_type",
@@ -286,4 +337,4 @@ def parse_2a5_bed_coverage(lines: list[str]) -> pd.DataFrame:
             "total_hmis_plus_vsp_beds","coverage_rate",
         ])
 
-    return pd.DataFrame(rows).sort_values("index").reset_index(drop=True)
+    return pd.DataFrame(rows).sort_values("index", kind="stable").reset_index(drop=True)
@@ -0,0 +1,59 @@
+# patterns.py
+from __future__ import annotations
+import re
+from typing import Iterable
+
+from .regex_profile import ProfiledPattern, profiled
+
+# Flags every anchor / narrative pattern in the specs is matched with.
+ANCHOR_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# What counts as precompiled: re.Pattern, or its proxy while regex profiling is on.
+PATTERN_TYPES = (re.Pattern, ProfiledPattern)
+
+
+def compile_re(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    ``re.compile`` for the package's own patterns. With regex profiling on
+    (see ``regex_profile.py``) the result is a ``ProfiledPattern`` named
+    after the line that called this.
+    """
+    return profiled(re.compile(pattern, flags))
+
+
+def rx(pattern: str, flags: int = ANCHOR_FLAGS, owner: str = "") -> re.Pattern:
+    """Compile one pattern, naming its owner (spec key / block) if it is invalid."""
+    try:
+        return compile_re(pattern, flags)
+    except re.error as e:
+        where = f" in {owner}" if owner else ""
+        raise ValueError(f"Invalid pattern{where}: {pattern!r}: {e}") from None
+
+
+def compile_all(patterns: Iterable[str], flags: int = ANCHOR_FLAGS, owner: str = "") -> tuple[re.Pattern, ...]:
+    """Compile alternatives that must stay separate (tried in priority order)."""
+    return tuple(rx(p, flags, owner) for p in patterns)
+
+
+def any_of(patterns: Iterable[str], flags: int = ANCHOR_FLAGS, owner: str = "") -> re.Pattern:
+    """
+    Merge alternatives into one pattern. Only valid where callers want the
+    leftmost match of any alternative (ties go to the earlier alternative),
+    not "first alternative that matches anywhere".
+    """
+    pats = list(patterns)
+    if not pats:
+        return compile_re(r"(?!)", flags)  # never matches
+    for p in pats:
+        rx(p, flags, owner)  # validate individually for a precise error
+    return rx("|".join(f"(?:{p})" for p in pats), flags, owner)
+
+
+def as_patterns(patterns, flags: int = ANCHOR_FLAGS) -> tuple[re.Pattern, ...]:
+    """Accept precompiled patterns or raw strings (compiled on the spot)."""
+    return tuple(p if isinstance(p, PATTERN_TYPES) else compile_re(p, flags) for p in patterns)
+
+
+def as_pattern(patterns, flags: int = ANCHOR_FLAGS) -> re.Pattern:
+    """A merged pattern as-is, or raw alternatives merged with ``any_of``."""
+    return patterns if isinstance(patterns, PATTERN_TYPES) else any_of(patterns, flags)
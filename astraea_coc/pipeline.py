@@ -1,42 +1,79 @@
 from __future__ import annotations
 from pathlib import Path
 import re as _re
-import pandas as pd
 
-from .io_extract import extract_pdf_text, split_pages_by_markers
+from .io_extract import document_key, extract_pages
+from .backends import DEFAULT_BACKEND
+from .page_cache import PageCache, content_digest
+from .section_cache import SectionCache
 from .meta import parse_1a_metadata
 from .slicer import slice_section_lines
 from .parsers import (
     parse_numbered_yesno,
 )
+from .records import first_by_index
 
-from .build_wide import build_wide, col_order_extended
-from .utils import ts, save_text_unique, save_csv_unique
+from .build_wide import build_wide_row, wide_schema
+from .utils import rows_csv_text
+from .artifacts import ArtifactStore
+from .tracing import span, trace_path, tracing
+from .budget import SectionBudget
 
-from .generic_parse import parse_tables, parse_narratives
+from .generic_parse import parse_tables, parse_narratives, run_blocks
 from .specs_2024 import TABLE_SPECS_2024, NARR_SPECS_2024
 from .custom_blocks import (
     custom_1c7d, custom_1c7e,
     custom_1d2, custom_1d5, custom_1d9, custom_1d10a,
     custom_2a_basic, custom_2a4, custom_2a5, custom_2a5a, custom_2a6,
-    custom_2b1, custom_2b2
+    custom_2b1, custom_2b2,
+    YESNO_RX, DATE_RX, DATE_ONLY_RX,
+    NARR_HEADER_SKIP_RX, NARR_LIMIT_LINE_RX, NARR_DESCRIBE_LINE_RX,
 )
+from .patterns import compile_all, compile_re
 
 
+# ---- 1E patterns, compiled once ----
+_1E_FOOTER_SKIP_RX = compile_re(
+    r"(Applicant:|Project:|FY20\d{2}|CoC Application Page|Page\s+\d+)",
+    _re.IGNORECASE,
+)
+_1E_EXAMPLE_SKIP_RX = compile_re(
+    r"(for example|notified applicants on|if you notified applicants)",
+    _re.IGNORECASE,
+)
+_1E_MAX_POINTS_RX = compile_re(r"maximum number of points available.*?\?\s*([0-9]+)", _re.I | _re.S)
+_1E_RENEWALS_RX = compile_re(r"How many renewal projects did your CoC submit.*?\?\s*([0-9]+)", _re.I | _re.S)
+_1E_RENEWAL_TYPE_RX = compile_re(r"What renewal project type did most applicants use\?\s*([A-Za-z0-9\-/ ]+)", _re.I)
+
+_1E_ANCHORS = {
+    name: (compile_all(start, owner="parse_1e"), compile_all(stop, owner="parse_1e"))
+    for name, start, stop in [
+        ("1e1", [r"^\s*1E[-–]1\.\s*Web Posting of Advance Public Notice"], [r"^\s*1E[-–]2\."]),
+        ("1e2", [r"^\s*1E[-–]2\.\s*Project Review and Ranking Process"], [r"^\s*1E[-–]2a\."]),
+        ("1e2a", [r"^\s*1E[-–]2a\.\s*Scored Project Forms"], [r"^\s*1E[-–]2b\."]),
+        ("1e2b", [r"^\s*1E[-–]2b\."], [r"^\s*1E[-–]3\."]),
+        ("1e3", [r"^\s*1E[-–]3\."], [r"^\s*1E[-–]4\."]),
+        ("1e4", [r"^\s*1E[-–]4\."], [r"^\s*1E[-–]4a\."]),
+        ("1e4a", [r"^\s*1E[-–]4a\."], [r"^\s*1E[-–]5\."]),
+        ("1e5", [r"^\s*1E[-–]5\.\s*Projects Rejected/Reduced"], [r"^\s*1E[-–]5b\."]),
+        ("1e5a", [r"^\s*1E[-–]5a\.\s*"], [r"^\s*1E[-–]5b\.\s*"]),
+        ("1e5b", [r"^\s*1E[-–]5b\.\s*"], [r"^\s*1E[-–]5c\.\s*"]),
+        ("1e5c", [r"^\s*1E[-–]5c\.\s*"], [r"^\s*1E[-–]5d\.\s*"]),
+        ("1e5d", [r"^\s*1E[-–]5d\.\s*"], [r"^\s*2A[-–]1\."]),
+    ]
+}
+
 
 def parse_1e(pages) -> dict[str, str]:
     out: dict[str, str] = {}
 
-    yesno_rx = _re.compile(r"\b(Yes|No)\b", _re.IGNORECASE)
-    date_rx  = _re.compile(r"\b\d{2}/\d{2}/\d{4}\b")
+    yesno_rx = YESNO_RX
+    date_rx  = DATE_RX
 
     def _extract_narrative_block(lines: list[str]) -> str:
-        header_skip = _re.compile(
-            r"^\s*(NOFO Section|Applicant:|Project:|FY20\d{2}\s+CoC Application Page|Page\s+\d+)",
-            _re.IGNORECASE,
-        )
-        limit_line = _re.compile(r"limit\s*2,?500\s*characters", _re.IGNORECASE)
-        describe_line = _re.compile(r"Describe\s+in\s+the\s+field\s+below", _re.IGNORECASE)
+        header_skip = NARR_HEADER_SKIP_RX
+        limit_line = NARR_LIMIT_LINE_RX
+        describe_line = NARR_DESCRIBE_LINE_RX
 
         state = "seek_anchor"
         prompt_seen = False
@@ -76,23 +113,13 @@ def parse_1e(pages) -> dict[str, str]:
 
         return "\n".join(buf).strip()
 
-    def _map_yesno_df(df, prefix: str, n_items: int):
+    def _map_yesno_df(rows, prefix: str, n_items: int):
+        first = first_by_index(rows)
         for i in range(1, n_items + 1):
-            val = ""
-            if not df.empty:
-                row = df[df["index"] == i]
-                if not row.empty:
-                    val = str(row["value"].iloc[0]).strip()
-            out[f"{prefix}{i}"] = val
-
-    footer_skip = _re.compile(
-        r"(Applicant:|Project:|FY20\d{2}|CoC Application Page|Page\s+\d+)",
-        _re.IGNORECASE,
-    )
-    example_skip = _re.compile(
-        r"(for example|notified applicants on|if you notified applicants)",
-        _re.IGNORECASE,
-    )
+            out[f"{prefix}{i}"] = str(first[i].value).strip() if i in first else ""
+
+    footer_skip = _1E_FOOTER_SKIP_RX
+    example_skip = _1E_EXAMPLE_SKIP_RX
 
     def _pick_answer_date(lines: list[str]) -> str:
         candidates = []
@@ -109,7 +136,7 @@ def parse_1e(pages) -> dict[str, str]:
             any_dates.extend(ds)
             stripped = ln.strip()
 
-            if _re.fullmatch(r"\d{2}/\d{2}/\d{4}", stripped):
+            if DATE_ONLY_RX.fullmatch(stripped):
                 candidates.extend(ds)
                 continue
 
@@ -123,50 +150,35 @@ def parse_1e(pages) -> dict[str, str]:
         return "Empty"
 
     # 1E-1
-    lines_1e1 = slice_section_lines(
-        pages,
-        start_patterns=[r"^\s*1E[-–]1\.\s*Web Posting of Advance Public Notice"],
-        stop_patterns=[r"^\s*1E[-–]2\."],
-        safety_pages_ahead=2,
-    )
+    lines_1e1 = slice_section_lines(pages, *_1E_ANCHORS["1e1"], safety_pages_ahead=2)
     dates = date_rx.findall("\n".join(lines_1e1))
     out["val_1e_1_1"] = dates[0] if len(dates) > 0 else ""
     out["val_1e_1_2"] = dates[1] if len(dates) > 1 else ""
 
     # 1E-2
-    lines_1e2 = slice_section_lines(
-        pages,
-        start_patterns=[r"^\s*1E[-–]2\.\s*Project Review and Ranking Process"],
-        stop_patterns=[r"^\s*1E[-–]2a\."],
-        safety_pages_ahead=2,
-    )
-    _map_yesno_df(parse_numbered_yesno(lines_1e2), "val_1e_2_", 6)
+    lines_1e2 = slice_section_lines(pages, *_1E_ANCHORS["1e2"], safety_pages_ahead=2)
+    _map_yesno_df(parse_numbered_yesno(lines_1e2, lean=True), "val_1e_2_", 6)
 
     # 1E-2a
-    lines_1e2a = slice_section_lines(
-        pages,
-        start_patterns=[r"^\s*1E[-–]2a\.\s*Scored Project Forms"],
-        stop_patterns=[r"^\s*1E[-–]2b\."],
-        safety_pages_ahead=2,
-    )
+    lines_1e2a = slice_section_lines(pages, *_1E_ANCHORS["1e2a"], safety_pages_ahead=2)
     text_1e2a = "\n".join(lines_1e2a)
-    m1 = _re.search(r"maximum number of points available.*?\?\s*([0-9]+)", text_1e2a, flags=_re.I|_re.S)
-    m2 = _re.search(r"How many renewal projects did your CoC submit.*?\?\s*([0-9]+)", text_1e2a, flags=_re.I|_re.S)
-    m3 = _re.search(r"What renewal project type did most applicants use\?\s*([A-Za-z0-9\-/ ]+)", text_1e2a, flags=_re.I)
+    m1 = _1E_MAX_POINTS_RX.search(text_1e2a)
+    m2 = _1E_RENEWALS_RX.search(text_1e2a)
+    m3 = _1E_RENEWAL_TYPE_RX.search(text_1e2a)
     out["val_1e_2a_1"] = m1.group(1) if m1 else ""
     out["val_1e_2a_2"] = m2.group(1) if m2 else ""
     out["val_1e_2a_3"] = m3.group(1).strip() if m3 else ""
 
     # 1E-2b, 1E-3, 1E-4
-    lines_1e2b = slice_section_lines(pages, [r"^\s*1E[-–]2b\."], [r"^\s*1E[-–]3\."], 3)
-    lines_1e3  = slice_section_lines(pages, [r"^\s*1E[-–]3\."],  [r"^\s*1E[-–]4\."], 3)
-    lines_1e4  = slice_section_lines(pages, [r"^\s*1E[-–]4\."],  [r"^\s*1E[-–]4a\."], 3)
+    lines_1e2b = slice_section_lines(pages, *_1E_ANCHORS["1e2b"], 3)
+    lines_1e3  = slice_section_lines(pages, *_1E_ANCHORS["1e3"], 3)
+    lines_1e4  = slice_section_lines(pages, *_1E_ANCHORS["1e4"], 3)
     out["narr_1e_2b"] = _extract_narrative_block(lines_1e2b)
     out["narr_1e_3"]  = _extract_narrative_block(lines_1e3)
     out["narr_1e_4"]  = _extract_narrative_block(lines_1e4)
 
     # 1E-4a yes/no
-    lines_1e4a = slice_section_lines(pages, [r"^\s*1E[-–]4a\."], [r"^\s*1E[-–]5\."], 2)
+    lines_1e4a = slice_section_lines(pages, *_1E_ANCHORS["1e4a"], 2)
     val_1e_4a = ""
     for ln in reversed(lines_1e4a):
         m = yesno_rx.search(ln)
@@ -176,25 +188,19 @@ def parse_1e(pages) -> dict[str, str]:
     out["val_1e_4a"] = val_1e_4a
 
     # 1E-5 block: 1..3 yes/no + #4 date
-    lines_1e5 = slice_section_lines(
-        pages,
-        start_patterns=[r"^\s*1E[-–]5\.\s*Projects Rejected/Reduced"],
-        stop_patterns=[r"^\s*1E[-–]5b\."],
-        safety_pages_ahead=2,
-    )
-    _map_yesno_df(parse_numbered_yesno(lines_1e5), "val_1e_5_", 3)
+    lines_1e5 = slice_section_lines(pages, *_1E_ANCHORS["1e5"], safety_pages_ahead=2)
+    _map_yesno_df(parse_numbered_yesno(lines_1e5, lean=True), "val_1e_5_", 3)
     out["val_1e_5_4"] = _pick_answer_date(lines_1e5)
 
     # 1E-5a..5d
-    def _slice_5(letter: str, next_letter: str | None):
-        start = [rf"^\s*1E[-–]5{letter}\.\s*"]
-        stop  = [rf"^\s*1E[-–]5{next_letter}\.\s*"] if next_letter else [r"^\s*2A[-–]1\."]
+    def _slice_5(letter: str):
+        start, stop = _1E_ANCHORS[f"1e5{letter}"]
         return slice_section_lines(pages, start_patterns=start, stop_patterns=stop, safety_pages_ahead=2)
 
-    lines_1e5a = _slice_5("a", "b")
-    lines_1e5b = _slice_5("b", "c")
-    lines_1e5c = _slice_5("c", "d")
-    lines_1e5d = _slice_5("d", None)
+    lines_1e5a = _slice_5("a")
+    lines_1e5b = _slice_5("b")
+    lines_1e5c = _slice_5("c")
+    lines_1e5d = _slice_5("d")
 
     out["narr_1e_5a"] = _pick_answer_date(lines_1e5a)
     out["narr_1e_5b"] = _extract_narrative_block(lines_1e5b) or "Empty"
@@ -204,71 +210,162 @@ def parse_1e(pages) -> dict[str, str]:
     return out
 
 
-def run_all(pdf_path: Path, out_dir: Path | None = None) -> dict:
+# Custom blocks (special logic), in the order their keys reach build_wide.
+# 1E stays custom for now: keep your existing parse_1e(pages)
+CUSTOM_BLOCKS_2024 = [
+    custom_1c7d, custom_1c7e, custom_1d2, custom_1d5, custom_1d9, custom_1d10a,
+    custom_2a_basic, custom_2a4, custom_2a5, custom_2a5a, custom_2a6,
+    custom_2b1, custom_2b2,
+    parse_1e,
+]
+
+
+def run_all(
+    pdf_path: Path,
+    out_dir: Path | None = None,
+    cache: PageCache | None = None,
+    page_jobs: int | None = None,
+    engine: str = DEFAULT_BACKEND,
+    save_text: bool = True,
+    section_cache: SectionCache | None = None,
+    return_frame: bool = True,
+    lean: bool = False,
+    artifacts: ArtifactStore | None = None,
+    save_artifacts: bool = True,
+    trace_dir: Path | None = None,
+    section_budget: float | None = None,
+    data: bytes | None = None,
+) -> dict:
+    """
+    Parse one PDF into its section results and wide row.
+
+    ``section_cache`` reuses per-section results whose input text and spec
+    fingerprint are unchanged (see ``section_cache.py``).
+
+    The row is returned as ``wide_row`` (a ``schema.WideRow``); with
+    ``return_frame`` it is also wrapped in a one-row ``wide_df``. Batch
+    callers pass ``return_frame=False`` and stack rows with a
+    ``schema.RowAccumulator`` instead.
+
+    With ``lean`` the table sections come back as ``records`` NamedTuple
+    lists rather than DataFrames; the wide row is the same either way.
+
+    The wide CSV and (with ``save_text``) the page text dump go to
+    ``artifacts``, by default a synchronous ``ArtifactStore`` in ``out_dir``;
+    ``save_artifacts=False`` writes neither.
+
+    With ``trace_dir`` every stage and section is timed into
+    ``<trace_dir>/<pdf stem>.trace.json`` (Chrome-trace format, see
+    ``tracing.py``).
+
+    ``section_budget`` caps each table, narrative and custom block at that
+    many seconds (see ``budget.py``); a section over it keeps its empty
+    result and is listed under ``timed_out``.
+
+    ``data`` is the PDF's bytes if the caller already read them; they are
+    parsed instead of reading ``pdf_path``, which still names the outputs.
+    The PDF is hashed once, here, for the page cache and the section cache,
+    and the hash is returned as ``digest``.
+    """
     pdf_path = Path(pdf_path).resolve()
     if out_dir is None:
         out_dir = pdf_path.parent
+    if not save_artifacts:
+        artifacts = None
+    elif artifacts is None:
+        artifacts = ArtifactStore(out_dir, background=False)
+    budget = SectionBudget(section_budget) if section_budget else None
+
+    trace = trace_path(trace_dir, pdf_path) if trace_dir is not None else None
+    with tracing(pdf_path.name, trace), span("run_all", "pdf"):
+        # pages are extracted as the parsers reach them; trailing pages no anchor
+        # points into are never laid out unless the text dump asks for them
+        with span("hash", "extract"):
+            digest = content_digest(pdf_path, data)
+        with span("open", "extract"):
+            pages = extract_pages(
+                pdf_path, cache=cache, page_jobs=page_jobs, engine=engine, lazy=True, data=data, digest=digest,
+            )
+        with pages:
+            doc_key = document_key(pdf_path, pages.engine, digest=digest) if section_cache is not None else None
+            result = _parse_pages(
+                pages, pdf_path, artifacts, section_cache, doc_key, return_frame, lean, budget
+            )
+
+            # the marker-joined dump is only built when the text artifact is wanted
+            txt_path = None
+            if save_text and artifacts is not None:
+                with span("text", "artifact"):
+                    txt_path = artifacts.put(pdf_path, "text", "txt", pages.to_text())
+
+        if section_cache is not None:
+            with span("evict", "cache"):
+                section_cache.evict()
+
+    out: dict[str, object] = {
+        "txt_path": txt_path, "n_pages": len(pages), "engine": pages.engine, "digest": digest,
+        "timed_out": budget.timed_out if budget is not None else [],
+    }
+    out.update(result)
+    return out
 
-    full_text, n_pages, engine = extract_pdf_text(pdf_path)
-    txt_path = save_text_unique(
-        out_dir / f"{pdf_path.stem}__text_{ts()}.txt", full_text
-    )
-    pages = split_pages_by_markers(full_text)
 
+def _parse_pages(
+    pages,
+    pdf_path: Path,
+    artifacts: ArtifactStore | None = None,
+    section_cache: SectionCache | None = None,
+    doc_key: str | None = None,
+    return_frame: bool = True,
+    lean: bool = False,
+    budget: SectionBudget | None = None,
+) -> dict:
     # 1A metadata
-    meta_vals, meta_debug = parse_1a_metadata(pages)
+    with span("meta"):
+        meta_vals, meta_debug = parse_1a_metadata(pages)
 
     # Spec-driven simple tables + narratives
     section_data: dict[str, object] = {}
-    section_data.update(parse_tables(pages, TABLE_SPECS_2024))
+    with span("tables"):
+        section_data.update(parse_tables(pages, TABLE_SPECS_2024, cache=section_cache, lean=lean, budget=budget))
 
     # inject meta into the tables that used to have it
     for k in ["df_1b1", "df_1c1", "df_1c2"]:  # add others if needed
         df = section_data.get(k)
-        if isinstance(df, pd.DataFrame) and not df.empty:
+        if df is not None and not isinstance(df, list) and not df.empty:
             for mk, mv in meta_vals.items():
                 df[mk] = mv
             section_data[k] = df
-    section_data.update(parse_narratives(pages, NARR_SPECS_2024))
-
-    # Custom blocks (special logic)
-    section_data.update(custom_1c7d(pages))
-    section_data.update(custom_1c7e(pages))
-    section_data.update(custom_1d2(pages))
-    section_data.update(custom_1d5(pages))
-    section_data.update(custom_1d9(pages))
-    section_data.update(custom_1d10a(pages))
-
-    section_data.update(custom_2a_basic(pages))
-    section_data.update(custom_2a4(pages))
-    section_data.update(custom_2a5(pages))
-    section_data.update(custom_2a5a(pages))
-    section_data.update(custom_2a6(pages))
-
-    section_data.update(custom_2b1(pages))
-    section_data.update(custom_2b2(pages))
+    with span("narratives"):
+        section_data.update(parse_narratives(pages, NARR_SPECS_2024, cache=section_cache, budget=budget))
 
-    # 1E stays custom for now: keep your existing parse_1e(pages)
-    section_data.update(parse_1e(pages))
+    # Custom blocks (special logic) + 1E
+    with span("blocks"):
+        section_data.update(
+            run_blocks(pages, CUSTOM_BLOCKS_2024, cache=section_cache, doc_key=doc_key, budget=budget)
+        )
 
     # normalize blank narratives -> "Empty"
     for k, v in list(section_data.items()):
         if k.startswith("narr_") and (v is None or str(v).strip() == ""):
             section_data[k] = "Empty"
 
-    # Build wide
-    wide_df = build_wide(meta_vals=meta_vals, **section_data)
-
-    ordered = col_order_extended()
-    extras = [c for c in wide_df.columns if c not in ordered]
-    wide_df = wide_df.reindex(columns=ordered + extras)
-    save_csv_unique(out_dir / f"{pdf_path.stem}__wide.csv", wide_df)
-
+    # Build wide: values land in the compiled schema's slots, unknown keys trail as extras
+    schema = wide_schema()
+    with span("build_wide"):
+        wide_row = build_wide_row(meta_vals=meta_vals, **section_data)
+    if artifacts is not None:
+        with span("wide", "artifact"):
+            artifacts.put(
+                pdf_path, "wide", "csv", rows_csv_text(schema.names(wide_row), [schema.flat(wide_row)])
+            )
 
     result: dict[str, object] = {
-        "txt_path": txt_path,
         "meta_vals": meta_vals,
-        "wide_df": wide_df,
+        "wide_row": wide_row,
     }
+    if return_frame:
+        with span("wide_frame"):
+            result["wide_df"] = schema.frame([wide_row])
     result.update(section_data)
     return result
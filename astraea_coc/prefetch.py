@@ -0,0 +1,109 @@
+# prefetch.py
+"""
+Read upcoming PDFs into memory while the pool parses earlier ones.
+
+On network storage a worker can spend as long waiting for a PDF's bytes as
+parsing them. ``Prefetcher`` reads the batch's files in submission order on
+a few background threads, holding at most ``window_bytes`` that have not
+been taken yet; the batch hands each PDF's bytes to its worker along with
+the task, and the backends open them from memory.
+
+Files are taken in the order they were given. Taking one the readers have
+not reached yet reads it on the spot, and a file larger than the whole
+window is still read, alone.
+"""
+from __future__ import annotations
+import threading
+from pathlib import Path
+from typing import Sequence
+
+PREFETCH_THREADS = 4
+
+
+class Prefetcher:
+    """Background reader of ``paths``' bytes, bounded by ``window_bytes`` not yet taken."""
+
+    def __init__(self, paths: Sequence[Path], window_bytes: int, threads: int = PREFETCH_THREADS):
+        self.paths = [Path(p) for p in paths]
+        self.window_bytes = window_bytes
+        self._next = 0                             # index of the next path to read
+        self._started: set[Path] = set()
+        self._loaded: dict[Path, bytes | None] = {}  # None: the read failed
+        self._held = 0                             # bytes read (or being read) and not taken
+        self._sizes: dict[Path, int] = {}
+        self._closed = False
+        self._cond = threading.Condition()
+        self._threads = [
+            threading.Thread(target=self._reader, name=f"prefetch-{i}", daemon=True)
+            for i in range(max(1, threads))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _size(self, path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _reader(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    while self._next < len(self.paths) and self.paths[self._next] in self._started:
+                        self._next += 1  # already taken before we got to it
+                    if self._next >= len(self.paths):
+                        return
+                    path = self.paths[self._next]
+                    size = self._sizes.setdefault(path, self._size(path))
+                    if self._held == 0 or self._held + size <= self.window_bytes:
+                        break
+                    self._cond.wait()
+                self._next += 1
+                self._started.add(path)
+                self._held += size
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                print(f"[info] could not prefetch {path.name}: {e}")
+                data = None
+            with self._cond:
+                self._loaded[path] = data
+                self._cond.notify_all()
+
+    def take(self, path: Path) -> bytes | None:
+        """
+        The bytes of ``path``, waiting for its read if it is under way; None if
+        that read failed (the worker then opens the file itself).
+        """
+        path = Path(path)
+        with self._cond:
+            if path not in self._started:
+                self._started.add(path)  # not reached yet: read it here, outside the window
+            else:
+                while path not in self._loaded:
+                    self._cond.wait()
+                self._held -= self._sizes.get(path, 0)
+                self._cond.notify_all()
+                return self._loaded.pop(path)
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        """Stop reading ahead and drop whatever was not taken."""
+        with self._cond:
+            self._closed = True
+            self._loaded.clear()
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
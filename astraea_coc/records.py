@@ -0,0 +1,79 @@
+# records.py
+from __future__ import annotations
+from typing import NamedTuple, Sequence
+
+
+# Lean parser output: what the table parsers return with ``lean=True``, instead
+# of a small DataFrame per section. Lists of these are sorted by index like the
+# frames were.
+
+class YesNoRow(NamedTuple):
+    index: int
+    label: str
+    value: str
+
+
+class TripleRow(NamedTuple):
+    org_type_index: int
+    org_type: str
+    meetings: str
+    voted: str
+    ces: str
+
+
+class DualRow(NamedTuple):
+    # the DataFrame form names first/second after the spec's suffixes (mou/oth, ...)
+    index: int
+    label: str
+    first: str
+    second: str
+
+
+class PhaRow(NamedTuple):
+    pha_name: str
+    ph_hhm: str
+    ph_limit_hhm: str
+    psh: str
+
+
+class BedRow(NamedTuple):
+    index: int
+    project_type: str
+    adj_total_non_vsp_beds: str
+    adj_total_vsp_beds: str
+    total_hmis_plus_vsp_beds: str
+    coverage_rate: str
+
+
+def as_records(table, row_type: type, columns: Sequence[str] | None = None) -> list | None:
+    """
+    Records for a parsed table: lean lists pass through; a DataFrame (the
+    default parser output) is converted once, reading ``columns`` (default:
+    the record's field names) into the record's fields. None stays None.
+    """
+    if table is None or isinstance(table, list):
+        return table
+    if table.empty:
+        return []
+    columns = list(columns or row_type._fields)
+    if any(c not in table.columns for c in columns):
+        return []
+    out = []
+    for values in table[columns].itertuples(index=False, name=None):
+        rec = row_type(*values)
+        if "index" in row_type._fields:
+            rec = rec._replace(index=int(rec.index))
+        elif "org_type_index" in row_type._fields:
+            rec = rec._replace(org_type_index=int(rec.org_type_index))
+        out.append(rec)
+    return out
+
+
+def first_by_index(rows, lo: int | None = None, hi: int | None = None) -> dict:
+    """``{index: row}`` keeping the first row per index, optionally only lo..hi."""
+    out: dict[int, object] = {}
+    for r in rows or ():
+        if (lo is not None and r.index < lo) or (hi is not None and r.index > hi):
+            continue
+        out.setdefault(r.index, r)
+    return out
@@ -0,0 +1,240 @@
+# regex_profile.py
+"""
+Opt-in profiler for every regex the package evaluates.
+
+    ASTRAEA_REGEX_PROFILE=prof/ python build_all_wide_xlsx.py APPS_DIR ...
+    python -m astraea_coc.regex_profile prof/        # the report again
+
+With the variable set when ``astraea_coc`` is imported, patterns compiled
+through the package's helpers (``patterns.compile_re`` for module-level
+patterns, ``rx`` / ``compile_all`` / ``any_of`` / ``as_patterns`` for the
+spec anchors) come back as ``ProfiledPattern`` proxies. ``re`` itself is
+left alone, so other libraries in the process are unaffected. Each search,
+match, sub and so on is counted and timed under the section that ran it
+(the innermost ``tracing.span``: ``table/df_1b1``, ``block/parse_1e``, ...)
+and the module:line that compiled the pattern. Every process writes its
+counts to ``<dir>/regex.<pid>.json`` on exit; ``report`` merges them and
+ranks patterns by total time.
+
+Unset, patterns are plain ``re.Pattern`` objects.
+"""
+from __future__ import annotations
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from .tracing import current_section, label_sections
+
+PROFILE_ENV = "ASTRAEA_REGEX_PROFILE"
+DEFAULT_DIR = "regex_profile"
+REPORT_NAME = "regex_report.json"
+
+_PACKAGE = __name__.rpartition(".")[0]
+# modules that only pass patterns through; the compile site is their caller
+_HELPERS = (f"{_PACKAGE}.patterns", __name__)
+
+# (section, where, pattern, flags, method) -> [calls, seconds, max seconds]
+_STATS: dict[tuple[str, str, str, int, str], list] = {}
+_dir: Path | None = None
+
+
+def _timed(p: "ProfiledPattern", method: str, fn, args, kwargs):
+    t = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        dt = time.perf_counter() - t
+        key = (current_section(), p.where, p.pattern, p.flags, method)
+        s = _STATS.get(key)
+        if s is None:
+            _STATS[key] = [1, dt, dt]
+        else:
+            s[0] += 1
+            s[1] += dt
+            if dt > s[2]:
+                s[2] = dt
+
+
+class ProfiledPattern:
+    """A compiled pattern whose evaluations are recorded; otherwise behaves like ``re.Pattern``."""
+
+    __slots__ = ("_rx", "where", "pattern", "flags", "groups", "groupindex")
+
+    def __init__(self, compiled: re.Pattern, where: str):
+        self._rx = compiled
+        self.where = where
+        self.pattern = compiled.pattern
+        self.flags = compiled.flags
+        self.groups = compiled.groups
+        self.groupindex = compiled.groupindex
+
+    def search(self, *args, **kwargs):
+        return _timed(self, "search", self._rx.search, args, kwargs)
+
+    def match(self, *args, **kwargs):
+        return _timed(self, "match", self._rx.match, args, kwargs)
+
+    def fullmatch(self, *args, **kwargs):
+        return _timed(self, "fullmatch", self._rx.fullmatch, args, kwargs)
+
+    def findall(self, *args, **kwargs):
+        return _timed(self, "findall", self._rx.findall, args, kwargs)
+
+    def finditer(self, *args, **kwargs):
+        # matched eagerly, so the time is the scan's and not the caller's loop
+        return iter(_timed(self, "finditer", lambda *a, **k: list(self._rx.finditer(*a, **k)), args, kwargs))
+
+    def sub(self, *args, **kwargs):
+        return _timed(self, "sub", self._rx.sub, args, kwargs)
+
+    def subn(self, *args, **kwargs):
+        return _timed(self, "subn", self._rx.subn, args, kwargs)
+
+    def split(self, *args, **kwargs):
+        return _timed(self, "split", self._rx.split, args, kwargs)
+
+    def scanner(self, *args, **kwargs):
+        return self._rx.scanner(*args, **kwargs)
+
+    def __reduce__(self):
+        return _compile_at, (self.pattern, self.flags, self.where)
+
+    def __repr__(self) -> str:
+        return repr(self._rx)
+
+
+def _compile_at(pattern, flags: int, where: str) -> ProfiledPattern:
+    return ProfiledPattern(re.compile(pattern, flags), where)
+
+
+def profiled(compiled: re.Pattern):
+    """
+    ``compiled`` as a ``ProfiledPattern`` named after the package line that
+    asked for it while profiling is on; ``compiled`` itself otherwise.
+    """
+    if _dir is None:
+        return compiled
+    f = sys._getframe(1)
+    while f is not None and f.f_globals.get("__name__") in _HELPERS:
+        f = f.f_back
+    module = f.f_globals.get("__name__", "") if f is not None else ""
+    return ProfiledPattern(compiled, f"{module.rpartition('.')[2]}:{f.f_lineno if f is not None else 0}")
+
+
+def profile_dir() -> Path | None:
+    """Where this process writes its counts, or None when profiling is off."""
+    return _dir
+
+
+def install(out_dir: str | Path | None = None) -> Path:
+    """
+    Start profiling in this process (``astraea_coc`` calls this when
+    ``ASTRAEA_REGEX_PROFILE`` is set). Only patterns compiled afterwards are
+    profiled, so it has to run before the package's modules are imported.
+    """
+    global _dir
+    if _dir is not None:
+        return _dir
+    value = str(out_dir or os.environ.get(PROFILE_ENV) or "")
+    _dir = Path(DEFAULT_DIR if value.lower() in ("", "1", "true", "yes") else value).expanduser().resolve()
+    label_sections(True)
+
+    from multiprocessing import util
+    # multiprocessing children drop inherited finalizers at startup, so each
+    # re-registers the dump (and starts counting from zero) after the fork
+    util.register_after_fork(_HOOK, _child_started)
+    util.Finalize(None, dump, exitpriority=5)
+    return _dir
+
+
+class _Hook:
+    pass
+
+
+_HOOK = _Hook()
+
+
+def _child_started(_hook) -> None:
+    from multiprocessing import util
+    _STATS.clear()
+    util.Finalize(None, dump, exitpriority=5)
+
+
+def dump() -> Path | None:
+    """Write this process's counts to ``<dir>/regex.<pid>.json``."""
+    if _dir is None or not _STATS:
+        return None
+    _dir.mkdir(parents=True, exist_ok=True)
+    path = _dir / f"regex.{os.getpid()}.json"
+    rows = [[*key, *val] for key, val in _STATS.items()]
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(rows), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def clear(out_dir: Path) -> None:
+    """Remove per-process counts of an earlier run."""
+    for p in Path(out_dir).glob("regex.*.json"):
+        p.unlink(missing_ok=True)
+
+
+# ---- report ----
+
+def merge(paths: Iterable[Path]) -> list[dict]:
+    """Per ``(section, where, pattern, flags)``: calls and times over all methods, slowest first."""
+    merged: dict[tuple, dict] = {}
+    for path in paths:
+        for section, where, pattern, flags, method, calls, secs, worst in json.loads(
+            Path(path).read_text(encoding="utf-8")
+        ):
+            r = merged.setdefault((section, where, pattern, flags), {
+                "section": section, "where": where, "pattern": pattern, "flags": flags,
+                "calls": 0, "total_s": 0.0, "max_s": 0.0, "methods": {},
+            })
+            r["calls"] += calls
+            r["total_s"] += secs
+            r["max_s"] = max(r["max_s"], worst)
+            r["methods"][method] = r["methods"].get(method, 0) + calls
+    return sorted(merged.values(), key=lambda r: -r["total_s"])
+
+
+def report(out_dir: Path, top: int = 20) -> Path | None:
+    """Merge every process's counts in ``out_dir`` into ``regex_report.json``; print the top patterns."""
+    out_dir = Path(out_dir)
+    if out_dir == _dir:
+        dump()  # this process's counts so far
+    rows = merge(sorted(out_dir.glob("regex.*.json")))
+    if not rows:
+        print(f"[info] no regex counts in {out_dir}")
+        return None
+    out = out_dir / REPORT_NAME
+    out.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+    total = sum(r["total_s"] for r in rows)
+    print(f"\nRegex time: {total:.2f}s over {len(rows)} (section, pattern) pairs ({out}):")
+    for r in rows[:top]:
+        pattern = r["pattern"] if len(r["pattern"]) <= 60 else r["pattern"][:57] + "..."
+        print(
+            f"  {r['total_s']:8.3f}s {r['total_s'] / total:6.1%}  x{r['calls']:<8d} "
+            f"{r['section']:24s} {r['where']:22s} {pattern}"
+        )
+    return out
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m astraea_coc.regex_profile",
+                                     description="Rank the patterns of a regex profile directory.")
+    parser.add_argument("dir", nargs="?", default=os.environ.get(PROFILE_ENV) or DEFAULT_DIR)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+    return 0 if report(Path(args.dir), args.top) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
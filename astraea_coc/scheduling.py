@@ -0,0 +1,74 @@
+# scheduling.py
+"""
+Order and group a batch's PDFs for the worker pool.
+
+Tasks are submitted longest first (LPT), so the few huge applications start
+right away instead of stretching the end of the run, and PDFs estimated to
+take less than ``min_task_s`` are packed into multi-document tasks so they
+do not pay a round trip each.
+
+A PDF's cost, in seconds, is what the manifest recorded for it last time;
+failing that its stored page count, failing that its file size, both
+converted with rates measured on the PDFs that do have timings.
+"""
+from __future__ import annotations
+import statistics
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple
+
+DEFAULT_S_PER_PAGE = 0.05       # until the manifest holds timings
+DEFAULT_BYTES_PER_PAGE = 40_000
+MIN_TASK_S = 1.0
+
+
+class Task(NamedTuple):
+    pdfs: tuple[Path, ...]
+    cost: float                 # estimated seconds
+
+
+def estimate_costs(pdfs: Iterable[Path], history: Callable[[Path], dict | None]) -> dict[Path, float]:
+    """Estimated seconds per PDF; ``history(pdf)`` is its previous manifest entry, if any."""
+    pdfs = list(pdfs)
+    entries = {pdf: history(pdf) or {} for pdf in pdfs}
+    sizes = {pdf: pdf.stat().st_size for pdf in pdfs}
+
+    timed = [(e["seconds"], e["n_pages"]) for e in entries.values() if e.get("seconds") and e.get("n_pages")]
+    s_per_page = statistics.median(s / n for s, n in timed) if timed else DEFAULT_S_PER_PAGE
+    paged = [(sizes[p], e["n_pages"]) for p, e in entries.items() if e.get("n_pages")]
+    bytes_per_page = statistics.median(b / n for b, n in paged) if paged else DEFAULT_BYTES_PER_PAGE
+
+    costs = {}
+    for pdf, e in entries.items():
+        if e.get("seconds"):
+            costs[pdf] = float(e["seconds"])
+        else:
+            n_pages = e.get("n_pages") or max(1.0, sizes[pdf] / bytes_per_page)
+            costs[pdf] = n_pages * s_per_page
+    return costs
+
+
+def plan(costs: dict[Path, float], jobs: int, min_task_s: float = MIN_TASK_S) -> list[Task]:
+    """
+    Tasks in submission order, costliest first. Small PDFs are batched up to
+    ``min_task_s``, but never past a quarter of one worker's share of the
+    total, so the last tasks stay short enough to balance the tail.
+    """
+    total = sum(costs.values())
+    target = min(min_task_s, total / (4 * max(jobs, 1)))
+    tasks: list[Task] = []
+    batch: list[Path] = []
+    batch_cost = 0.0
+    for pdf in sorted(costs, key=lambda p: (-costs[p], p.name.lower())):
+        cost = costs[pdf]
+        if cost >= target:
+            tasks.append(Task((pdf,), cost))
+            continue
+        batch.append(pdf)
+        batch_cost += cost
+        if batch_cost >= target:
+            tasks.append(Task(tuple(batch), batch_cost))
+            batch, batch_cost = [], 0.0
+    if batch:
+        tasks.append(Task(tuple(batch), batch_cost))
+    tasks.sort(key=lambda t: -t.cost)  # stable: equal costs keep name order
+    return tasks
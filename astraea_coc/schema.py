@@ -0,0 +1,109 @@
+# schema.py
+from __future__ import annotations
+import hashlib
+from typing import Iterable, Mapping, NamedTuple, Sequence
+
+
+class WideRow(NamedTuple):
+    """One document's wide row: values in schema slot order plus unscheduled extras."""
+    values: tuple
+    extras: dict
+
+
+class WideSchema:
+    """
+    The wide columns, defined once and compiled to a column -> slot mapping.
+
+    ``pack`` turns a column dict into a fixed-length tuple in slot order;
+    columns the schema does not know (new val_*/narr_* keys) ride along as
+    ``extras`` and are appended after the schema columns, in first-seen order.
+
+    ``encode``/``decode`` carry a row between processes as plain tuples
+    tagged with the schema ``id``.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = tuple(columns)
+        self.slot = {c: i for i, c in enumerate(self.columns)}
+        if len(self.slot) != len(self.columns):
+            raise ValueError("WideSchema columns must be unique")
+        self.id = hashlib.sha256("\0".join(self.columns).encode()).hexdigest()[:12]
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def pack(self, wide: Mapping[str, object], missing=None) -> WideRow:
+        values = tuple(wide.get(c, missing) for c in self.columns)
+        extras = {k: v for k, v in wide.items() if k not in self.slot}
+        return WideRow(values, extras)
+
+    def names(self, row: WideRow) -> list[str]:
+        return [*self.columns, *row.extras]
+
+    def flat(self, row: WideRow) -> list:
+        return [*row.values, *row.extras.values()]
+
+    def encode(self, row: WideRow) -> tuple:
+        """``(id, values, extra_names, extra_values)``: tuples and strings only."""
+        return (self.id, row.values, tuple(row.extras), tuple(row.extras.values()))
+
+    def decode(self, wire: tuple) -> WideRow:
+        schema_id, values, names, extra = wire
+        if schema_id != self.id or len(values) != len(self.columns):
+            raise ValueError(f"row encoded for schema {schema_id}, expected {self.id}")
+        return WideRow(values, dict(zip(names, extra)))
+
+    def frame(self, rows: Iterable[WideRow]):
+        acc = RowAccumulator(self)
+        for row in rows:
+            acc.add(row)
+        return acc.to_frame()
+
+
+class RowAccumulator:
+    """
+    Collects ``WideRow``s for a whole batch and emits them once, as lists
+    aligned with ``columns`` or as a single DataFrame.
+    """
+
+    def __init__(self, schema: WideSchema):
+        self.schema = schema
+        self._values: list[tuple] = []
+        # per row: (names, values) of its extras; rows share one names tuple
+        # per distinct set of extra columns
+        self._extras: list[tuple[tuple, tuple]] = []
+        self._names: dict[tuple, tuple] = {}
+        self._extra_slot: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, row: WideRow, extra: Mapping[str, object] | None = None) -> None:
+        """Add a row; ``extra`` adds per-row tags such as ``__source_pdf``."""
+        extras = {**row.extras, **extra} if extra else row.extras
+        names = tuple(extras)
+        if names not in self._names:
+            self._names[names] = names
+            for k in names:
+                if k not in self._extra_slot:
+                    self._extra_slot[k] = len(self._extra_slot)
+        self._values.append(row.values)
+        self._extras.append((self._names[names], tuple(extras.values())))
+
+    @property
+    def columns(self) -> list[str]:
+        return [*self.schema.columns, *self._extra_slot]
+
+    def rows(self) -> list[list]:
+        width, n_extra = len(self.schema), len(self._extra_slot)
+        out = []
+        for values, (names, extra) in zip(self._values, self._extras):
+            row = [*values, *([None] * n_extra)]
+            for k, v in zip(names, extra):
+                row[width + self._extra_slot[k]] = v
+            out.append(row)
+        return out
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame(self.rows(), columns=self.columns)
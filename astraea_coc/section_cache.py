@@ -0,0 +1,269 @@
+# section_cache.py
+from __future__ import annotations
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Iterable
+
+from .page_cache import default_cache_dir
+from .patterns import PATTERN_TYPES
+
+# Bump to drop every cached section result (e.g. when a result type changes shape).
+SECTION_CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+_PACKAGE = __name__.rpartition(".")[0]
+_SALT = f"v{SECTION_CACHE_VERSION};py{sys.version_info[0]}.{sys.version_info[1]}"
+_PRIMITIVES = (str, bytes, int, float, bool, type(None))
+
+# Code that reaches the parsers as their input (the ``Pages`` object and its
+# section index) rather than as a global they read; its source is hashed whole.
+INPUT_MODULES = ("pages.py", "section_index.py")
+
+
+@functools.lru_cache(maxsize=None)
+def _input_salt() -> bytes:
+    here = Path(__file__).resolve().parent
+    h = hashlib.sha256()
+    for name in INPUT_MODULES:
+        h.update(name.encode() + b"\0")
+        h.update((here / name).read_bytes())
+    return h.digest()
+
+
+# ---- fingerprints ----
+
+def _code_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names |= _code_names(c)
+    return names
+
+
+def _feed_code(h, code: types.CodeType) -> None:
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            _feed_code(h, c)
+        else:
+            _feed(h, c, set())  # not repr(): frozenset constants iterate in hash order
+
+
+def _feed(h, obj, seen: set[int]) -> None:
+    if isinstance(obj, _PRIMITIVES):
+        h.update(repr(obj).encode())
+    elif isinstance(obj, PATTERN_TYPES):
+        h.update(f"re:{obj.pattern!r}:{obj.flags}".encode())
+    elif isinstance(obj, (list, tuple, frozenset, set)):
+        h.update(f"{type(obj).__name__}[".encode())
+        for x in (sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj):
+            _feed(h, x, seen)
+        h.update(b"]")
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for k, v in obj.items():
+            _feed(h, k, seen)
+            _feed(h, v, seen)
+        h.update(b"}")
+    elif isinstance(obj, type):
+        h.update(f"cls:{obj.__module__}.{obj.__qualname__}".encode())
+        if id(obj) in seen or not (obj.__module__ or "").startswith(_PACKAGE):
+            return
+        seen.add(id(obj))
+        # the class body: methods (bytecode and the globals they read), class constants
+        for name, val in vars(obj).items():
+            if isinstance(val, (staticmethod, classmethod)):
+                val = val.__func__
+            elif isinstance(val, property):
+                val = (val.fget, val.fset, val.fdel)
+            h.update(f"attr:{name}=".encode())
+            _feed(h, val, seen)
+    elif callable(obj) and isinstance(getattr(obj, "__wrapped__", None), types.FunctionType):
+        # lru_cache / functools.wraps decorators: the decorated function's code
+        h.update(f"wrapped:{type(obj).__qualname__}".encode())
+        _feed(h, obj.__wrapped__, seen)
+    elif isinstance(obj, functools.partial):
+        h.update(b"partial")
+        _feed(h, obj.func, seen)
+        _feed(h, obj.args, seen)
+        _feed(h, obj.keywords, seen)
+    elif isinstance(obj, types.FunctionType):
+        h.update(f"fn:{obj.__qualname__}".encode())
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        _feed_code(h, obj.__code__)
+        _feed(h, obj.__defaults__, seen)
+        _feed(h, obj.__kwdefaults__, seen)
+        for cell in obj.__closure__ or ():
+            _feed(h, cell.cell_contents, seen)
+        # globals the function reads: helpers and constants from this package
+        g = obj.__globals__
+        for name in sorted(_code_names(obj.__code__)):
+            if name not in g:
+                continue
+            val = g[name]
+            if isinstance(val, types.ModuleType):
+                continue
+            if callable(val) and not (getattr(val, "__module__", None) or "").startswith(_PACKAGE):
+                continue
+            h.update(f"g:{name}=".encode())
+            _feed(h, val, seen)
+    else:
+        # unknown objects only contribute their type; their repr may hold an address
+        h.update(f"<{type(obj).__qualname__}>".encode())
+
+
+def fingerprint(*objs) -> str:
+    """
+    Stable hash of callables, patterns and plain values. A function's hash
+    covers its bytecode, constants, defaults and closure, plus (recursively)
+    every helper function, decorated function, class, compiled pattern or
+    constant from this package it reads as a global -- so editing a parser or
+    a pattern it uses changes it. The source of ``INPUT_MODULES`` is always
+    included.
+    """
+    h = hashlib.sha256(_SALT.encode())
+    h.update(_input_salt())
+    seen: set[int] = set()
+    for obj in objs:
+        _feed(h, obj, seen)
+    return h.hexdigest()[:24]
+
+
+_SPEC_FPS: dict[int, tuple[object, str]] = {}
+
+
+def spec_fingerprint(spec) -> str:
+    """Fingerprint of a TableSpec / NarrSpec / block function, computed once per object."""
+    hit = _SPEC_FPS.get(id(spec))
+    if hit is None or hit[0] is not spec:
+        if isinstance(spec, types.FunctionType):
+            fp = fingerprint(spec)
+        else:
+            # every dataclass field: anchors, parser, post, safety_pages_ahead ...
+            fp = fingerprint(type(spec).__name__, [(k, v) for k, v in vars(spec).items()])
+        hit = _SPEC_FPS[id(spec)] = (spec, fp)
+    return hit[1]
+
+
+def lines_digest(lines: Iterable[str]) -> str:
+    h = hashlib.sha256()
+    for ln in lines:
+        h.update(ln.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+# ---- cache ----
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    key       TEXT PRIMARY KEY,
+    value     BLOB NOT NULL,
+    nbytes    INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+"""
+
+
+class SectionCache:
+    """
+    On-disk cache of per-section parse results (DataFrames, narrative strings,
+    custom-block dicts), pickled into one SQLite file.
+
+    Callers key entries with ``make_key(spec_fp, input_digest)``: the section's
+    fingerprint plus a hash of its input (the sliced lines, or the whole
+    document for custom blocks). Least recently used entries are evicted once
+    the total exceeds ``max_bytes``.
+    """
+
+    def __init__(self, path: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path) if path else default_cache_dir() / "sections.sqlite"
+        self.max_bytes = int(max_bytes)
+        self.hits = self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def __getstate__(self):
+        return {"path": self.path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["max_bytes"])
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(spec_fp: str, input_digest: str) -> str:
+        return f"{spec_fp}:{input_digest}"
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """``(True, value)`` on a hit, ``(False, None)`` on a miss."""
+        db = self._db()
+        row = db.execute("SELECT value FROM sections WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                row = None  # written by an incompatible library version
+        if row is None:
+            self.misses += 1
+            return False, None
+        db.execute("UPDATE sections SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return True, value
+
+    def put(self, key: str, value: object) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._db().execute(
+            "INSERT OR REPLACE INTO sections VALUES (?, ?, ?, ?)",
+            (key, blob, len(blob), time.time()),
+        )
+
+    def total_bytes(self) -> int:
+        (n,) = self._db().execute("SELECT COALESCE(SUM(nbytes), 0) FROM sections").fetchone()
+        return int(n)
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """Drop least recently used results until under budget; return count dropped."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        db = self._db()
+        total = self.total_bytes()
+        if total <= budget:
+            return 0
+        dropped = 0
+        victims = db.execute("SELECT key, nbytes FROM sections ORDER BY last_used").fetchall()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for key, nbytes in victims:
+                if total <= budget:
+                    break
+                db.execute("DELETE FROM sections WHERE key = ?", (key,))
+                total -= nbytes
+                dropped += 1
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return dropped
+
+    def clear(self) -> None:
+        db = self._db()
+        db.execute("DELETE FROM sections")
+        db.execute("VACUUM")
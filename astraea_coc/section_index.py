@@ -0,0 +1,121 @@
+# section_index.py
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import Sequence
+
+from .budget import paused
+from .patterns import compile_re
+
+# Every numbered header a spec can anchor on: 1B-1., 1C-4c., ID-7a., C-4b., 1C5a. ...
+# Deliberately permissive; a hit is only a candidate and the spec's own pattern
+# is matched at that position before it counts.
+HEADER_RX = compile_re(r"^\s*[1-4I]?([A-E])[-–]?(\d{1,2})([a-z]?)\.", re.IGNORECASE | re.MULTILINE)
+
+# Recognizes anchor *patterns* of the form  ^\s*<section>[-–]<n><letter>\.  ...
+_ANCHOR_SRC_RX = compile_re(
+    r"^\^\\s\*"
+    r"(?:\[1I\](?P<a>[A-E])|\(\?:1[A-E]\|(?P<b>[A-E])\)|[1-4I]?(?P<c>[A-E]))"
+    r"\[-–\]\??"
+    r"(?P<num>\d{1,2})(?P<sub>[a-z]?)\\\."
+)
+
+Key = tuple[str, int, str]
+
+
+@lru_cache(maxsize=None)
+def anchor_key(pattern: str) -> Key | None:
+    """
+    Index key of a numbered-header anchor pattern, e.g.
+    ``^\\s*[1I]D[-–]9b\\.`` -> ``("D", 9, "b")``; None if the pattern is
+    anything else (title-only anchors, ``\\b1C[-–]4\\.\\b``, ``^\\s*2B\\.``).
+    """
+    m = _ANCHOR_SRC_RX.match(pattern)
+    if not m:
+        return None
+    letter = m.group("a") or m.group("b") or m.group("c")
+    return (letter.upper(), int(m.group("num")), m.group("sub").lower())
+
+
+class SectionIndex:
+    """
+    Positions of every numbered header in a document.
+
+    ``find`` answers "first page/offset where this anchor pattern matches"
+    with a dictionary lookup instead of rescanning every page. Pages are
+    indexed in order and only as far as a lookup needs, so on a lazy
+    ``Pages`` nothing past the last anchor asked for is extracted.
+    """
+
+    def __init__(self, pages: Sequence[tuple[int, str]]):
+        self._pages = iter(pages)
+        self._bodies: dict[int, str] = {}
+        self._entries: dict[Key, list[tuple[int, int]]] = {}
+        self._on_page: dict[int, list[tuple[Key, int]]] = {}
+        self._done = False
+
+    def _advance(self) -> bool:
+        """Index the next page; False once every page has been indexed."""
+        if self._done:
+            return False
+        # The index outlives the section that happens to extend it, so that
+        # section's budget must not stop it half way through a page (or kill
+        # the page iterator); indexing is not charged to the section.
+        with paused():
+            try:
+                pno, body = next(self._pages)
+            except StopIteration:
+                self._done = True
+                return False
+            self._bodies[pno] = body
+            for m in HEADER_RX.finditer(body):
+                key = (m.group(1).upper(), int(m.group(2)), m.group(3).lower())
+                self._entries.setdefault(key, []).append((pno, m.start()))
+                self._on_page.setdefault(pno, []).append((key, m.start()))
+        return True
+
+    def keys(self):
+        while self._advance():
+            pass
+        return self._entries.keys()
+
+    def find(self, key: Key, rx: re.Pattern) -> dict | None:
+        """First match of ``rx`` at an indexed ``key`` header, in document order."""
+        i = 0
+        while True:
+            entries = self._entries.get(key, ())
+            for pno, pos in entries[i:]:
+                m = rx.match(self._bodies[pno], pos)
+                if m:
+                    return {"page": pno, "match": m.group(0), "start": m.start(), "end": m.end()}
+            i = len(entries)
+            if not self._advance():
+                return None
+
+    def find_any(self, anchors: Sequence[tuple[Key | None, re.Pattern]], page: int = 1, pos: int = 0) -> dict | None:
+        """
+        Earliest match of any ``(key, rx)`` alternative from offset ``pos`` of
+        ``page`` on; a None key means ``rx`` is searched for on each page.
+        Pages are indexed only up to the first one with a hit, so one missing
+        alternative does not pull in the rest of the document.
+        """
+        while True:
+            while page not in self._bodies:
+                if not self._advance():
+                    return None
+            body = self._bodies[page]
+            best = None
+            for key, rx in anchors:
+                if key is None:
+                    m = rx.search(body, pos)
+                else:
+                    m = next(
+                        (m for k, at in self._on_page.get(page, ()) if k == key and at >= pos
+                         for m in [rx.match(body, at)] if m),
+                        None,
+                    )
+                if m and (best is None or m.start() < best.start()):
+                    best = m
+            if best:
+                return {"page": page, "match": best.group(0), "start": best.start(), "end": best.end()}
+            page, pos = page + 1, 0
@@ -1,34 +1,74 @@
-
 from __future__ import annotations
 import re
 from typing import Sequence
 
+from .section_index import anchor_key
+from .patterns import as_patterns, compile_re
+
+_WS_RX = compile_re(r"\s+")
+
+
+def _scan(pages: Sequence[tuple[int, str]], rx: re.Pattern) -> dict | None:
+    for pno, body in pages:
+        m = rx.search(body)
+        if m:
+            return {"page": pno, "match": m.group(0), "start": m.start(), "end": m.end()}
+    return None
+
+
+def _scan_any(pages: Sequence[tuple[int, str]], rxs: Sequence[re.Pattern], page: int, pos: int) -> dict | None:
+    for pno, body in pages:
+        if pno < page:
+            continue
+        at = pos if pno == page else 0
+        hits = [m for m in (rx.search(body, at) for rx in rxs) if m]
+        if hits:
+            m = min(hits, key=lambda m: m.start())
+            return {"page": pno, "match": m.group(0), "start": m.start(), "end": m.end()}
+    return None
+
+
 def slice_section_lines(pages: Sequence[tuple[int, str]], start_patterns, stop_patterns, safety_pages_ahead=3):
+    # Patterns may be raw strings or precompiled (IGNORECASE | MULTILINE), as in the specs.
+    # Numbered-header anchors are looked up in the document's SectionIndex when
+    # it has one (Pages does); anything else falls back to scanning the pages.
+    index = getattr(pages, "section_index", None)
+
     def find_on_pages(pats):
-        for pat in pats:
-            rx = re.compile(pat, re.IGNORECASE | re.MULTILINE)
-            for pno, body in pages:
-                m = rx.search(body)
-                if m:
-                    return {"page": pno, "match": m.group(0)}
+        for rx in as_patterns(pats):
+            key = anchor_key(rx.pattern) if index is not None else None
+            hit = index.find(key, rx) if key is not None else _scan(pages, rx)
+            if hit:
+                return hit
         return None
 
     start = find_on_pages(start_patterns)
-    assert start, f"Start anchor not found. Tried: {start_patterns}"
-    stop = find_on_pages(stop_patterns)
+    assert start, f"Start anchor not found. Tried: {[getattr(p, 'pattern', p) for p in start_patterns]}"
 
-    start_page = start["page"]
-    stop_page = stop["page"] if (stop and stop["page"] >= start_page) else start_page + safety_pages_ahead
+    # the section ends at whichever stop alternative comes first after its start;
+    # looking them up together reads no further than that page
+    stop_rxs = as_patterns(stop_patterns)
+    if index is not None:
+        stop = index.find_any([(anchor_key(rx.pattern), rx) for rx in stop_rxs], start["page"], start["end"])
+    else:
+        stop = _scan_any(pages, stop_rxs, start["page"], start["end"])
 
-    stitched = "\n".join([b for (p, b) in pages if start_page <= p <= stop_page])
+    start_page = start["page"]
+    stop_page = stop["page"] if stop else start_page + safety_pages_ahead
 
-    m_start = re.search(re.escape(start["match"]), stitched, re.IGNORECASE)
-    block = stitched[m_start.end():] if m_start else stitched
+    span = getattr(pages, "span", None)
+    if span is not None:
+        in_range = span(start_page, stop_page)
+    else:
+        in_range = [(p, b) for (p, b) in pages if start_page <= p <= stop_page]
+    stitched = "\n".join([b for (p, b) in in_range])
 
+    # the start page opens the stitched text, so the anchor offset carries over;
+    # the stop's offset is shifted by the pages (and joining newlines) before it
+    end = len(stitched)
     if stop:
-        m_stop = re.search(re.escape(stop["match"].splitlines()[0]), block, re.IGNORECASE)
-        if m_stop:
-            block = block[:m_stop.start()]
+        end = sum(len(b) + 1 for (p, b) in in_range if p < stop["page"]) + stop["start"]
+    block = stitched[start["end"]:end]
 
-    norm = [re.sub(r"\s+", " ", ln).strip() for ln in block.splitlines()]
+    norm = [_WS_RX.sub(" ", ln).strip() for ln in block.splitlines()]
     return [ln for ln in norm if ln]
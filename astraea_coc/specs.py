@@ -1,7 +1,10 @@
 # specs.py
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Callable, Sequence, Optional
 
+from .patterns import compile_all, any_of
+
 @dataclass(frozen=True)
 class TableSpec:
     key: str                       # df_1c1, df_1d9b, ...
@@ -11,6 +14,14 @@ class TableSpec:
     safety_pages_ahead: int = 3
     post: Optional[Callable] = None  # optional df cleanup
 
+    # compiled once at load time; anchors stay separate because they are tried in order
+    start_rx: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+    stop_rx: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "start_rx", compile_all(self.start, owner=self.key))
+        object.__setattr__(self, "stop_rx", compile_all(self.stop, owner=self.key))
+
 @dataclass(frozen=True)
 class NarrSpec:
     key: str                      # narr_1c4a, narr_1d7, ...
@@ -19,3 +30,15 @@ class NarrSpec:
     narr_start: Sequence[str]     # prompts / NOFO anchors
     narr_stop: Sequence[str]
     safety_pages_ahead: int = 3
+
+    anchor_start_rx: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+    anchor_stop_rx: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+    # narrative start/stop only need the earliest hit, so they merge into one alternation
+    narr_start_rx: re.Pattern = field(init=False, repr=False, compare=False)
+    narr_stop_rx: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "anchor_start_rx", compile_all(self.anchor_start, owner=self.key))
+        object.__setattr__(self, "anchor_stop_rx", compile_all(self.anchor_stop, owner=self.key))
+        object.__setattr__(self, "narr_start_rx", any_of(self.narr_start, owner=self.key))
+        object.__setattr__(self, "narr_stop_rx", any_of(self.narr_stop, owner=self.key))
@@ -1,5 +1,6 @@
 # specs_2024.py
 from __future__ import annotations
+from functools import partial
 
 from .specs import TableSpec, NarrSpec
 from .parsers import (
@@ -73,7 +74,7 @@ TABLE_SPECS_2024: list[TableSpec] = [
             r"^\s*1D[-–]1\.",
             r"^\s*2A[-–]1\.",
         ],
-        parser=lambda lines: parse_numbered_dual_tokens(lines, suffixes=("mou", "oth")),
+        parser=partial(parse_numbered_dual_tokens, suffixes=("mou", "oth")),
         safety_pages_ahead=3,
     ),
 
@@ -86,7 +87,7 @@ TABLE_SPECS_2024: list[TableSpec] = [
     TableSpec("df_1c5c",
         start=[r"^\s*1C[-–]5\.\s?.*$", r"\b1C[-–]5\.\b"],
         stop=[r"^\s*1C[-–]6\.", r"^\s*1D[-–]1\.", r"^\s*2A[-–]1\."],
-        parser=lambda lines: parse_numbered_dual_tokens(lines, suffixes=("proj", "ces")),
+        parser=partial(parse_numbered_dual_tokens, suffixes=("proj", "ces")),
         safety_pages_ahead=3,
     ),
 
@@ -156,7 +157,7 @@ TABLE_SPECS_2024: list[TableSpec] = [
             r"^\s*[1I]D[-–]4\.\s*",
         ],
         stop=[r"^\s*[1I]D[-–]5\.", r"^\s*[1I]D[-–]6\.", r"^\s*2A[-–]1\."],
-        parser=lambda lines: parse_numbered_dual_tokens(lines, suffixes=("engaged", "implemented")),
+        parser=partial(parse_numbered_dual_tokens, suffixes=("engaged", "implemented")),
         safety_pages_ahead=2,
     ),
 
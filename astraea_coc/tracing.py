@@ -0,0 +1,206 @@
+# tracing.py
+"""
+Timing spans around the pipeline's stages and sections.
+
+``span(name, cat)`` is a no-op unless a tracer is active in the current
+context (``tracing(...)``, which ``run_all(trace_dir=...)`` opens per PDF),
+so the hooks stay in place in normal runs. An active tracer records
+complete events and writes them as Chrome-trace JSON, which
+chrome://tracing and https://ui.perfetto.dev open directly.
+
+Each event also carries its self time (duration minus nested spans, e.g. a
+section minus the page extraction it triggered), which ``summarize`` adds
+up across a batch's trace files.
+
+With ``label_sections(True)`` (the regex profiler turns it on) spans also
+publish ``"<cat>/<name>"`` of the innermost one as ``current_section()``,
+traced or not.
+"""
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterable, Iterator
+
+TRACE_SUFFIX = ".trace.json"
+SUMMARY_NAME = "trace_summary.json"
+
+_CURRENT: ContextVar["Tracer | None"] = ContextVar("astraea_tracer", default=None)
+_SECTION: ContextVar[str] = ContextVar("astraea_section", default="-")
+_label_sections = False
+
+
+def label_sections(on: bool = True) -> None:
+    global _label_sections
+    _label_sections = on
+
+
+def current_section() -> str:
+    """``"<cat>/<name>"`` of the innermost open span, ``"-"`` outside any (needs ``label_sections``)."""
+    return _SECTION.get()
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start", "child_ns", "label")
+
+    def __init__(self, tracer: "Tracer | None", name: str, cat: str, args: dict):
+        self.tracer, self.name, self.cat, self.args = tracer, name, cat, args
+        self.label = None
+
+    def __enter__(self):
+        if _label_sections:
+            self.label = _SECTION.set(f"{self.cat}/{self.name}")
+        if self.tracer is not None:
+            self.child_ns = 0
+            self.tracer._stack.append(self)
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        end = time.perf_counter_ns()
+        if self.label is not None:
+            _SECTION.reset(self.label)
+        tracer = self.tracer
+        if tracer is None:
+            return False
+        tracer._stack.pop()
+        dur = end - self.start
+        if tracer._stack:
+            tracer._stack[-1].child_ns += dur
+        args = dict(self.args, self_us=(dur - self.child_ns) / 1000)
+        if exc_type is not None:
+            args["error"] = exc_type.__name__
+        tracer.events.append({
+            "name": self.name, "cat": self.cat, "ph": "X",
+            "ts": (self.start - tracer._t0) / 1000, "dur": dur / 1000,
+            "pid": tracer.pid, "tid": tracer.tid, "args": args,
+        })
+        return False
+
+
+def span(name: str, cat: str = "stage", **args):
+    """Context manager timing ``name``; free when no tracer is active."""
+    tracer = _CURRENT.get()
+    if tracer is None and not _label_sections:
+        return _NO_SPAN
+    return _Span(tracer, name, cat, args)
+
+
+class Tracer:
+    """Spans of one document, in the order they finished."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.events: list[dict] = []
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+        self.started = time.time()
+        self._stack: list[_Span] = []
+        self._t0 = time.perf_counter_ns()
+
+    def to_json(self) -> dict:
+        meta = {"name": "process_name", "ph": "M", "pid": self.pid, "tid": self.tid,
+                "args": {"name": self.name}}
+        return {
+            "traceEvents": [meta, *self.events],
+            "displayTimeUnit": "ms",
+            "otherData": {"source": self.name, "started": self.started},
+        }
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.to_json()), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+def trace_path(trace_dir: Path, pdf_path: Path) -> Path:
+    return Path(trace_dir) / f"{Path(pdf_path).stem}{TRACE_SUFFIX}"
+
+
+@contextmanager
+def tracing(name: str, path: Path | None) -> Iterator[Tracer | None]:
+    """Trace the block into a new ``Tracer`` written to ``path``; ``path=None`` traces nothing."""
+    if path is None:
+        yield None
+        return
+    tracer = Tracer(name)
+    token = _CURRENT.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _CURRENT.reset(token)
+        tracer.write(path)
+
+
+# ---- batch summary ----
+
+def summarize(paths: Iterable[Path], top: int = 15) -> dict:
+    """
+    Aggregate trace files: per ``(cat, name)`` the call count, summed self
+    and inclusive time and the worst single document, slowest self time
+    first; plus the ``top`` slowest documents.
+    """
+    sections: dict[tuple[str, str], dict] = {}
+    docs = []
+    for path in paths:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        source = data.get("otherData", {}).get("source", Path(path).name)
+        total = 0.0
+        for e in data["traceEvents"]:
+            if e.get("ph") != "X":
+                continue
+            dur = e["dur"] / 1e6
+            self_s = e["args"].get("self_us", e["dur"]) / 1e6
+            s = sections.setdefault((e["cat"], e["name"]), {
+                "cat": e["cat"], "name": e["name"], "count": 0,
+                "self_s": 0.0, "total_s": 0.0, "max_s": 0.0, "max_doc": None,
+            })
+            s["count"] += 1
+            s["self_s"] += self_s
+            s["total_s"] += dur
+            if dur > s["max_s"]:
+                s["max_s"], s["max_doc"] = dur, source
+            if e["cat"] == "pdf":
+                total += dur
+        docs.append({"source": source, "total_s": total})
+    docs.sort(key=lambda d: -d["total_s"])
+    return {
+        "documents": len(docs),
+        "sections": sorted(sections.values(), key=lambda s: -s["self_s"]),
+        "slowest_documents": docs[:top],
+    }
+
+
+def write_summary(trace_dir: Path, paths: Iterable[Path], top: int = 15) -> Path:
+    """``summarize`` the traces into ``trace_dir/trace_summary.json`` and print the slowest sections."""
+    summary = summarize(paths, top)
+    out = Path(trace_dir) / SUMMARY_NAME
+    out.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    print(f"\nSlowest sections over {summary['documents']} PDF(s) (self time; {out}):")
+    for s in summary["sections"][:top]:
+        print(
+            f"  {s['self_s']:8.2f}s  {s['cat']:9s} {s['name']:28s} x{s['count']:<5d} "
+            f"max {s['max_s']:.2f}s ({s['max_doc']})"
+        )
+    return out
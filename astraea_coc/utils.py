@@ -1,9 +1,17 @@
 
 from __future__ import annotations
+import csv
+import io
+import math
+import os
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
-import re
+from typing import TYPE_CHECKING
+
+from .patterns import rx, any_of
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 def ts() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -26,6 +34,22 @@ def save_csv_unique(path_base: Path, df: pd.DataFrame) -> Path:
     df.to_csv(out, index=False)
     return out
 
+def rows_csv_text(columns, rows) -> str:
+    """CSV text of plain rows (None/NaN -> empty cell), as save_rows_csv_unique writes it."""
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator=os.linesep)
+    w.writerow(columns)
+    for row in rows:
+        w.writerow(["" if v is None or (isinstance(v, float) and math.isnan(v)) else v for v in row])
+    return buf.getvalue()
+
+def save_rows_csv_unique(path_base: Path, columns, rows) -> Path:
+    """Like save_csv_unique for plain rows (None/NaN -> empty cell), no DataFrame needed."""
+    out = unique_path(path_base)
+    with open(out, "w", newline="", encoding="utf-8") as f:
+        f.write(rows_csv_text(columns, rows))
+    return out
+
 def norm_token(x):
     if not isinstance(x, str): return x
     k = x.strip().lower()
@@ -52,7 +76,16 @@ BOILERPLATE_PATTERNS = [
     r"^Page\s+\d+.*?$",
 ]
 
+# Applied in this order. Line-local patterns are merged per pass; the limit
+# pattern stays on its own because its \s* can swallow lines emptied by the
+# pass before it, and merging would change which blank lines survive.
+_BOILERPLATE_PASSES = (
+    any_of(BOILERPLATE_PATTERNS[:2]),
+    rx(BOILERPLATE_PATTERNS[2]),
+    any_of(BOILERPLATE_PATTERNS[3:]),
+)
+
 def scrub_boilerplate(text: str) -> str:
-    for bp in BOILERPLATE_PATTERNS:
-        text = re.sub(bp, "", text, flags=re.IGNORECASE | re.MULTILINE)
+    for bp in _BOILERPLATE_PASSES:
+        text = bp.sub("", text)
     return text
@@ -0,0 +1,90 @@
+# workers.py
+from __future__ import annotations
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from importlib.util import find_spec
+
+from .backends import DEFAULT_BACKEND, auto_ladder, get_backend
+from .io_extract import ENGINE_AUTO
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+# What a worker needs before its first PDF: the pipeline (which compiles
+# every spec and block pattern at import) and the caches it talks to.
+PRELOAD_MODULES = tuple(
+    f"{_PACKAGE}.{m}"
+    for m in ("pipeline", "io_extract", "page_cache", "section_cache", "build_wide", "records")
+)
+
+START_METHODS = ("auto", "forkserver", "fork", "spawn")
+
+
+def backend_modules(engine: str) -> list[str]:
+    """Import names of the installed PDF libraries ``engine`` may use."""
+    backends = auto_ladder() if engine == ENGINE_AUTO else [get_backend(engine)]
+    names = []
+    for b in backends:
+        for name in (b.module, b.fallback and get_backend(b.fallback).module):
+            if name and name not in names and find_spec(name) is not None:
+                names.append(name)
+    return names
+
+
+def mp_context(method: str = "auto", engine: str = DEFAULT_BACKEND):
+    """
+    Multiprocessing context for the batch pool. ``auto`` picks forkserver
+    where the platform has it, else spawn. With forkserver the package and
+    the backend library are imported once in the server, and every worker
+    is forked from it with them already loaded.
+    """
+    if method == "auto":
+        method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+    ctx = mp.get_context(method)
+    if method == "forkserver":
+        # "__main__" is forkserver's default preload; keep it
+        ctx.set_forkserver_preload(["__main__", *PRELOAD_MODULES, *backend_modules(engine)])
+    return ctx
+
+
+def warm_worker(engine: str = DEFAULT_BACKEND, fingerprints: bool = False) -> None:
+    """
+    Pool initializer: import the pipeline and the backend library, build
+    the wide schema and look up backend versions, so a worker's first task
+    costs the same as its last. ``fingerprints`` also hashes every spec and
+    block for the section cache. Cheap when the forkserver already did it.
+    """
+    for name in PRELOAD_MODULES:
+        import_module(name)
+    for name in backend_modules(engine):
+        try:
+            import_module(name)
+        except Exception as e:  # reported properly when the backend is opened
+            print(f"[info] could not preload {name}: {e}")
+
+    from .build_wide import wide_schema
+    from .pipeline import CUSTOM_BLOCKS_2024
+    from .specs_2024 import NARR_SPECS_2024, TABLE_SPECS_2024
+
+    wide_schema()
+    for b in auto_ladder() if engine == ENGINE_AUTO else [get_backend(engine)]:
+        b.version()
+    if fingerprints:
+        from .section_cache import spec_fingerprint
+        for spec in (*TABLE_SPECS_2024, *NARR_SPECS_2024, *CUSTOM_BLOCKS_2024):
+            spec_fingerprint(spec)
+
+
+def worker_pool(
+    jobs: int,
+    engine: str = DEFAULT_BACKEND,
+    start_method: str = "auto",
+    fingerprints: bool = False,
+) -> ProcessPoolExecutor:
+    """``ProcessPoolExecutor`` whose workers are warmed by ``warm_worker``."""
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=mp_context(start_method, engine),
+        initializer=warm_worker,
+        initargs=(engine, fingerprints),
+    )
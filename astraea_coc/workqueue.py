@@ -0,0 +1,192 @@
+# workqueue.py
+"""
+A work queue that lives in a shared directory, so runners on several hosts
+(or several runners on one host) can split a batch without a server.
+
+    <root>/leases/<pdf name>.lease        who is parsing it right now
+    <root>/results/<pdf name>.json        its rows, shaped like a manifest entry
+    <root>/results/<pdf name>.error.json  why it failed
+
+A runner claims a PDF by creating its lease with ``O_CREAT | O_EXCL``,
+which only one creator wins (also on NFS v3+). While it works, a heartbeat
+thread keeps touching its leases; a lease untouched for ``lease_s`` seconds
+belongs to a dead runner and may be taken over. A result is written
+atomically before its lease is released, so "claimed, then no result yet"
+is the only state worth waiting for.
+
+Delivery is at least once: a runner that stalls past ``lease_s`` can lose
+its PDF to another, and both then write the same result.
+"""
+from __future__ import annotations
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+DEFAULT_LEASE_S = 120.0
+
+
+class Lease(NamedTuple):
+    name: str       # PDF file name
+    path: Path
+
+
+def _write_json(path: Path, data: dict) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, default=str), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class WorkQueue:
+    """Leases and per-PDF results under ``root``; PDFs are keyed by file name."""
+
+    def __init__(self, root: Path, lease_s: float = DEFAULT_LEASE_S):
+        self.root = Path(root)
+        self.lease_s = lease_s
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.leases = self.root / "leases"
+        self.results = self.root / "results"
+        self.leases.mkdir(parents=True, exist_ok=True)
+        self.results.mkdir(parents=True, exist_ok=True)
+        self._held: dict[str, Lease] = {}
+        self._lock = threading.Lock()
+
+    # ---- leases ----
+
+    def _stale(self, path: Path) -> bool:
+        try:
+            return time.time() - path.stat().st_mtime > self.lease_s
+        except FileNotFoundError:
+            return True
+
+    def claim(self, name: str) -> Lease | None:
+        """Take the lease on ``name``, or None while another runner holds a live one."""
+        path = self.leases / f"{name}.lease"
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not self._stale(path) or not self._take_over(path):
+                    return None
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"owner": self.owner, "since": time.time()}, f)
+            lease = Lease(name, path)
+            with self._lock:
+                self._held[name] = lease
+            return lease
+        return None
+
+    def _take_over(self, path: Path) -> bool:
+        """Remove a stale lease; only one of several runners doing this at once succeeds."""
+        grave = path.with_name(f"{path.name}.{self.owner.replace(':', '_')}.stale")
+        try:
+            os.rename(path, grave)
+        except FileNotFoundError:
+            return False
+        if not self._stale(grave):
+            # it was renewed, or replaced, since we looked: put it back
+            try:
+                os.link(grave, path)
+            except FileExistsError:
+                pass
+            grave.unlink(missing_ok=True)
+            return False
+        print(f"[info] taking over stale lease {path.name} ({(_read_json(grave) or {}).get('owner')})")
+        grave.unlink(missing_ok=True)
+        return True
+
+    def release(self, lease: Lease) -> None:
+        with self._lock:
+            self._held.pop(lease.name, None)
+        if (_read_json(lease.path) or {}).get("owner") == self.owner:
+            lease.path.unlink(missing_ok=True)
+
+    def renew(self) -> None:
+        """Touch every held lease (the heartbeat)."""
+        with self._lock:
+            held = list(self._held.values())
+        for lease in held:
+            try:
+                os.utime(lease.path)
+            except FileNotFoundError:
+                print(f"[info] lease on {lease.name} was taken over; another runner may parse it too")
+
+    @contextmanager
+    def heartbeat(self) -> Iterator[None]:
+        """Renew held leases every quarter ``lease_s`` for the duration of the block."""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(self.lease_s / 4):
+                self.renew()
+
+        thread = threading.Thread(target=beat, name="lease-heartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def live_leases(self) -> list[str]:
+        """Names of PDFs some runner is working on right now."""
+        return [
+            p.name[: -len(".lease")] for p in self.leases.glob("*.lease") if not self._stale(p)
+        ]
+
+    # ---- results ----
+
+    def result_path(self, name: str) -> Path:
+        return self.results / f"{name}.json"
+
+    def error_path(self, name: str) -> Path:
+        return self.results / f"{name}.error.json"
+
+    def put_result(self, name: str, entry: dict) -> None:
+        self.error_path(name).unlink(missing_ok=True)
+        _write_json(self.result_path(name), {**entry, "runner": self.owner, "time": time.time()})
+
+    def put_error(self, name: str, entry: dict) -> None:
+        _write_json(self.error_path(name), {**entry, "runner": self.owner, "time": time.time()})
+
+    @staticmethod
+    def _matches(entry: dict | None, **inputs) -> dict | None:
+        if entry and all(entry.get(k) == v for k, v in inputs.items()):
+            return entry
+        return None
+
+    def result(self, name: str, digest: str, engine: str, parser: str) -> dict | None:
+        """The stored result for these exact inputs, if any."""
+        return self._matches(_read_json(self.result_path(name)), digest=digest, engine=engine, parser=parser)
+
+    def error(self, name: str, digest: str, engine: str, parser: str) -> dict | None:
+        """The recorded failure for these exact inputs, if any."""
+        return self._matches(_read_json(self.error_path(name)), digest=digest, engine=engine, parser=parser)
+
+    def settled(self, name: str, stat: os.stat_result, engine: str, parser: str) -> bool:
+        """
+        Whether ``name`` has a result or a recorded failure for a file of this
+        size and mtime (``stat``), engine and parser; the file is not read.
+        """
+        inputs = dict(size=stat.st_size, mtime_ns=stat.st_mtime_ns, engine=engine, parser=parser)
+        return any(
+            self._matches(_read_json(path), **inputs) is not None
+            for path in (self.result_path(name), self.error_path(name))
+        )
+
+    def previous(self, name: str) -> dict | None:
+        """The stored result whatever its inputs (for scheduling)."""
+        return _read_json(self.result_path(name))
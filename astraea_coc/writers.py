@@ -0,0 +1,159 @@
+# writers.py
+from __future__ import annotations
+import math
+import shutil
+from pathlib import Path
+from typing import Iterable, Sequence
+
+MAIN_SHEET = "Sheet1"          # what DataFrame.to_excel names it
+NARRATIVE_SHEET = "narratives"
+
+
+def _blank(v) -> bool:
+    return v is None or (isinstance(v, float) and math.isnan(v))
+
+
+def split_narratives(
+    columns: Sequence[str],
+    narrative_cols: Iterable[str],
+    key_cols: Sequence[str] = ("1a_1b",),
+) -> tuple[list[int], list[int]]:
+    """
+    Column positions for the main sheet and the narrative side sheet. The
+    side sheet repeats ``key_cols`` (the CoC number, ``__source_pdf``) so
+    its rows can be joined back to the main grid.
+    """
+    narr = set(narrative_cols)
+    main = [i for i, c in enumerate(columns) if c not in narr]
+    side = [i for i, c in enumerate(columns) if c in key_cols]
+    side += [i for i, c in enumerate(columns) if c in narr]
+    return main, side
+
+
+def write_xlsx_stream(
+    path: Path,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    narrative_cols: Iterable[str] = (),
+    key_cols: Sequence[str] = ("1a_1b", "__source_pdf"),
+) -> int:
+    """
+    Write ``rows`` (sequences aligned with ``columns``) with xlsxwriter in
+    constant_memory mode: each row is flushed to disk as soon as it is
+    written, so memory stays flat however many rows there are.
+
+    Columns named in ``narrative_cols`` go to a second sheet instead, keyed by
+    ``key_cols``. Returns the number of rows written.
+    """
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(
+        str(path),
+        {"constant_memory": True, "strings_to_numbers": False,
+         "strings_to_formulas": False, "strings_to_urls": False},
+    )
+    bold = wb.add_format({"bold": True})
+    narrative_cols = list(narrative_cols)
+    if narrative_cols:
+        main_idx, side_idx = split_narratives(columns, narrative_cols, key_cols)
+    else:
+        main_idx, side_idx = list(range(len(columns))), []
+    # constant_memory only keeps the current row per sheet, so both sheets
+    # are filled in step, one source row at a time
+    sheets = [(wb.add_worksheet(MAIN_SHEET), main_idx)]
+    if side_idx:
+        sheets.append((wb.add_worksheet(NARRATIVE_SHEET), side_idx))
+
+    for ws, idx in sheets:
+        ws.write_row(0, 0, [columns[i] for i in idx], bold)
+        ws.freeze_panes(1, 0)
+
+    n = 0
+    try:
+        for r, row in enumerate(rows, start=1):
+            for ws, idx in sheets:
+                for c, i in enumerate(idx):
+                    v = row[i]
+                    if _blank(v):
+                        continue
+                    if isinstance(v, str):
+                        ws.write_string(r, c, v)
+                    else:
+                        ws.write(r, c, v)
+            n = r
+    finally:
+        wb.close()
+    return n
+
+
+PARTITION_COL = "state"
+
+
+def coc_state(coc_number) -> str:
+    """State prefix of a CoC number: ``"NJ-509"`` -> ``"NJ"``."""
+    head = "" if _blank(coc_number) else str(coc_number).strip().split("-", 1)[0]
+    return head.upper() if head.isalpha() and len(head) == 2 else "__unknown"
+
+
+def write_parquet_dataset(
+    root: Path,
+    columns: Sequence[str],
+    rows: Sequence[Sequence],
+    narrative_cols: Iterable[str] = (),
+    answer_cols: Iterable[str] = (),
+    coc_col: str = "1a_1b",
+) -> int:
+    """
+    Write ``rows`` as a Parquet dataset under ``root``, hive-partitioned by
+    the state prefix of ``coc_col`` (``root/state=NJ/...``), so readers can
+    prune partitions and project columns.
+
+    Every column is text. ``answer_cols`` (the Yes/No/Nonexistent columns,
+    ``build_wide.ANSWER_COLS``) are stored as Arrow dictionaries, so each
+    column has the same type in every run whatever its values. Everything is
+    zstd compressed, with a higher level for ``narrative_cols``.
+
+    The dataset holds exactly ``rows``: partitions left under ``root`` by an
+    earlier run are removed first, including those of states no longer in
+    it. Returns the number of files written.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    answer_type = pa.dictionary(pa.int8(), pa.string())
+    coc_i = list(columns).index(coc_col)
+    narr = set(narrative_cols)
+    answers = set(answer_cols)
+    arrays, fields = [], []
+    for i, name in enumerate(columns):
+        values = [None if _blank(r[i]) else str(r[i]) for r in rows]
+        if name in answers:
+            arr = pa.array(values, pa.string()).dictionary_encode().cast(answer_type)
+        else:
+            arr = pa.array(values, pa.string())
+        arrays.append(arr)
+        fields.append(pa.field(name, arr.type))
+    states = pa.array([coc_state(r[coc_i]) for r in rows], pa.string())
+    arrays.append(states)
+    fields.append(pa.field(PARTITION_COL, pa.string()))
+    table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    fmt = ds.ParquetFileFormat()
+    options = fmt.make_write_options(
+        compression="zstd",
+        compression_level={c: (9 if c in narr else 3) for c in columns},
+    )
+    for part in Path(root).glob(f"{PARTITION_COL}=*"):
+        shutil.rmtree(part)
+    written: list[str] = []
+    ds.write_dataset(
+        table,
+        str(root),
+        format=fmt,
+        file_options=options,
+        partitioning=[PARTITION_COL],
+        partitioning_flavor="hive",
+        existing_data_behavior="delete_matching",
+        file_visitor=lambda f: written.append(f.path),
+    )
+    return len(written)
@@ -0,0 +1,221 @@
+# bench_parsers.py
+"""
+Micro-benchmarks for the slicer, the table/narrative parsers, parse_1e and
+the wide-row builder, each timed in isolation on synthetic input (see
+``synthetic.py``) at several sizes.
+
+    python benchmarks/bench_parsers.py -o bench.json
+    python benchmarks/bench_parsers.py --sizes large --filter parse_ --compare bench.json
+    python benchmarks/bench_parsers.py --sizes small --rows 1000 --wrap 5
+
+Results are JSON (one record per bench and size). ``--compare`` reads an
+earlier run and exits 1 when any bench got slower by more than
+``--threshold`` (best-of-repeats, so noise mostly cancels out). Records
+are matched on bench and size name, so compare runs with the same overrides.
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(Path(__file__).resolve().parent)]
+
+from astraea_coc.build_wide import build_wide_row  # noqa: E402
+from astraea_coc.narratives import extract_narrative_after_limit  # noqa: E402
+from astraea_coc.pages import Pages  # noqa: E402
+from astraea_coc.parsers import (  # noqa: E402
+    parse_numbered_dual_tokens, parse_numbered_yesno, parse_triple_table,
+)
+from astraea_coc.pipeline import parse_1e  # noqa: E402
+from astraea_coc.slicer import slice_section_lines  # noqa: E402
+from astraea_coc.specs_2024 import NARR_SPECS_2024, TABLE_SPECS_2024  # noqa: E402
+
+import synthetic  # noqa: E402
+
+SCHEMA = 1
+
+
+class Bench(NamedTuple):
+    name: str
+    # size -> zero-argument callable doing one unit of work, or None to skip
+    setup: Callable[[synthetic.Size], Callable[[], object] | None]
+
+
+def _spec(specs, key):
+    return next(s for s in specs if s.key == key)
+
+
+def _slice(size):
+    texts = synthetic.document(size)
+    spec = _spec(TABLE_SPECS_2024, "df_1c4c")
+    # a fresh Pages each call, so the section index is built every time as in a real run
+    return lambda: slice_section_lines(Pages(texts), spec.start_rx, spec.stop_rx, spec.safety_pages_ahead)
+
+
+def _table(kind, parser, **kw):
+    def setup(size):
+        lines = synthetic.numbered_rows(kind, size.rows, size.wrap)
+        return lambda: parser(lines, lean=True, **kw)
+    return setup
+
+
+def _narrative(size):
+    spec = _spec(NARR_SPECS_2024, "narr_5e")
+    lines = [
+        *synthetic.narrative_lines("1C-5e", "Facilitating Safe Access to Housing", size.narrative_words),
+        "1C-5f. Identifying and Removing Barriers",
+    ]
+    return lambda: extract_narrative_after_limit(lines, spec.narr_start_rx, spec.narr_stop_rx)
+
+
+def _parse_1e(size):
+    texts = synthetic.document(size)
+    return lambda: parse_1e(Pages(texts))
+
+
+def _wide_inputs(size) -> dict:
+    def rows(kind, seed):
+        return synthetic.numbered_rows(kind, size.rows, size.wrap, seed)
+
+    return dict(
+        meta_vals={"coc_number": "XX-000", "coc_name": "Synthetic CoC"},
+        df_1b1=parse_triple_table(rows("triple", 1), lean=True),
+        df_1c1=parse_numbered_yesno(rows("yesno", 2), lean=True),
+        df_1c2=parse_numbered_yesno(rows("yesno", 3), lean=True),
+        df_1c4c=parse_numbered_dual_tokens(rows("dual", 4), suffixes=("mou", "oth"), lean=True),
+        **parse_1e(Pages(synthetic.document(size))),
+    )
+
+
+def _build_wide_row(size):
+    kwargs = _wide_inputs(size)
+    return lambda: build_wide_row(**kwargs)
+
+
+def _build_wide(size):
+    if find_spec("pandas") is None:
+        return None
+    from astraea_coc.build_wide import build_wide
+    kwargs = _wide_inputs(size)
+    return lambda: build_wide(**kwargs)
+
+
+BENCHES = [
+    Bench("slice_section_lines", _slice),
+    Bench("parse_triple_table", _table("triple", parse_triple_table)),
+    Bench("parse_numbered_yesno", _table("yesno", parse_numbered_yesno)),
+    Bench("parse_numbered_dual_tokens", _table("dual", parse_numbered_dual_tokens, suffixes=("mou", "oth"))),
+    Bench("extract_narrative_after_limit", _narrative),
+    Bench("parse_1e", _parse_1e),
+    Bench("build_wide_row", _build_wide_row),
+    Bench("build_wide", _build_wide),
+]
+
+
+def run_bench(fn: Callable[[], object], repeat: int, min_time: float) -> tuple[int, list[float]]:
+    """Calls per repeat (calibrated so one repeat takes ``min_time``) and per-call seconds."""
+    timer = timeit.Timer(fn)
+    number, took = timer.autorange()
+    if took < min_time:
+        number = max(1, int(number * min_time / max(took, 1e-9)))
+    return number, [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+
+def _git_rev() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Messages for every (bench, size) whose best time grew by more than ``threshold``."""
+    old = {(r["bench"], r["size"]): r for r in baseline.get("results", []) if r.get("best_s")}
+    out = []
+    for r in results:
+        b = old.get((r["bench"], r["size"]))
+        if b is None or not r.get("best_s"):
+            continue
+        ratio = r["best_s"] / b["best_s"]
+        mark = "REGRESSION" if ratio > 1 + threshold else "ok"
+        print(f"  {r['bench']:32s} {r['size']:7s} {b['best_s'] * 1e6:10.1f}us -> "
+              f"{r['best_s'] * 1e6:10.1f}us  x{ratio:.2f}  {mark}")
+        if mark != "ok":
+            out.append(f"{r['bench']} [{r['size']}] x{ratio:.2f}")
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", nargs="+", default=list(synthetic.SIZES), choices=list(synthetic.SIZES))
+    for knob in synthetic.Size._fields:
+        parser.add_argument(f"--{knob.replace('_', '-')}", type=int, default=None,
+                            help=f"Override {knob} in every selected size.")
+    parser.add_argument("--filter", default="", help="Only benches whose name contains this substring.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats per bench (default: 5).")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Seconds each repeat should take at least (default: 0.2).")
+    parser.add_argument("-o", "--output", default=None, help="Write results to this JSON file.")
+    parser.add_argument("--compare", default=None, help="Baseline JSON from an earlier run.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown vs the baseline, as a fraction (default: 0.10).")
+    args = parser.parse_args(argv)
+
+    overrides = {k: getattr(args, k) for k in synthetic.Size._fields if getattr(args, k) is not None}
+    results = []
+    for bench in BENCHES:
+        if args.filter not in bench.name:
+            continue
+        for size_name in args.sizes:
+            size = synthetic.SIZES[size_name]._replace(**overrides)
+            record = {"bench": bench.name, "size": size_name, "params": size._asdict()}
+            fn = bench.setup(size)
+            if fn is None:
+                record["skipped"] = "dependency not installed"
+                print(f"[info] {bench.name} [{size_name}]: skipped")
+                results.append(record)
+                continue
+            number, times = run_bench(fn, args.repeat, args.min_time)
+            record.update(
+                number=number, repeat=args.repeat,
+                best_s=min(times), median_s=statistics.median(times),
+                per_call_us=round(min(times) * 1e6, 3),
+            )
+            print(f"[info] {bench.name} [{size_name}]: {record['per_call_us']:.1f}us/call "
+                  f"(median {record['median_s'] * 1e6:.1f}us, {number} x {args.repeat})")
+            results.append(record)
+
+    report = {
+        "schema": SCHEMA,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git_rev": _git_rev(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print(f"Compared with {args.compare} (git {baseline.get('git_rev')}):")
+        slower = compare(results, baseline, args.threshold)
+        if slower:
+            print(f"{len(slower)} regression(s) over {args.threshold:.0%}: {', '.join(slower)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
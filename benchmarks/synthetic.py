@@ -0,0 +1,158 @@
+# synthetic.py
+"""
+Generators of synthetic CoC-application text for the parser benchmarks.
+
+Everything is deterministic for a given ``seed`` and scales with the knobs
+the parsers are sensitive to: numbered rows, wrapped label lines, narrative
+length and page count.
+"""
+from __future__ import annotations
+import random
+from typing import NamedTuple
+
+ANSWERS = ("Yes", "No", "Nonexistent")
+_WORDS = (
+    "housing coc project agency homeless services shelter program county "
+    "community outreach partners funding youth veterans families permanent "
+    "supportive rapid rehousing coordinated entry data system review ranking "
+    "providers local public health survivors violence domestic equity"
+).split()
+
+
+class Size(NamedTuple):
+    rows: int              # numbered rows per table
+    wrap: int              # extra lines each row label is wrapped over
+    narrative_words: int   # words per narrative answer
+    pages: int             # pages per document
+
+
+SIZES = {
+    "small": Size(rows=10, wrap=0, narrative_words=120, pages=20),
+    "medium": Size(rows=40, wrap=1, narrative_words=400, pages=70),
+    "large": Size(rows=200, wrap=3, narrative_words=2000, pages=300),
+}
+
+
+def _words(rng: random.Random, n: int) -> list[str]:
+    return [rng.choice(_WORDS) for _ in range(n)]
+
+
+def _wrapped(words: list[str], parts: int) -> list[str]:
+    """Split ``words`` into ``parts`` non-empty lines (fewer if there are too few words)."""
+    parts = max(1, min(parts, len(words)))
+    step = -(-len(words) // parts)
+    return [" ".join(words[i:i + step]) for i in range(0, len(words), step)]
+
+
+def numbered_rows(kind: str, n_rows: int, wrap: int = 0, seed: int = 0) -> list[str]:
+    """
+    Table lines as the slicer hands them to the parsers: ``kind`` is
+    ``"triple"`` (1B-1), ``"yesno"`` (1C-1 ...) or ``"dual"`` (1C-4c ...).
+    Each label spans ``wrap + 1`` lines, the answers close the last one.
+    """
+    n_tokens = {"triple": 3, "yesno": 1, "dual": 2}[kind]
+    rng = random.Random(seed)
+    lines = []
+    for i in range(1, n_rows + 1):
+        label = _wrapped(_words(rng, 4 + 3 * wrap), wrap + 1)
+        tokens = " ".join(rng.choice(ANSWERS) for _ in range(n_tokens))
+        label[0] = f"{i}. {label[0]}"
+        label[-1] = f"{label[-1]} {tokens}"
+        lines.extend(label)
+    return lines
+
+
+def narrative_paragraphs(n_words: int, seed: int = 0, width: int = 90) -> list[str]:
+    """Answer text: paragraphs of ~60 words, wrapped at ``width`` characters."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    left = n_words
+    while left > 0:
+        para, line = _words(rng, min(60, left)), ""
+        left -= len(para)
+        for w in para:
+            if len(line) + len(w) + 1 > width:
+                lines.append(line)
+                line = w
+            else:
+                line = f"{line} {w}".strip()
+        lines += [line, ""]
+    return lines
+
+
+def narrative_lines(code: str, title: str, n_words: int, seed: int = 0) -> list[str]:
+    """One narrative question: header, prompt, limit line, then the answer."""
+    return [
+        f"{code}. {title}",
+        "NOFO Section V.B.1.e",
+        "Describe in the field below how your CoC:",
+        "1. worked with partners on this question;",
+        "(limit 2,500 characters)",
+        "",
+        *narrative_paragraphs(n_words, seed),
+    ]
+
+
+def _section_1e(size: Size, rng: random.Random) -> list[list[str]]:
+    """1E-1 .. 1E-5d as blocks, laid out the way parse_1e expects."""
+    def yesno(n):
+        return numbered_rows("yesno", n, size.wrap, rng.randrange(1 << 30))
+
+    def date():
+        return f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2024"
+
+    def narr(code, title):
+        return narrative_lines(code, title, size.narrative_words, rng.randrange(1 << 30))
+
+    return [
+        ["1E-1. Web Posting of Advance Public Notice",
+         f"1. Enter the date your CoC published the deadline. {date()}",
+         f"2. Enter the date your CoC published the criteria. {date()}"],
+        ["1E-2. Project Review and Ranking Process", *yesno(6)],
+        ["1E-2a. Scored Project Forms",
+         "1. What were the maximum number of points available for the renewal project form(s)? 100",
+         "2. How many renewal projects did your CoC submit? 12",
+         "3. What renewal project type did most applicants use? PH-PSH"],
+        narr("1E-2b", "Addressing Severity of Needs"),
+        narr("1E-3", "Advancing Racial Equity"),
+        narr("1E-4", "Reallocation"),
+        ["1E-4a. Reallocation Between FY 2019 and FY 2024", "Did your CoC reallocate? Yes"],
+        ["1E-5. Projects Rejected/Reduced", *yesno(3), f"4. Date notified {date()}"],
+        ["1E-5a. Projects Accepted", date()],
+        narr("1E-5b", "Local Competition Selection Results"),
+        ["1E-5c. Web Posting of CoC-Approved Consolidated Application", date()],
+        ["1E-5d. Notification to Community Members", date()],
+        ["2A-1. HMIS Vendor", "Vendor name"],
+    ]
+
+
+def document(size: Size | str = "medium", seed: int = 0) -> list[str]:
+    """
+    Page texts of a synthetic application: 1B-1 / 1C-1 / 1C-4c tables, a
+    1C-5e narrative and the whole 1E section, spread over ``size.pages``
+    pages with filler pages in between and a footer on every page.
+    """
+    size = SIZES[size] if isinstance(size, str) else size
+    rng = random.Random(seed)
+    blocks = [
+        ["1B-1. Inclusive Structure and Participation", *numbered_rows("triple", size.rows, size.wrap, seed)],
+        ["1B-1a. Experience Promoting Inclusivity", *narrative_paragraphs(size.narrative_words, seed)],
+        ["1C-1. Coordination with Federal, State, Local, Private, and Other Organizations",
+         *numbered_rows("yesno", size.rows, size.wrap, seed + 1)],
+        ["1C-4. Continuum of Care Coordination with Education Providers",
+         "1C-4c. Written Agreements with Local Education Agencies",
+         *numbered_rows("dual", size.rows, size.wrap, seed + 2)],
+        ["1C-5. Coordination with Organizations Serving Survivors",
+         *narrative_lines("1C-5e", "Facilitating Safe Access to Housing", size.narrative_words, seed + 3)],
+        ["1C-5f. Identifying and Removing Barriers", "Yes"],
+        *_section_1e(size, rng),
+    ]
+    n_pages = max(size.pages, len(blocks))
+    # sections land on evenly spaced pages; the rest is filler
+    at = {round(i * n_pages / len(blocks)): b for i, b in enumerate(blocks)}
+    pages = []
+    for p in range(n_pages):
+        body = at.get(p) or narrative_paragraphs(150, seed * 1000 + p)
+        footer = [f"Applicant: Synthetic CoC XX-{seed % 1000:03d}", f"Page {p + 1} of {n_pages}"]
+        pages.append("\n".join([*body, *footer]))
+    return pages
@@ -6,19 +6,52 @@ Loop over all 2024 CoC application PDFs in a directory, starting
 alphabetically from NJ-509 onward, run the astraea_coc pipeline on each
 (in parallel), collect the resulting wide_df, and save one big stacked
 sheet to an Excel workbook.
+
+A manifest next to the workbook remembers each PDF's content hash, size
+and mtime, engine and parser fingerprint; unchanged PDFs reuse their stored
+rows. A PDF counts as unchanged when its size and mtime are as recorded;
+``--verify`` compares content hashes instead, for storage where a rewrite
+can keep both.
+
+To split a batch across hosts, start a runner on each with the same
+``--queue`` directory on shared storage; runners claim PDFs through lease
+files and publish per-PDF results there. Once they have exited, one
+``--queue DIR --merge`` run builds the workbook from the results:
+
+    build_all_wide_xlsx.py APPS --queue /shared/q -j 16     # on every host
+    build_all_wide_xlsx.py APPS --queue /shared/q --merge -o all.xlsx
 """
 
 from pathlib import Path
 import argparse
 import sys
+import time
 import traceback
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext
+from itertools import islice
 import os
 
-import pandas as pd
-
 from astraea_coc.pipeline import run_all
-from astraea_coc.build_wide import col_order_extended
+from astraea_coc.build_wide import ANSWER_COLS, NARRATIVE_COLS, wide_schema
+from astraea_coc.schema import RowAccumulator, WideRow
+from astraea_coc.page_cache import PageCache, default_cache_dir, file_digest
+from astraea_coc.manifest import Manifest, parser_fingerprint
+from astraea_coc.section_cache import SectionCache
+from astraea_coc.writers import (
+    NARRATIVE_SHEET, MAIN_SHEET, split_narratives, write_parquet_dataset, write_xlsx_stream,
+)
+from astraea_coc.io_extract import PARALLEL_PAGE_THRESHOLD, ENGINE_AUTO
+from astraea_coc.backends import BACKENDS, DEFAULT_BACKEND
+from astraea_coc.workers import START_METHODS, worker_pool
+from astraea_coc.artifacts import COMPRESSIONS, ArtifactStore
+from astraea_coc.tracing import trace_path, write_summary
+from astraea_coc import regex_profile
+from astraea_coc.scheduling import MIN_TASK_S, Task, estimate_costs, plan
+from astraea_coc.workqueue import DEFAULT_LEASE_S, WorkQueue
+from astraea_coc.prefetch import Prefetcher
+
+QUEUE_POLL_S = 5.0
 
 
 def select_pdfs_2024_from_nj509(apps_dir: Path) -> list[Path]:
@@ -56,34 +89,203 @@ def select_pdfs_2024_from_nj509(apps_dir: Path) -> list[Path]:
     return pdf_2024[start_idx:]
 
 
-def process_one_pdf(pdf: Path) -> pd.DataFrame | None:
+def process_one_pdf(
+    pdf: Path,
+    cache: PageCache | None = None,
+    page_jobs: int | None = None,
+    engine: str = DEFAULT_BACKEND,
+    save_text: bool = True,
+    section_cache: SectionCache | None = None,
+    artifacts: ArtifactStore | None = None,
+    trace_dir: Path | None = None,
+    section_budget: float | None = None,
+    data: bytes | None = None,
+) -> tuple[tuple | None, dict]:
     """
-    Run the pipeline on a single PDF and return its wide_df with a __source_pdf column.
-
-    Any exception is caught and logged; returns None in that case so the caller
-    can just skip it.
+    Run the pipeline on a single PDF and return its wide row, encoded with
+    ``WideSchema.encode`` (plain tuples, cheap to pickle back to the parent),
+    plus ``{"n_pages", "engine", "seconds", "digest"}`` for the manifest.
+    Debug artifacts (wide CSV, text dump) go to ``artifacts``; None writes
+    none. With ``trace_dir`` the PDF's stage/section timings are written
+    there as a Chrome trace.
+    Sections over ``section_budget`` seconds are left empty and listed
+    under ``info["timed_out"]``. ``data`` is the PDF's prefetched bytes,
+    parsed instead of reading the file.
+
+    Any exception is caught and logged; the row is None in that case so the
+    caller can just skip it.
     """
+    t = time.perf_counter()
     try:
         print(f"[START] {pdf.name}", flush=True)
-        # Use the PDF's parent dir as out_dir so per-PDF CSV/TXT still get written
-        res = run_all(pdf, out_dir=pdf.parent)
+        res = run_all(
+            pdf,
+            out_dir=pdf.parent,
+            cache=cache,
+            page_jobs=page_jobs,
+            engine=engine,
+            save_text=save_text,
+            section_cache=section_cache,
+            return_frame=False,
+            lean=True,
+            artifacts=artifacts,
+            save_artifacts=artifacts is not None,
+            trace_dir=trace_dir,
+            section_budget=section_budget,
+            data=data,
+        )
     except Exception as exc:
         print(f"[ERROR] processing {pdf.name}: {exc}", file=sys.stderr)
         traceback.print_exc()
-        return None
-
-    wide_df = res.get("wide_df")
-    if wide_df is None or wide_df.empty:
+        return None, {}
+
+    info = {
+        "n_pages": res.get("n_pages"), "engine": res.get("engine"),
+        "seconds": round(time.perf_counter() - t, 3), "timed_out": res.get("timed_out"),
+        "digest": res.get("digest"),
+    }
+    row = res.get("wide_row")
+    if row is None:
         print(
-            f"[WARN] wide_df is empty or missing for {pdf.name}",
+            f"[WARN] wide row is missing for {pdf.name}",
             file=sys.stderr,
         )
-        return None
+        return None, info
+
+    print(f"[OK]   {pdf.name} -> 1 row(s) [{res.get('engine')}]", flush=True)
+    return wide_schema().encode(row), info
+
 
-    wide_copy = wide_df.copy()
-    wide_copy["__source_pdf"] = pdf.name
-    print(f"[OK]   {pdf.name} -> {len(wide_copy)} row(s)", flush=True)
-    return wide_copy
+def process_batch(
+    pdfs: tuple[Path, ...], *args, datas: tuple[bytes | None, ...] | None = None,
+) -> list[tuple[tuple | None, dict]]:
+    """``process_one_pdf(pdf, *args)`` for each of a task's PDFs, in order; ``datas`` are their prefetched bytes."""
+    datas = datas or (None,) * len(pdfs)
+    return [process_one_pdf(pdf, *args, data=data) for pdf, data in zip(pdfs, datas)]
+
+
+def as_completed_bounded(submit, tasks: list[Task], window: int):
+    """
+    ``submit(task) -> Future`` each task, with at most ``window`` of them
+    outstanding, and yield ``(task, future)`` as they finish. Tasks carry
+    their PDFs' bytes when prefetching, so only a window of them is queued.
+    """
+    pending = iter(tasks)
+    running: dict[Future, Task] = {submit(task): task for task in islice(pending, window)}
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for fut in done:
+            task = running.pop(fut)
+            nxt = next(pending, None)
+            if nxt is not None:
+                running[submit(nxt)] = nxt
+            yield task, fut
+
+
+def run_queue(queue: WorkQueue, pdfs: list[Path], args, run_args: tuple) -> list[Path]:
+    """
+    Queue runner: claim ``pdfs`` from the shared ``queue`` one at a time,
+    keep up to ``args.jobs`` of them parsing and publish each one's row (or
+    failure) there, until every PDF has a result or a recorded failure. PDFs
+    other runners hold are waited for, and taken over if their lease goes
+    stale. Returns the PDFs this runner parsed.
+
+    Which PDFs are done is judged by size and mtime, so nothing is read up
+    front; a PDF is hashed by the worker that parses it.
+    """
+    fingerprint = parser_fingerprint()
+    schema = wide_schema()
+    stats = {pdf: pdf.stat() for pdf in pdfs}
+
+    def settled(pdf: Path) -> bool:
+        return queue.settled(pdf.name, stats[pdf], args.engine, fingerprint)
+
+    # longest first, like the local schedule; one PDF per claim
+    costs = estimate_costs(pdfs, lambda pdf: queue.previous(pdf.name))
+    pending = sorted((p for p in pdfs if not settled(p)), key=lambda p: (-costs[p], p.name.lower()))
+    print(
+        f"\nWork queue: {queue.root} ({len(pdfs) - len(pending)} done, {len(pending)} to parse; "
+        f"runner {queue.owner}, {args.jobs} worker process(es))\n"
+    )
+
+    parsed: list[Path] = []
+    pool = worker_pool(
+        args.jobs, args.engine, args.start_method, fingerprints=not args.no_section_cache,
+    )
+    with pool as executor, queue.heartbeat():
+        running: dict = {}
+        while pending or running:
+            for pdf in list(pending):
+                if len(running) >= args.jobs:
+                    break
+                lease = queue.claim(pdf.name)
+                if lease is None:
+                    continue  # another runner has it; check again next round
+                pending.remove(pdf)
+                if settled(pdf):
+                    # finished elsewhere (results are written before leases are released)
+                    queue.release(lease)
+                    continue
+                running[executor.submit(process_one_pdf, pdf, *run_args)] = (pdf, lease)
+
+            if not running:
+                # the rest is claimed by other runners: wait for their results
+                time.sleep(QUEUE_POLL_S)
+                pending = [p for p in pending if not settled(p)]
+                continue
+
+            done, _ = wait(running, timeout=QUEUE_POLL_S, return_when=FIRST_COMPLETED)
+            for fut in done:
+                pdf, lease = running.pop(fut)
+                try:
+                    wire, info = fut.result()
+                except Exception as exc:
+                    print(f"[ERROR] Worker crashed while processing {pdf.name}: {exc}", file=sys.stderr)
+                    traceback.print_exc()
+                    wire, info = None, {"error": repr(exc)}
+
+                entry = {
+                    "pdf": pdf.name, "digest": info.get("digest") or file_digest(pdf), "engine": args.engine,
+                    "engine_used": info.get("engine"), "parser": fingerprint,
+                    "n_pages": info.get("n_pages"), "seconds": info.get("seconds"),
+                    "size": stats[pdf].st_size, "mtime_ns": stats[pdf].st_mtime_ns,
+                }
+                if wire is None:
+                    queue.put_error(pdf.name, {**entry, "error": info.get("error", "no wide row; see the runner's log")})
+                else:
+                    row = schema.decode(wire)
+                    queue.put_result(pdf.name, {
+                        **entry, "timed_out": info.get("timed_out"),
+                        "columns": schema.names(row), "rows": [schema.flat(row)],
+                    })
+                    parsed.append(pdf)
+                queue.release(lease)
+
+    print(f"\nRunner {queue.owner}: parsed {len(parsed)} PDF(s); nothing left to claim.")
+    return parsed
+
+
+def report_profiles(trace_dir: Path | None, regex_dir: Path | None, parsed: list[Path]) -> None:
+    """Summarize the traces of the ``parsed`` PDFs and the regex profile, when enabled."""
+    if trace_dir is not None:
+        traces = [p for p in (trace_path(trace_dir, pdf) for pdf in parsed) if p.exists()]
+        if traces:
+            write_summary(trace_dir, traces)
+
+    if regex_dir is not None:
+        # pool workers wrote their counts when they exited with the pool
+        regex_profile.report(regex_dir)
+
+
+def stored_rows(entry: dict) -> list[WideRow]:
+    """Rebuild a PDF's wide rows from its manifest entry."""
+    schema = wide_schema()
+    return [schema.pack(dict(zip(entry["columns"], values))) for values in entry["rows"]]
+
+
+def sort_key(v) -> str:
+    # same order as the DataFrame path: case-insensitive text of the value
+    return str(v).lower()
 
 
 def main() -> int:
@@ -110,8 +312,207 @@ def main() -> int:
         default=os.cpu_count() or 4,
         help="Number of worker processes to use (default: CPU count).",
     )
+    parser.add_argument(
+        "--start-method",
+        default="auto",
+        choices=START_METHODS,
+        help=(
+            "How worker processes are started (default: auto = forkserver where "
+            "available, else spawn). Workers preload the pipeline and the backend "
+            "before their first PDF."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        default=DEFAULT_BACKEND,
+        choices=[ENGINE_AUTO, *BACKENDS],
+        help=(
+            f"Text extraction backend (default: {DEFAULT_BACKEND}). 'auto' tries cheaper "
+            "installed backends first and escalates when section anchors are missing."
+        ),
+    )
+    parser.add_argument(
+        "--page-jobs",
+        type=int,
+        default=None,
+        help=(
+            "Processes each worker uses to extract the pages of one large PDF "
+            f"(>= {PARALLEL_PAGE_THRESHOLD} pages). Default: CPU count divided by "
+            "--jobs, so the pool never runs more than one process per CPU; 1 disables."
+        ),
+    )
+    parser.add_argument(
+        "--schedule",
+        default="cost",
+        choices=["cost", "name"],
+        help=(
+            "Task order: 'cost' submits the PDFs expected to take longest first (by last "
+            "run's time, else page count, else file size) and batches small ones; "
+            "'name' submits one PDF per task in name order (default: cost)."
+        ),
+    )
+    parser.add_argument(
+        "--min-task-seconds",
+        type=float,
+        default=MIN_TASK_S,
+        help=f"With --schedule cost, batch PDFs estimated below this many seconds (default: {MIN_TASK_S:g}).",
+    )
+    parser.add_argument(
+        "--prefetch-mb",
+        type=int,
+        default=256,
+        help=(
+            "Read upcoming PDFs into memory on background threads while earlier ones "
+            "are parsed, holding at most this many MB ahead; workers then parse the "
+            "bytes instead of opening the files (default: 256; 0 disables)."
+        ),
+    )
+    parser.add_argument(
+        "--section-budget",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help=(
+            "Give up on a section whose parsing takes longer than this and leave it "
+            "empty, so one garbled PDF cannot stall a worker. Each such section is "
+            "reported with a warning and its PDF is parsed again next run "
+            "(default: 0, no budget; e.g. 60)."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"Directory for the page-text and section-result caches (default: {default_cache_dir()}).",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=2048,
+        help="Evict least recently used cached PDFs above this size (default: 2048).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-extract PDF text instead of using the page-text cache.",
+    )
+    parser.add_argument(
+        "--no-section-cache",
+        action="store_true",
+        help="Re-run every section parser instead of reusing results for unchanged sections.",
+    )
+    parser.add_argument(
+        "--no-text",
+        action="store_true",
+        help="Do not write the per-PDF __text_*.txt page dump (pages past the last parsed section are then never extracted).",
+    )
+    parser.add_argument(
+        "--no-artifacts",
+        action="store_true",
+        help="Write no per-PDF debug artifacts (wide CSV, text dump) at all.",
+    )
+    parser.add_argument(
+        "--artifacts-dir",
+        default=None,
+        help="Where debug artifacts and their artifacts.jsonl index go (default: the PDF directory).",
+    )
+    parser.add_argument(
+        "--artifact-compression",
+        default="none",
+        choices=COMPRESSIONS,
+        help="Compress debug artifacts (zstd needs the zstandard package).",
+    )
+    parser.add_argument(
+        "--trace-dir",
+        default=None,
+        help=(
+            "Time every stage and section: write a Chrome-trace/Perfetto JSON per PDF "
+            "to this directory, plus trace_summary.json with the slowest sections."
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help="Manifest of already-parsed PDFs (default: <output-xlsx>.manifest.json).",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Re-parse every PDF even if the manifest says it is unchanged.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help=(
+            "Decide which PDFs are unchanged by hashing their content rather than "
+            "by size and mtime (reads every PDF up front)."
+        ),
+    )
+    parser.add_argument(
+        "--queue",
+        default=None,
+        metavar="DIR",
+        help=(
+            "Share the batch with other runners through this directory (e.g. on NFS): "
+            "claim PDFs via lease files and write per-PDF results there instead of a "
+            "workbook. Start one runner per host; build the workbook with --merge."
+        ),
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="With --queue: parse nothing, build the workbook from the queue's results.",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_S,
+        help=(
+            "With --queue: a claimed PDF whose runner has not renewed its lease for this "
+            f"long is taken over by another runner (default: {DEFAULT_LEASE_S:g})."
+        ),
+    )
+    parser.add_argument(
+        "--writer",
+        default="pandas",
+        choices=["pandas", "stream"],
+        help=(
+            "Workbook writer: 'pandas' (DataFrame.to_excel) or 'stream' "
+            "(xlsxwriter constant_memory, rows flushed one at a time)."
+        ),
+    )
+    parser.add_argument(
+        "--parquet",
+        default=None,
+        metavar="DIR",
+        help=(
+            "Also write a Parquet dataset to DIR, partitioned by the state prefix of "
+            "1a_1b (DIR/state=NJ/...), replacing the partitions already there. Needs pyarrow."
+        ),
+    )
+    parser.add_argument(
+        "--split-narratives",
+        action="store_true",
+        help=(
+            f"Move the long narrative columns to a '{NARRATIVE_SHEET}' sheet keyed "
+            "by CoC number, keeping the main sheet small."
+        ),
+    )
     args = parser.parse_args()
 
+    from importlib.util import find_spec
+    if args.writer == "stream" and find_spec("xlsxwriter") is None:
+        print("ERROR: --writer stream needs the xlsxwriter package", file=sys.stderr)
+        return 1
+    if args.parquet and find_spec("pyarrow") is None:
+        print("ERROR: --parquet needs the pyarrow package", file=sys.stderr)
+        return 1
+    if args.artifact_compression == "zstd" and find_spec("zstandard") is None:
+        print("ERROR: --artifact-compression zstd needs the zstandard package", file=sys.stderr)
+        return 1
+    if args.merge and not args.queue:
+        print("ERROR: --merge needs --queue", file=sys.stderr)
+        return 1
+
     apps_dir = Path(args.apps_dir).expanduser().resolve()
     if not apps_dir.is_dir():
         print(f"ERROR: {apps_dir} is not a directory", file=sys.stderr)
@@ -125,43 +526,207 @@ def main() -> int:
     for p in pdf_paths:
         print(f"  - {p.name}")
 
-    all_wide: list[pd.DataFrame] = []
+    cache = None
+    if not args.no_cache:
+        cache_path = Path(args.cache_dir).expanduser() / "pages.sqlite" if args.cache_dir else None
+        cache = PageCache(cache_path, max_bytes=args.cache_max_mb * 1024 * 1024)
+        print(f"Page-text cache: {cache.path}")
+
+    section_cache = None
+    if not args.no_section_cache:
+        sections_path = Path(args.cache_dir).expanduser() / "sections.sqlite" if args.cache_dir else None
+        section_cache = SectionCache(sections_path)
+        print(f"Section result cache: {section_cache.path}")
+
+    artifacts = None
+    if not args.no_artifacts:
+        artifacts_dir = Path(args.artifacts_dir).expanduser().resolve() if args.artifacts_dir else apps_dir
+        # each worker gets one writer thread, so artifact I/O overlaps parsing
+        artifacts = ArtifactStore(artifacts_dir, args.artifact_compression, background=True)
+        print(f"Debug artifacts: {artifacts_dir}")
+
+    regex_dir = regex_profile.profile_dir()
+    if regex_dir is not None:
+        regex_profile.clear(regex_dir)
+        print(f"Regex profile: {regex_dir} (set by {regex_profile.PROFILE_ENV})")
+
+    trace_dir = None
+    if args.trace_dir:
+        trace_dir = Path(args.trace_dir).expanduser().resolve()
+        print(f"Timing traces: {trace_dir}")
+
+    # every pool worker may shard a large PDF; together they share the CPUs
+    page_jobs = args.page_jobs if args.page_jobs is not None else max(1, (os.cpu_count() or 1) // args.jobs)
+    run_args = (
+        cache, page_jobs, args.engine, not args.no_text,
+        section_cache, artifacts, trace_dir, args.section_budget,
+    )
 
-    # Parallel processing of PDFs
-    print(f"\nUsing {args.jobs} worker process(es).\n")
-    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
-        future_to_pdf = {executor.submit(process_one_pdf, pdf): pdf for pdf in pdf_paths}
+    queue = None
+    if args.queue:
+        queue = WorkQueue(Path(args.queue).expanduser().resolve(), args.lease_seconds)
+        if not args.merge:
+            parsed = run_queue(queue, pdf_paths, args, run_args)
+            report_profiles(trace_dir, regex_dir, parsed)
+            return 0
 
-        for fut in as_completed(future_to_pdf):
-            pdf = future_to_pdf[fut]
-            try:
-                df = fut.result()
-            except Exception as exc:
-                # Should be rare, since process_one_pdf already catches exceptions.
+    out_path = Path(args.output_xlsx).expanduser().resolve()
+    manifest_path = (
+        Path(args.manifest).expanduser() if args.manifest
+        else out_path.with_name(out_path.name + ".manifest.json")
+    )
+    manifest = Manifest(manifest_path)
+    fingerprint = parser_fingerprint()
+
+    # every row lands in one accumulator; the frame/sheet is built once at the end
+    schema = wide_schema()
+    acc = RowAccumulator(schema)
+
+    # Reuse stored rows for PDFs whose size and mtime, engine and parser code are
+    # unchanged. Nothing is read here (unless --verify): a PDF to parse is hashed
+    # by its worker, from the bytes it parses, so slow storage is read once and
+    # in the background.
+    digests: dict[Path, str] = {}
+    stats: dict[Path, os.stat_result] = {}
+    todo: list[Path] = []
+    for pdf in pdf_paths:
+        if queue is not None:
+            # merging: the runners' results stand in for the manifest
+            digests[pdf] = file_digest(pdf)
+            entry = queue.result(pdf.name, digests[pdf], args.engine, fingerprint)
+        else:
+            stats[pdf] = pdf.stat()
+            if args.rebuild:
+                entry = None
+            elif args.verify:
+                entry = manifest.fresh(pdf, file_digest(pdf), args.engine, fingerprint)
+            else:
+                entry = manifest.unchanged(pdf, stats[pdf], args.engine, fingerprint)
+        if entry is not None:
+            for row in stored_rows(entry):
+                acc.add(row, {"__source_pdf": pdf.name})
+            if entry.get("timed_out"):
                 print(
-                    f"[ERROR] Worker crashed while processing {pdf.name}: {exc}",
+                    f"[WARN] {pdf.name}: sections over the time budget: {', '.join(entry['timed_out'])}",
                     file=sys.stderr,
                 )
-                traceback.print_exc()
-                continue
-
-            if df is None or df.empty:
-                continue
-
-            all_wide.append(df)
+        else:
+            todo.append(pdf)
+
+    if queue is not None:
+        print(f"\nWork queue: {queue.root} ({len(pdf_paths) - len(todo)} result(s) merged)")
+        leased = set(queue.live_leases())
+        for pdf in todo:
+            if queue.error(pdf.name, digests[pdf], args.engine, fingerprint):
+                why = "it failed; see the runner's log"
+            elif pdf.name in leased:
+                why = "a runner is still parsing it"
+            else:
+                why = "no runner has parsed it yet"
+            print(f"[WARN] {pdf.name}: left out, {why}", file=sys.stderr)
+        todo = []  # a merge parses nothing
+    else:
+        print(
+            f"\nManifest: {manifest_path} ({len(pdf_paths) - len(todo)} unchanged, "
+            f"{len(todo)} to parse; parser fingerprint {fingerprint})"
+        )
 
-    if not all_wide:
+    # Longest first, small PDFs batched, so every worker stays busy to the end
+    if args.schedule == "cost":
+        costs = estimate_costs(todo, manifest.previous)
+        tasks = plan(costs, args.jobs, args.min_task_seconds)
+        if todo:
+            print(
+                f"Scheduled {len(todo)} PDFs as {len(tasks)} task(s), longest first "
+                f"(~{sum(costs.values()):.0f}s of work estimated)"
+            )
+    else:
+        tasks = [Task((pdf,), 0.0) for pdf in todo]
+
+    if tasks:
+        # Parallel processing of PDFs (a merge, or a run with nothing changed, starts no pool)
+        print(f"\nUsing {args.jobs} worker process(es).\n")
+        pool = worker_pool(
+            args.jobs, args.engine, args.start_method, fingerprints=section_cache is not None,
+        )
+        # PDFs are read ahead in submission order, so their I/O overlaps the parsing
+        prefetch = None
+        if args.prefetch_mb > 0:
+            prefetch = Prefetcher([pdf for task in tasks for pdf in task.pdfs], args.prefetch_mb * 1024 * 1024)
+            print(f"Prefetching PDFs up to {args.prefetch_mb} MB ahead")
+
+        def submit(task: Task) -> Future:
+            datas = tuple(prefetch.take(pdf) for pdf in task.pdfs) if prefetch is not None else None
+            return executor.submit(process_batch, task.pdfs, *run_args, datas=datas)
+
+        with pool as executor, prefetch if prefetch is not None else nullcontext():
+            # each worker has one task running and one queued
+            for task, fut in as_completed_bounded(submit, tasks, 2 * args.jobs):
+                try:
+                    results = fut.result()
+                except Exception as exc:
+                    # Should be rare, since process_one_pdf already catches exceptions.
+                    print(
+                        f"[ERROR] Worker crashed while processing {', '.join(p.name for p in task.pdfs)}: {exc}",
+                        file=sys.stderr,
+                    )
+                    traceback.print_exc()
+                    continue
+
+                for pdf, (wire, info) in zip(task.pdfs, results):
+                    if wire is None:
+                        continue
+
+                    row = schema.decode(wire)
+                    acc.add(row, {"__source_pdf": pdf.name})
+                    if info.get("timed_out"):
+                        # keep the partial row, but parse the PDF again next run
+                        print(
+                            f"[WARN] {pdf.name}: sections over the time budget: {', '.join(info['timed_out'])}",
+                            file=sys.stderr,
+                        )
+                        continue
+                    manifest.record(
+                        pdf, info["digest"], args.engine, fingerprint,
+                        n_pages=info.get("n_pages"), engine_used=info.get("engine"),
+                        columns=schema.names(row), rows=[schema.flat(row)], seconds=info.get("seconds"),
+                        stat=stats[pdf],
+                    )
+
+    if todo:
+        manifest.save()
+
+    report_profiles(trace_dir, regex_dir, todo)
+
+    if not acc:
         print("ERROR: No wide_df rows collected from any PDFs.", file=sys.stderr)
         return 1
 
-    # Stack into one big DataFrame
-    combined = pd.concat(all_wide, ignore_index=True)
+    narrative_cols = NARRATIVE_COLS if args.split_narratives else ()
 
-    # Reorder columns: official col_order_extended first, then extras (like __source_pdf)
-    base_cols = col_order_extended()
-    ordered_cols = [c for c in base_cols if c in combined.columns]
-    extra_cols = [c for c in combined.columns if c not in ordered_cols]
-    combined = combined[ordered_cols + extra_cols]
+    if args.parquet:
+        columns, rows = acc.columns, acc.rows()
+        parquet_dir = Path(args.parquet).expanduser().resolve()
+        n_files = write_parquet_dataset(
+            parquet_dir, columns, rows, narrative_cols=NARRATIVE_COLS, answer_cols=ANSWER_COLS,
+        )
+        print(f"\nWrote {len(rows)} rows to {parquet_dir} ({n_files} file(s))")
+
+    if args.writer == "stream":
+        # rows are reordered below and extras widen the header, so they are
+        # gathered as plain lists first, then streamed out in one pass
+        columns, rows = acc.columns, acc.rows()
+        if len(columns) >= 2:
+            rows.sort(key=lambda r: sort_key(r[1]))
+        n = write_xlsx_stream(out_path, columns, rows, narrative_cols=narrative_cols)
+        print(f"\nWrote {n} rows to {out_path}")
+        return 0
+
+    import pandas as pd
+
+    # One DataFrame for the whole batch, already in schema column order
+    # (col_order_extended first, then extras like __source_pdf)
+    combined = acc.to_frame()
     # ---- NEW: sort by 2nd column of the final sheet ----
     if combined.shape[1] >= 2:
         second_col = combined.columns[1]
@@ -172,8 +737,15 @@ def main() -> int:
         ).reset_index(drop=True)
     # ----------------------------------------------------
 
-    out_path = Path(args.output_xlsx).expanduser().resolve()
-    combined.to_excel(out_path, index=False)
+    if narrative_cols:
+        main_idx, side_idx = split_narratives(
+            list(combined.columns), narrative_cols, key_cols=("1a_1b", "__source_pdf")
+        )
+        with pd.ExcelWriter(out_path) as xw:
+            combined.iloc[:, main_idx].to_excel(xw, sheet_name=MAIN_SHEET, index=False)
+            combined.iloc[:, side_idx].to_excel(xw, sheet_name=NARRATIVE_SHEET, index=False)
+    else:
+        combined.to_excel(out_path, index=False)
     print(f"\nWrote {len(combined)} rows to {out_path}")
 
     return 0
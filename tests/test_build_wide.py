@@ -0,0 +1,17 @@
+import pytest
+
+from astraea_coc.build_wide import ANSWER_COLS, wide_dict, wide_schema
+from astraea_coc.records import TripleRow
+
+
+def test_duplicate_1b1_row_names_table_and_label():
+    rows = [
+        TripleRow(1, "Affordable Housing Developer(s)", "Yes", "No", "Yes"),
+        TripleRow(1, "CDBG/HOME/ESG Entitlement Jurisdiction", "Yes", "No", "Yes"),
+    ]
+    with pytest.raises(ValueError, match=r"df_1b1: duplicate org_type_index 1 .*CDBG"):
+        wide_dict(meta_vals={}, df_1b1=rows)
+
+
+def test_answer_columns_are_wide_columns():
+    assert set(ANSWER_COLS) <= set(wide_schema().columns)
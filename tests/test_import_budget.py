@@ -0,0 +1,19 @@
+import astraea_coc
+from astraea_coc import HEAVY_MODULES, IMPORT_BUDGET_S, import_cost
+
+
+def test_pipeline_import_stays_under_budget():
+    # best of three, so one slow start on a busy machine does not fail the run
+    runs = [import_cost("astraea_coc.pipeline") for _ in range(3)]
+    assert min(dt for dt, _ in runs) < IMPORT_BUDGET_S
+
+
+def test_pipeline_import_loads_no_heavy_module():
+    _, heavy = import_cost("astraea_coc.pipeline")
+    assert heavy == [], f"importing astraea_coc.pipeline pulled in {heavy} (of {HEAVY_MODULES})"
+
+
+def test_package_import_is_lazy():
+    _, heavy = import_cost("astraea_coc")
+    assert heavy == []
+    assert "run_all" in dir(astraea_coc)
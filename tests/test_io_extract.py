@@ -0,0 +1,14 @@
+from astraea_coc.io_extract import anchor_score, default_anchors
+from astraea_coc.specs_2024 import TABLE_SPECS_2024
+
+
+def test_default_anchors_are_the_specs_compiled_patterns():
+    assert all(a is s.start_rx for a, s in zip(default_anchors(), TABLE_SPECS_2024))
+
+
+def test_anchor_score_takes_compiled_or_raw_anchors():
+    pages = ["intro", "1C-1. Coordination\n1. a Yes", "2A-5. Bed Coverage Rate"]
+    assert anchor_score(pages, [[r"^\s*1c[-–]1\."], [r"^\s*2A[-–]5\."], [r"^\s*1D[-–]1\."]]) == 2 / 3
+    score = anchor_score(pages)
+    assert 0 < score < 1
+    assert score == anchor_score(pages, [list(s.start) for s in TABLE_SPECS_2024])
@@ -0,0 +1,37 @@
+import os
+
+from astraea_coc import io_extract
+from astraea_coc.manifest import PARSER_MODULES, Manifest
+
+
+def test_text_extraction_code_is_fingerprinted():
+    assert {"pages.py", "io_extract.py", "backends.py"} <= set(PARSER_MODULES)
+
+
+def test_backend_upgrade_makes_entry_stale(tmp_path, monkeypatch):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    stat = pdf.stat()
+    m = Manifest(tmp_path / "manifest.json")
+    monkeypatch.setattr(io_extract, "engine_versions", lambda engine: f"v1;{engine}=1.0")
+    m.record(pdf, "d", "auto", "p", n_pages=1, engine_used="pdfplumber", columns=[], rows=[], stat=stat)
+    assert m.unchanged(pdf, stat, "auto", "p") is not None
+    assert m.fresh(pdf, "d", "auto", "p") is not None
+
+    monkeypatch.setattr(io_extract, "engine_versions", lambda engine: f"v1;{engine}=2.0")
+    assert m.unchanged(pdf, stat, "auto", "p") is None
+    assert m.fresh(pdf, "d", "auto", "p") is None
+
+
+def test_same_size_and_mtime_rewrite_needs_the_hash(tmp_path):
+    from astraea_coc.page_cache import file_digest
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4 one")
+    stat = pdf.stat()
+    m = Manifest(tmp_path / "manifest.json")
+    m.record(pdf, file_digest(pdf), "auto", "p", n_pages=1, engine_used="pdfplumber", columns=[], rows=[], stat=stat)
+
+    pdf.write_bytes(b"%PDF-1.4 two")
+    os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert m.unchanged(pdf, pdf.stat(), "auto", "p") is not None  # stat alone is fooled
+    assert m.fresh(pdf, file_digest(pdf), "auto", "p") is None    # --verify is not
@@ -0,0 +1,33 @@
+from astraea_coc.custom_blocks import custom_1c7d
+from astraea_coc.pages import Pages
+from astraea_coc.slicer import slice_section_lines
+from astraea_coc.specs_2024 import NARR_SPECS_2024
+
+NARR_2B_3 = next(s for s in NARR_SPECS_2024 if s.key == "narr_2b_3")
+
+
+def test_marker_dump_round_trips_page_bodies():
+    texts = ["first\npage", "", "third page\n"]
+    assert Pages.from_text(Pages(texts).to_text()).texts() == texts
+
+
+def test_stop_header_opening_a_page_keeps_the_section():
+    # Page bodies used to come out of the marker split as "\n" + text, so a
+    # ^\s* stop anchor matched from the page's leading newline, its first line
+    # was empty and the section was cut to nothing.
+    pages = Pages(["2B-3. PIT Count\nthe answer", "2C-1. Reduction in first time homeless"])
+    lines = slice_section_lines(pages, NARR_2B_3.anchor_start_rx, NARR_2B_3.anchor_stop_rx)
+    assert lines == ["the answer"]
+
+
+def test_1c7d_answer_across_a_page_break_drops_the_footer():
+    pages = Pages([
+        "1C-7d. Submitting CoC and PHA Joint Applications for Funding for People\n"
+        "1. Did your CoC coordinate with a PHA(s) to submit a joint application? Yes\n"
+        "2. Enter the type of competitive project your CoC coordinated with a PHA(s).\n"
+        "Joint TH/PH-RRH\n"
+        "FY2024 CoC Application Page 6 10/25/2024",
+        "Applicant: Foo CoC NJ-509\nProject: NJ-509 CoC Registration FY2024\n"
+        "1C-7e. Coordinating with PHA(s) to Apply for or Implement HCV",
+    ])
+    assert custom_1c7d(pages) == {"val_1c7d_1": "Yes", "narr_1c7d_2": "Joint TH/PH-RRH"}
@@ -0,0 +1,22 @@
+import re
+
+from astraea_coc import regex_profile
+from astraea_coc.patterns import compile_re
+
+
+def test_profiling_goes_through_the_package_helpers(tmp_path, monkeypatch):
+    monkeypatch.setattr(regex_profile, "_dir", tmp_path)
+    monkeypatch.setattr(regex_profile, "_STATS", {})
+    rx = compile_re(r"\d+")
+    assert isinstance(rx, regex_profile.ProfiledPattern)
+    assert rx.where.startswith("test_regex_profile:")
+    assert rx.search("ab 12").group(0) == "12"
+    assert [k[-1] for k in regex_profile._STATS] == ["search"]
+
+    # the stdlib is left alone
+    assert isinstance(re.compile(r"\d+"), re.Pattern)
+
+
+def test_plain_patterns_when_profiling_is_off(monkeypatch):
+    monkeypatch.setattr(regex_profile, "_dir", None)
+    assert isinstance(compile_re(r"\d+"), re.Pattern)
@@ -0,0 +1,29 @@
+import functools
+import re
+
+from astraea_coc import parsers
+from astraea_coc.section_cache import fingerprint
+
+
+def test_editing_yesno_token_regex_changes_fingerprint(monkeypatch):
+    before = fingerprint(parsers.parse_numbered_yesno)
+
+    @functools.lru_cache(maxsize=None)
+    def _yesno_tok_rx(allowed):
+        return re.compile(rf"\b({'|'.join(allowed)})\b\s*$", re.IGNORECASE)
+
+    _yesno_tok_rx.__module__ = parsers.__name__  # as if edited in place
+    monkeypatch.setattr(parsers, "_yesno_tok_rx", _yesno_tok_rx)
+    assert fingerprint(parsers.parse_numbered_yesno) != before
+
+
+def test_fingerprint_covers_package_classes():
+    from astraea_coc.records import YesNoRow
+
+    class Other(YesNoRow):
+        __module__ = YesNoRow.__module__
+
+        def extra(self):
+            return 1
+
+    assert fingerprint(YesNoRow) != fingerprint(Other)
@@ -0,0 +1,21 @@
+import re
+
+import pytest
+
+from astraea_coc.budget import SectionBudget, enforceable
+from astraea_coc.pages import Pages
+
+STOP_1D1 = re.compile(r"^\s*1D[-–]1\.", re.IGNORECASE | re.MULTILINE)
+
+
+@pytest.mark.skipif(not enforceable(), reason="no interval timer here")
+def test_section_budget_does_not_interrupt_indexing():
+    # indexing this page takes far longer than the budget; a section that
+    # happens to extend the index must not leave the page half indexed
+    body = "\n".join(f"1C-{i % 90}. x" for i in range(200_000)) + "\n1D-1. last"
+    pages = Pages([body, "2A-1. next"])
+    index = pages.section_index
+
+    hit = SectionBudget(0.001).call(lambda: index.find(("D", 1, ""), STOP_1D1))
+    assert hit["page"] == 1
+    assert ("A", 1, "") in index.keys()
@@ -0,0 +1,70 @@
+import pytest
+
+from astraea_coc.pages import Pages
+from astraea_coc.slicer import slice_section_lines
+from astraea_coc.specs_2024 import NARR_SPECS_2024, TABLE_SPECS_2024
+
+NARR_2B_3 = next(s for s in NARR_SPECS_2024 if s.key == "narr_2b_3")
+
+
+def lazy_pages(texts):
+    return Pages.lazy(len(texts), lambda a, b: list(texts[a:b]), chunk=1)
+
+
+def test_missing_first_stop_does_not_load_trailing_pages():
+    # no "2B-4." in the document: the section must still end at "2C-1." on
+    # the next page without reading the 40 pages after it
+    texts = [
+        "2B-3. PIT Count\nDescribe in the field below how ...\nthe answer",
+        "more answer\n2C-1. Reduction in first time homeless",
+        *(f"appendix page {i}" for i in range(40)),
+    ]
+    pages = lazy_pages(texts)
+    lines = slice_section_lines(
+        pages, NARR_2B_3.anchor_start_rx, NARR_2B_3.anchor_stop_rx, NARR_2B_3.safety_pages_ahead
+    )
+    assert lines[-1] == "more answer"
+    assert pages.n_loaded == 2
+
+
+def test_earliest_stop_alternative_wins():
+    pages = [(1, "2B-3. PIT Count\nanswer\n2C-1. next\nx\n2B-4. later")]
+    lines = slice_section_lines(pages, NARR_2B_3.anchor_start_rx, NARR_2B_3.anchor_stop_rx)
+    assert lines == ["answer"]
+
+
+DF_1C4 = next(s for s in TABLE_SPECS_2024 if s.key == "df_1c4_basic")
+
+
+def test_blank_line_before_stop_keeps_the_rows():
+    # ^\s* lets the stop match start on the blank line above its header
+    pages = Pages(["1C-4. Edu\n1. a b Yes\n2. c d No\n\n1C-5. next"])
+    lines = slice_section_lines(pages, DF_1C4.start_rx, DF_1C4.stop_rx)
+    assert lines == ["1. a b Yes", "2. c d No"]
+
+
+DOC = [
+    "Applicant: Foo CoC\n1B-1. Inclusive Structure and Participation\n1. Affordable Housing Developer(s) Yes Yes Yes\n\n"
+    "1B-1a. Experience Promoting Racial Equity\nanswer one\n",
+    "1B-2. Open Invitation for New Members\nsee 1C-1. below\n\n\n1C-1. Coordination with Federal\n1. a Yes",
+    "1C-2. Coordination\n1. b No\n1C-3. Rural\n\n1C-4. Edu\n1. c Yes\n   \n1C-5. Partnerships\n1. d No",
+    "1C-6. Addressing the Needs of Lesbian\n1. e Yes\n1C-6a. Anti-Discrimination Policy\ntext\n"
+    "ID-7a. Collaboration With Public Health\nmore\n",
+    "1D-1. Preventing People Transitioning\n1. f Yes\n2A-1. HMIS\n2B-3. PIT Count\nx\n2C-1. next",
+]
+
+
+@pytest.mark.parametrize("spec", [*TABLE_SPECS_2024, *NARR_SPECS_2024], ids=lambda s: s.key)
+def test_section_index_matches_a_full_scan(spec):
+    start = getattr(spec, "start_rx", None) or spec.anchor_start_rx
+    stop = getattr(spec, "stop_rx", None) or spec.anchor_stop_rx
+
+    def slice_or_error(pages):
+        try:
+            return slice_section_lines(pages, start, stop, spec.safety_pages_ahead)
+        except AssertionError:
+            return "start not found"
+
+    indexed = slice_or_error(Pages(DOC))
+    scanned = slice_or_error([(i, t) for i, t in enumerate(DOC, start=1)])
+    assert indexed == scanned
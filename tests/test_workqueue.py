@@ -0,0 +1,74 @@
+import multiprocessing as mp
+import os
+import time
+
+import pytest
+
+from astraea_coc.workqueue import WorkQueue
+
+NAMES = [f"app{i:02d}.pdf" for i in range(20)]
+
+
+def _claim_all(root, start, won):
+    queue = WorkQueue(root)
+    start.wait()
+    won.put([name for name in NAMES if queue.claim(name) is not None])
+
+
+@pytest.mark.skipif("fork" not in mp.get_all_start_methods(), reason="needs fork")
+def test_racing_runners_each_claim_a_pdf_once(tmp_path):
+    ctx = mp.get_context("fork")
+    start, won = ctx.Event(), ctx.Queue()
+    runners = [ctx.Process(target=_claim_all, args=(tmp_path, start, won)) for _ in range(2)]
+    for p in runners:
+        p.start()
+    start.set()
+    claimed = won.get(timeout=30) + won.get(timeout=30)
+    for p in runners:
+        p.join(timeout=30)
+    assert sorted(claimed) == NAMES
+
+
+def _age(path, seconds):
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+def test_live_lease_is_not_taken(tmp_path):
+    first, second = WorkQueue(tmp_path, lease_s=60), WorkQueue(tmp_path, lease_s=60)
+    assert first.claim("a.pdf") is not None
+    assert second.claim("a.pdf") is None
+
+
+def test_stale_lease_is_taken_over(tmp_path):
+    first, second = WorkQueue(tmp_path, lease_s=60), WorkQueue(tmp_path, lease_s=60)
+    lease = first.claim("a.pdf")
+    _age(lease.path, 120)
+    assert second.claim("a.pdf") is not None
+    assert second.live_leases() == ["a.pdf"]
+
+
+def test_release_after_takeover_keeps_the_new_owners_lease(tmp_path):
+    first, second = WorkQueue(tmp_path, lease_s=60), WorkQueue(tmp_path, lease_s=60)
+    old = first.claim("a.pdf")
+    _age(old.path, 120)
+    new = second.claim("a.pdf")
+
+    first.release(old)  # the stalled runner finishes late
+    assert new.path.exists()
+    assert first.claim("a.pdf") is None
+    second.release(new)
+    assert not new.path.exists()
+
+
+def test_settled_is_judged_by_size_and_mtime(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4 one")
+    st = pdf.stat()
+    queue = WorkQueue(tmp_path / "q")
+    queue.put_result("a.pdf", {"engine": "auto", "parser": "p", "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+    assert queue.settled("a.pdf", st, "auto", "p")
+    assert not queue.settled("a.pdf", st, "auto", "other parser")
+
+    pdf.write_bytes(b"%PDF-1.4 changed")
+    assert not queue.settled("a.pdf", pdf.stat(), "auto", "p")
@@ -0,0 +1,25 @@
+import pytest
+
+from astraea_coc.writers import write_parquet_dataset
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+COLUMNS = ["1a_1b", "1c_1_1", "1c_5a"]
+
+
+def test_parquet_types_come_from_the_answer_columns(tmp_path):
+    # a batch where 1c_1_1 is blank or has a stray value still writes a dictionary
+    for rows in ([["NJ-509", None, "text"]], [["NJ-509", "Maybe", "Yes"]]):
+        write_parquet_dataset(tmp_path, COLUMNS, rows, answer_cols=["1c_1_1"])
+        schema = ds.dataset(tmp_path, partitioning="hive").schema
+        assert pa.types.is_dictionary(schema.field("1c_1_1").type)
+        assert schema.field("1c_5a").type == pa.string()
+
+
+def test_parquet_rewrite_drops_states_no_longer_in_the_batch(tmp_path):
+    write_parquet_dataset(tmp_path, COLUMNS, [["NJ-509", "Yes", ""], ["PA-500", "No", ""]])
+    write_parquet_dataset(tmp_path, COLUMNS, [["NJ-509", "Yes", ""]])
+    table = ds.dataset(tmp_path, partitioning="hive").to_table()
+    assert table.column("1a_1b").to_pylist() == ["NJ-509"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["state=NJ"]